@@ -23,9 +23,8 @@ from .const import (
     DOMAIN,
     LOGGER,
     PLATFORMS,
-    SERVICE_CALL_EVENT
 )
-from .coordinator import BambuDataUpdateCoordinator
+from .coordinator import BambuDataUpdateCoordinator, get_coordinator_registry
 from .frontend import BambuLabCardRegistration
 from .config_flow import CONFIG_VERSION
 
@@ -51,17 +50,16 @@ class PrintHistoryAPIView(HomeAssistantView):
             total_size_bytes = 0
             
             # Iterate through all coordinators
-            for entry_id in self.hass.data[DOMAIN]:
-                if entry_id == "service_call_future":
-                    continue
-                
-                coordinator = self.hass.data[DOMAIN][entry_id]
+            registry = get_coordinator_registry(self.hass)
+            if serial_filter:
+                coordinator = registry.get_by_serial(serial_filter)
+                coordinators = [coordinator] if coordinator is not None else []
+            else:
+                coordinators = registry.coordinators
+
+            for coordinator in coordinators:
                 printer_info = coordinator.get_model().info
                 
-                # Apply serial filter if provided
-                if serial_filter and printer_info.serial != serial_filter:
-                    continue
-                
                 # Get cached files for this printer
                 try:
                     files = await coordinator.get_cached_files(file_type='prints')
@@ -137,17 +135,16 @@ class VideoAPIView(HomeAssistantView):
             total_size_bytes = 0
            
             # Iterate through all coordinators
-            for entry_id in self.hass.data[DOMAIN]:
-                if entry_id == "service_call_future":
-                    continue
-                
-                coordinator = self.hass.data[DOMAIN][entry_id]
+            registry = get_coordinator_registry(self.hass)
+            if serial_filter:
+                coordinator = registry.get_by_serial(serial_filter)
+                coordinators = [coordinator] if coordinator is not None else []
+            else:
+                coordinators = registry.coordinators
+
+            for coordinator in coordinators:
                 printer_info = coordinator.get_model().info
                 
-                # Apply serial filter if provided
-                if serial_filter and printer_info.serial != serial_filter:
-                    continue
-                
                 # Get cached files for this printer (videos)
                 try:
                     files = await coordinator.get_cached_files(file_type='timelapse')
@@ -215,14 +212,7 @@ class FileCacheFileView(HomeAssistantView):
     async def get(self, request: web.Request, serial: str, filepath: str) -> web.Response:
         try:
             # Find the coordinator for this serial
-            coordinator = None
-            for entry_id in self.hass.data[DOMAIN]:
-                if entry_id == "service_call_future":
-                    continue
-                coord = self.hass.data[DOMAIN][entry_id]
-                if coord.get_model().info.serial == serial:
-                    coordinator = coord
-                    break
+            coordinator = get_coordinator_registry(self.hass).get_by_serial(serial)
             if not coordinator:
                 return web.json_response({"error": f"Printer with serial {serial} not found"}, status=404)
 
@@ -292,14 +282,7 @@ class EnsureCacheFileAPIView(HomeAssistantView):
                 return web.json_response({"error": "Missing required parameters: serial, cache_path, expected_size"}, status=400)
 
             # Find the coordinator for this serial
-            coordinator = None
-            for entry_id in self.hass.data[DOMAIN]:
-                if entry_id == "service_call_future":
-                    continue
-                coord = self.hass.data[DOMAIN][entry_id]
-                if coord.get_model().info.serial == serial:
-                    coordinator = coord
-                    break
+            coordinator = get_coordinator_registry(self.hass).get_by_serial(serial)
             if not coordinator:
                 return web.json_response({"error": f"Printer with serial {serial} not found"}, status=404)
 
@@ -355,6 +338,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    get_coordinator_registry(hass).register(coordinator)
 
     # Register file cache API endpoints
     hass.http.register_view(PrintHistoryAPIView(hass))
@@ -366,14 +350,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         LOGGER.debug(f"handle_service_call: {call.service}")
         data = dict(call.data)
         data['service'] = call.service
-        
-        future = asyncio.Future()
-        call.hass.data[DOMAIN]['service_call_future'] = future
-        hass.bus.fire(SERVICE_CALL_EVENT, data)
 
-        # Wait for the result from the second instance
+        # Route the call straight to the printer that owns the target device or entity.
+        target = get_coordinator_registry(call.hass).get_for_service_call(data)
+        if target is None:
+            LOGGER.error("Service call target is not a Bambu Lab printer or AMS")
+            return None
+
         try:
-            result = await asyncio.wait_for(future, timeout=15)
+            result = await asyncio.wait_for(target.async_handle_service_call(data), timeout=15)
             if (call.service == 'extrude_retract' or
                 call.service == 'get_filament_data'):
                 # Only report result for service calls that return a result to avoid confusion.
@@ -387,14 +372,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except asyncio.TimeoutError:
             LOGGER.error("Service call timed out")
             return None
-        finally:
-            # Clean up the future safely
-            try:
-                if 'service_call_future' in call.hass.data[DOMAIN]:
-                    del call.hass.data[DOMAIN]['service_call_future']
-            except (KeyError, TypeError):
-                # Integration may have been reloaded, ignore cleanup errors
-                pass
 
     # Register the services with Home Assistant
     services = {
@@ -447,6 +424,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Halt the mqtt listener thread
     coordinator: BambuDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     coordinator.shutdown()
+    get_coordinator_registry(hass).unregister(coordinator)
 
     # Delete existing config entry
     del hass.data[DOMAIN][entry.entry_id]
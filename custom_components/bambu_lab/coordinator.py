@@ -33,7 +33,6 @@ from .const import (
     Options,
     OPTION_NAME,
     PLATFORMS,
-    SERVICE_CALL_EVENT,
     FILAMENT_DATA,
 )
 
@@ -56,6 +55,121 @@ from .pybambu.commands import (
     AMS_FILAMENT_DRYING_TEMPLATE,
 )
 
+COORDINATOR_REGISTRY = "coordinator_registry"
+
+
+def get_coordinator_registry(hass: HomeAssistant) -> BambuCoordinatorRegistry:
+    """Return the domain wide coordinator registry, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(COORDINATOR_REGISTRY)
+    if registry is None:
+        registry = BambuCoordinatorRegistry(hass)
+        domain_data[COORDINATOR_REGISTRY] = registry
+    return registry
+
+
+class BambuCoordinatorRegistry:
+    """Index of the loaded printer coordinators by serial, device id and entity id."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._by_serial: Dict[str, BambuDataUpdateCoordinator] = {}
+        # Resolved device/entity id -> printer serial. Cleared whenever the HA registries change.
+        self._device_serials: Dict[str, Optional[str]] = {}
+        self._entity_serials: Dict[str, Optional[str]] = {}
+        self._unsub_listeners = []
+
+    @property
+    def coordinators(self) -> List[BambuDataUpdateCoordinator]:
+        return list(self._by_serial.values())
+
+    def register(self, coordinator: BambuDataUpdateCoordinator) -> None:
+        if not self._unsub_listeners:
+            self._unsub_listeners = [
+                self._hass.bus.async_listen(device_registry.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated),
+                self._hass.bus.async_listen(entity_registry.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated),
+            ]
+        self._by_serial[coordinator.get_model().info.serial] = coordinator
+        self._device_serials.clear()
+        self._entity_serials.clear()
+
+    def unregister(self, coordinator: BambuDataUpdateCoordinator) -> None:
+        serial = coordinator.get_model().info.serial
+        if self._by_serial.get(serial) is coordinator:
+            del self._by_serial[serial]
+        self._device_serials.clear()
+        self._entity_serials.clear()
+        if not self._by_serial:
+            for unsub in self._unsub_listeners:
+                unsub()
+            self._unsub_listeners = []
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        self._device_serials.clear()
+        self._entity_serials.clear()
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        self._entity_serials.clear()
+
+    def get_by_serial(self, serial: str) -> Optional[BambuDataUpdateCoordinator]:
+        return self._by_serial.get(serial)
+
+    def get_by_device_id(self, device_id: str) -> Optional[BambuDataUpdateCoordinator]:
+        if device_id not in self._device_serials:
+            self._device_serials[device_id] = self._resolve_device_serial(device_id)
+        serial = self._device_serials[device_id]
+        return self._by_serial.get(serial) if serial is not None else None
+
+    def get_by_entity_id(self, entity_id: str) -> Optional[BambuDataUpdateCoordinator]:
+        if entity_id not in self._entity_serials:
+            serial = None
+            entity_entry = entity_registry.async_get(self._hass).async_get(entity_id)
+            if entity_entry is not None and entity_entry.device_id is not None:
+                self.get_by_device_id(entity_entry.device_id)
+                serial = self._device_serials[entity_entry.device_id]
+            self._entity_serials[entity_id] = serial
+        serial = self._entity_serials[entity_id]
+        return self._by_serial.get(serial) if serial is not None else None
+
+    def get_for_service_call(self, data: dict) -> Optional[BambuDataUpdateCoordinator]:
+        """Return the coordinator that owns the target of a service call."""
+        device_id = data.get('device_id')
+        entity_id = data.get('entity_id')
+        if device_id is None and entity_id is None:
+            LOGGER.error(f"Invalid data payload, neither device_id or entity_id provided: {data}")
+            return None
+        if device_id is not None and entity_id is not None:
+            LOGGER.error("Either a device_id or an entity_id must be provided for a service call, not both.")
+            return None
+
+        if device_id is not None:
+            return self.get_by_device_id(device_id)
+
+        coordinator = self.get_by_entity_id(entity_id)
+        if coordinator is None:
+            LOGGER.error("Unable to find device from entity")
+        return coordinator
+
+    def _resolve_device_serial(self, device_id: str) -> Optional[str]:
+        # A device is either the printer itself or an AMS / external spool attached via the printer.
+        dev_reg = device_registry.async_get(self._hass)
+        device = dev_reg.async_get(device_id)
+        if device is None:
+            return None
+        for domain, serial in device.identifiers:
+            if domain == DOMAIN and serial in self._by_serial:
+                return serial
+        if device.via_device_id is not None:
+            parent = dev_reg.async_get(device.via_device_id)
+            if parent is not None:
+                for domain, serial in parent.identifiers:
+                    if domain == DOMAIN and serial in self._by_serial:
+                        return serial
+        return None
+
+
 class BambuDataUpdateCoordinator(DataUpdateCoordinator):
     hass: HomeAssistant
     _updatedDevice: bool
@@ -86,7 +200,6 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
-        self._service_call_listener = self.hass.bus.async_listen(SERVICE_CALL_EVENT, self._handle_service_call_event)
 
     @callback
     def _async_shutdown(self, event: Event) -> None:
@@ -100,12 +213,15 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
             return
         
         # The callback comes in on the MQTT thread. Need to jump to the HA main thread to guarantee thread safety.
-        self._eventloop.call_soon_threadsafe(self.event_handler_internal, event)
+        self._eventloop.call_soon_threadsafe(self.event_handler_internal, event, time.monotonic())
 
-    def event_handler_internal(self, event: str):
+    def event_handler_internal(self, event: str, queued_time: float | None = None):
         if self._shutdown:
             # Handle race conditions when the integration is being deleted by re-registering and existing device.
             return
+
+        if queued_time is not None:
+            self.get_model().performance.callback_lag.record(time.monotonic() - queued_time)
         
         if event == "event_printer_bambu_authentication_failed":
             self._report_authentication_issue()
@@ -176,53 +292,12 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         """ Halt the MQTT listener thread """
         self._shutdown = True
         
-        # Remove event listeners
-        self._service_call_listener()
-        
         # Disconnect client - this will handle its own thread cleanup
         self.client.disconnect()
 
     async def _publish(self, msg):
         return self.client.publish(msg)
 
-    def _is_service_call_for_me(self, data: dict):
-        dev_reg = device_registry.async_get(self._hass)
-        hadevice = dev_reg.async_get_device(identifiers={(DOMAIN, self.get_model().info.serial)})
-
-        device_id = data.get('device_id')
-        entity_id = data.get('entity_id')
-        if device_id is None and entity_id is None:
-            LOGGER.error(f"Invalid data payload, neither device_id or entity_id provided: {data}")
-
-        if device_id is not None:
-            if entity_id is not None:
-                LOGGER.error("Either a device_id or an entity_id must be provided for a service call, not both.")
-                return False
-
-            if device_id == hadevice.id:
-                return True
-            ams_device = dev_reg.async_get(device_id)
-            via_device_id = ams_device.via_device_id
-            if via_device_id is not None and (via_device_id == hadevice.id):
-                return True
-            return False
-
-        # Next test if an entity_id is specified and if so, get it's device_id, check if it matches
-        if entity_id is not None:
-            entity_device = self._get_device_from_entity(entity_id)
-            if entity_device is None:
-                LOGGER.error("Unable to find device from entity")
-                return False
-            if entity_device.id == hadevice.id:
-                return True
-            
-            # Next test if a via_device_id is specified and if so, check if it matches
-            via_device_id = entity_device.via_device_id
-            if via_device_id == hadevice.id:
-                return True
-            
-        return False
-
     def _get_device_from_entity(self, entity_id):
         """Get the device associated with a given entity_id."""
         er = entity_registry.async_get(self._hass)
@@ -236,12 +311,8 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
 
         return device_entry  # Returns a DeviceEntry object or None
 
-    async def _handle_service_call_event(self, event: Event) -> Any:
-        data = event.data
-        if not self._is_service_call_for_me(data):
-            # Call is not for this instance.
-            return
-        
+    async def async_handle_service_call(self, data: dict) -> Any:
+        """Handle a service call that the coordinator registry routed to this printer."""
         service_call_name = data['service']
         write_action = True
         if service_call_name == 'get_filament_data':
@@ -253,12 +324,6 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
                 self._report_encryption_enabled_issue(True)
                 return False
 
-        future = self._hass.data[DOMAIN]['service_call_future']
-        if future is None:
-            LOGGER.error("Future is None")
-            future.set_result(False)
-            return
-        
         result = None
         match service_call_name:
             case "skip_objects":
@@ -291,7 +356,7 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         if result is None:
             result = False
 
-        future.set_result(result)
+        return result
         
     def _service_call_skip_objects(self, data: dict):
         command = SKIP_OBJECTS_TEMPLATE
@@ -678,6 +743,7 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
     
     def _update_data(self):
         device = self.get_model()
+        device.performance.coordinator_refreshes.record()
         try:
             self.async_set_updated_data(device)
         except Exception as e:
@@ -689,24 +755,27 @@ class BambuDataUpdateCoordinator(DataUpdateCoordinator):
         dev_reg = device_registry.async_get(self._hass)
         hadevice = dev_reg.async_get_device(identifiers={(DOMAIN, self.get_model().info.serial)})
         device = self.get_model()
-        if device.hms.error_count == 0:
+
+        # Only the HMS codes that changed since the last update are published.
+        for hms_notif in device.hms.added:
             event_data = {
                 "device_id": hadevice.id,
                 "name": self.config_entry.options.get('name', ''),
-                "type": "event_printer_error_cleared",
+                "type": "event_printer_error",
             }
-            LOGGER.debug(f"EVENT: HMS errors cleared: {event_data}")
+            event_data["code"] = f"HMS_{hms_notif.hms_code}"
+            event_data["error"] = hms_notif.hms_error
+            event_data["url"] = hms_notif.wiki_url
+            LOGGER.debug(f"EVENT: HMS errors: {event_data}")
             self._hass.bus.async_fire(f"{DOMAIN}_event", event_data)
-        else:
+
+        if device.hms.error_count == 0 and len(device.hms.cleared) != 0:
             event_data = {
                 "device_id": hadevice.id,
                 "name": self.config_entry.options.get('name', ''),
-                "type": "event_printer_error",
+                "type": "event_printer_error_cleared",
             }
-            event_data["code"] = device.hms.errors[f"1-Code"]
-            event_data["error"] = device.hms.errors[f"1-Error"]
-            event_data["url"] = device.hms.errors[f"1-Wiki"]
-            LOGGER.debug(f"EVENT: HMS errors: {event_data}")
+            LOGGER.debug(f"EVENT: HMS errors cleared: {event_data}")
             self._hass.bus.async_fire(f"{DOMAIN}_event", event_data)
 
     def _update_print_error(self):
@@ -240,6 +240,41 @@ PRINTER_SENSORS: tuple[BambuLabSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda self: self.coordinator.get_model().info.wifi_signal
     ),
+    BambuLabSensorEntityDescription(
+        key="mqtt_message_rate",
+        translation_key="mqtt_message_rate",
+        icon="mdi:speedometer",
+        native_unit_of_measurement="msg/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda self: round(self.coordinator.get_model().performance.mqtt_messages.rate, 2)
+    ),
+    BambuLabSensorEntityDescription(
+        key="print_update_time",
+        translation_key="print_update_time",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda self: self.coordinator.get_model().performance.print_update_time.percentile(95),
+        extra_attributes=lambda self: self.coordinator.get_model().performance.print_update_time.as_dict()
+    ),
+    BambuLabSensorEntityDescription(
+        key="callback_lag",
+        translation_key="callback_lag",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda self: self.coordinator.get_model().performance.callback_lag.percentile(95),
+        extra_attributes=lambda self: self.coordinator.get_model().performance.callback_lag.as_dict()
+    ),
     BambuLabSensorEntityDescription(
         key="bed_temp",
         translation_key="bed_temp",
@@ -13,6 +13,7 @@ from .const import DOMAIN
 from .coordinator import BambuDataUpdateCoordinator
 from .pybambu.commands import PUSH_ALL, GET_VERSION
 from .pybambu.const import Features
+from .pybambu.models import AMSTray
 
 
 TO_REDACT = [
@@ -55,14 +56,18 @@ def serialize_pybambu_object(obj: Any) -> Any:
     if isinstance(obj, (bytes, bytearray)):
         return {"type": "binary_data", "size_bytes": len(obj)}
     
+    # Handle pybambu objects that report their own values (AMS trays live in a shared table)
+    if isinstance(obj, AMSTray):
+        return serialize_pybambu_object(obj.as_dict())
+
     # Handle pybambu objects (classes with __dict__)
     if hasattr(obj, '__dict__'):
         result = {}
         
         # Include all attributes from __dict__
         for key, value in obj.__dict__.items():
-            # Skip client references, binary data, and MQTT data that's captured separately
-            if key not in ['_client', '_bytes', 'push_all_data', 'get_version_data']:
+            # Skip client references, binary data, the raw tray table and data that's captured separately
+            if key not in ['_client', '_bytes', 'trays', 'push_all_data', 'get_version_data', 'performance']:
                 try:
                     if isinstance(value, (bytes, bytearray)):
                         result[key] = {"type": "binary_data", "size_bytes": len(value)}
@@ -93,6 +98,8 @@ async def async_get_config_entry_diagnostics(
     - Raw MQTT data (push_all and get_version) (redacted)
     - Class member state from pybambu objects (redacted)
     - Feature support information
+    - Outbound MQTT command queue metrics
+    - Runtime performance counters
     """
     
     coordinator: BambuDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
@@ -131,4 +138,6 @@ async def async_get_config_entry_diagnostics(
         },
         "device_state": async_redact_data(device_state, TO_REDACT),
         "feature_support": feature_support,
+        "publish_queue": coordinator.client.publish_stats,
+        "performance": device.performance.as_dict(),
     }
@@ -15,6 +15,7 @@ import threading
 import time
 import uuid
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -23,6 +24,7 @@ import paho.mqtt.client as mqtt
 from .bambu_cloud import BambuCloud
 from .const import (
     LOGGER,
+    MQTT_PUBLISH_INTERVAL,
     Features,
 )
 from .models import Device, SlicerSettings
@@ -174,6 +176,9 @@ class ChamberImageThread(threading.Thread):
                                     LOGGER.error("JPEG end magic bytes missing.")
                                 else:
                                     # Content is as expected. Send it.
+                                    performance = self._client._device.performance
+                                    performance.camera_decode_time.record(time.perf_counter() - frame_start)
+                                    performance.camera_frames.record()
                                     self._client.on_jpeg_received(img)
 
                                 # Reset buffer
@@ -187,6 +192,7 @@ class ChamberImageThread(threading.Thread):
                             # Reset connect_attempts now we know the connect was successful.
                             connect_attempts = 0
                             img = bytearray()
+                            frame_start = time.perf_counter()
                             payload_size = int.from_bytes(dr[0:3], byteorder='little')
 
                         elif len(dr) == 0:
@@ -281,6 +287,211 @@ class MqttThread(threading.Thread):
 
         LOGGER.debug("MQTT listener thread exited.")
 
+# Outbound command priorities. Lower values are sent first.
+PUBLISH_PRIORITY_SAFETY = 0
+PUBLISH_PRIORITY_NORMAL = 1
+PUBLISH_PRIORITY_BACKGROUND = 2
+
+SAFETY_COMMANDS = { "stop", "pause" }
+# Commands that change the print state. They don't commute, so they are always sent in the order
+# they were queued: a safety command takes any of these that are queued before it along with it.
+PRINT_CONTROL_COMMANDS = { ("print", "project_file"), ("print", "resume"), ("print", "pause"), ("print", "stop") }
+# Keyed by topic as well, so that only the status push requests count as background work and a
+# user started "start" on any other topic is sent at the normal priority.
+BACKGROUND_COMMANDS = { ("pushing", "pushall"), ("pushing", "start"), ("info", "get_version") }
+
+# gcode_line commands that only ever set a value, keyed by the gcode and the parameter that
+# selects what is being set. A newer one supersedes a queued older one for the same target.
+# A missing selector targets the default (the active nozzle, the part fan).
+COALESCABLE_GCODE = {
+    "M104": "T",  # Nozzle temperature, per nozzle
+    "M140": None, # Bed temperature
+    "M106": "P",  # Fan speed, per fan
+}
+
+# Fields every command carries, anything else in a print_option command is an option it sets.
+COMMAND_BASE_FIELDS = { "command", "sequence_id" }
+
+
+def get_command_priority(msg: dict) -> int:
+    """Returns the send priority for an outbound MQTT command"""
+    for topic, node in msg.items():
+        if isinstance(node, dict):
+            command = node.get("command")
+            if command in SAFETY_COMMANDS:
+                return PUBLISH_PRIORITY_SAFETY
+            if (topic, command) in BACKGROUND_COMMANDS:
+                return PUBLISH_PRIORITY_BACKGROUND
+    return PUBLISH_PRIORITY_NORMAL
+
+
+def is_print_control_command(msg: dict) -> bool:
+    """Returns True if an outbound MQTT command changes the print state"""
+    return any(
+        isinstance(node, dict) and (topic, node.get("command")) in PRINT_CONTROL_COMMANDS
+        for topic, node in msg.items())
+
+
+def get_command_coalesce_key(msg: dict) -> tuple | None:
+    """
+    Returns a key identifying what an outbound MQTT command sets, or None if the command
+    must always be sent. Only the latest queued command for any given key is sent.
+    """
+    if len(msg) != 1:
+        return None
+    topic, node = next(iter(msg.items()))
+    if not isinstance(node, dict):
+        return None
+
+    command = node.get("command")
+    if command in ("pushall", "get_version", "print_speed", "set_airduct"):
+        return (topic, command)
+    if command == "print_option":
+        # Each option is set independently, only the same set of options supersedes.
+        return (topic, command, tuple(sorted(node.keys() - COMMAND_BASE_FIELDS)))
+    if command == "ledctrl":
+        return (topic, command, node.get("led_node"))
+    if command == "gcode_line":
+        lines = node.get("param", "").strip().split("\n")
+        if len(lines) != 1:
+            return None
+        words = lines[0].split()
+        if len(words) == 0 or words[0] not in COALESCABLE_GCODE:
+            return None
+        selector = COALESCABLE_GCODE[words[0]]
+        if selector is None:
+            return (topic, command, words[0])
+        for word in words[1:]:
+            if word.startswith(selector):
+                return (topic, command, words[0], word)
+        return (topic, command, words[0], None)
+    return None
+
+
+class PublishThread(threading.Thread):
+    """Paces outbound MQTT commands so bursts don't overwhelm the printer firmware."""
+
+    def __init__(self, client, interval: float = MQTT_PUBLISH_INTERVAL):
+        self._client = client
+        self._interval = interval
+        self._condition = threading.Condition()
+        self._queues = [deque(), deque(), deque()]
+        self._pending = {}
+        self._stopped = False
+        self._last_sent = 0
+
+        self.sent = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.last_latency = 0
+        self.max_latency = 0
+        self._total_latency = 0
+        super().__init__()
+        self.daemon = True
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    @property
+    def depth(self) -> int:
+        return sum(len(queue) for queue in self._queues)
+
+    @property
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "depth": self.depth,
+                "max_depth": self.max_depth,
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "last_latency_ms": round(self.last_latency * 1000, 1),
+                "max_latency_ms": round(self.max_latency * 1000, 1),
+                "average_latency_ms": round(self._total_latency * 1000 / self.sent, 1) if self.sent else 0,
+            }
+
+    def enqueue(self, msg: dict) -> bool:
+        """Queues a command, returns False if it can't be sent as the publisher has stopped."""
+        # Serialize immediately as callers reuse and mutate the command templates.
+        payload = json.dumps(msg)
+        key = get_command_coalesce_key(msg)
+        priority = get_command_priority(msg)
+        control = is_print_control_command(msg)
+        with self._condition:
+            if self._stopped or self._client.client is None:
+                return False
+
+            entry = self._pending.get(key) if key is not None else None
+            if entry is not None:
+                # Keep the original queue position and time but send the newest value.
+                entry[2] = payload
+                self.coalesced += 1
+                return True
+
+            if priority == PUBLISH_PRIORITY_SAFETY:
+                # Print control commands queued earlier go first, a stop must not be overtaken
+                # by the print start it is meant to stop, nor a pause by an earlier resume.
+                normal = self._queues[PUBLISH_PRIORITY_NORMAL]
+                earlier = [queued for queued in normal if queued[3]]
+                if len(earlier) != 0:
+                    self._queues[PUBLISH_PRIORITY_NORMAL] = deque(queued for queued in normal if not queued[3])
+                    self._queues[PUBLISH_PRIORITY_SAFETY].extend(earlier)
+
+            # [coalesce key, queued time, payload, print control, sent without pacing]
+            entry = [key, time.monotonic(), payload, control, priority == PUBLISH_PRIORITY_SAFETY]
+            self._queues[priority].append(entry)
+            if key is not None:
+                self._pending[key] = entry
+            self.max_depth = max(self.max_depth, self.depth)
+            self._condition.notify()
+            return True
+
+    def _next_entry(self):
+        """Waits for and pops the next entry to send. Must be called with the condition held."""
+        while not self._stopped:
+            if self.depth == 0:
+                self._condition.wait()
+                continue
+            wait_time = self._last_sent + self._interval - time.monotonic()
+            safety = self._queues[PUBLISH_PRIORITY_SAFETY]
+            if wait_time > 0 and (len(safety) == 0 or not safety[0][4]):
+                # Safety commands are never held back by the pacing interval.
+                self._condition.wait(wait_time)
+                continue
+            for queue in self._queues:
+                if len(queue) != 0:
+                    entry = queue.popleft()
+                    if entry[0] is not None:
+                        del self._pending[entry[0]]
+                    return entry
+        return None
+
+    def run(self):
+        self.setName(f"{self._client._device.info.device_type}-Publish-{threading.get_native_id()}")
+        LOGGER.debug("Publish thread started.")
+
+        while True:
+            with self._condition:
+                entry = self._next_entry()
+                if entry is None:
+                    break
+                self._last_sent = time.monotonic()
+                latency = self._last_sent - entry[1]
+                self.sent += 1
+                self.last_latency = latency
+                self.max_latency = max(self.max_latency, latency)
+                self._total_latency += latency
+
+            try:
+                self._client._send(entry[2])
+            except Exception as e:
+                LOGGER.error("A publish thread exception occurred:")
+                LOGGER.error(f"Exception. Type: {type(e)} Args: {e}")
+
+        LOGGER.debug("Publish thread exited.")
+
+
 class ImplicitFTP_TLS(ftplib.FTP_TLS):
     """
     FTP_TLS subclass that automatically wraps sockets in SSL to support implicit FTPS.
@@ -338,6 +549,7 @@ class BambuClient:
     _watchdog = None
     _camera = None
     _mqtt = None
+    _publisher = None
     _usage_hours: float = 0
     _test_mode: bool = False
     _mock: bool = False
@@ -466,6 +678,10 @@ class BambuClient:
         else:
             self.client.username_pw_set(self._username, password=self._auth_token)
 
+        LOGGER.debug("Starting publish thread")
+        self._publisher = PublishThread(self)
+        self._publisher.start()
+
         LOGGER.debug("Starting MQTT listener thread")
         self._mqtt = MqttThread(self)
         self._mqtt.start()
@@ -586,10 +802,13 @@ class BambuClient:
                     self._on_disconnect()
             else:
                 self._device.info.set_online(True)
+                self._device.performance.mqtt_messages.record()
                 if self._watchdog is not None:
                     self._watchdog.received_data()
                 if json_data.get("print"):
+                    start_time = time.perf_counter()
                     self._device.print_update(data=json_data.get("print"))
+                    self._device.performance.print_update_time.record(time.perf_counter() - start_time)
                     if json_data.get("print").get("msg", 0) == 0:
                         self._refreshed= False
                 elif json_data.get("info") and json_data.get("info").get("command") == "get_version":
@@ -608,16 +827,36 @@ class BambuClient:
         self.client.subscribe(f"device/{self._serial}/report")
 
     def publish(self, msg):
-        """Publish a custom message"""
-        result = self.client.publish(f"device/{self._serial}/request", json.dumps(msg))
+        """
+        Publish a custom message. Returns False if it could not be sent, with the publish thread
+        running True means it was queued and a failed send is logged when it is sent.
+        """
+        if self._publisher is not None:
+            return self._publisher.enqueue(msg)
+        return self._send(json.dumps(msg))
+
+    def _send(self, payload: str):
+        client = self.client
+        if client is None:
+            # We have been shut down. Drop anything still queued.
+            return False
+
+        result = client.publish(f"device/{self._serial}/request", payload)
         status = result.rc
         if status == 0:
-            LOGGER.debug(f"Sent {msg} to topic device/{self._serial}/request")
+            LOGGER.debug(f"Sent {payload} to topic device/{self._serial}/request")
             return True
 
         LOGGER.error(f"Failed to send message to topic device/{self._serial}/request")
         return False
 
+    @property
+    def publish_stats(self) -> dict:
+        """Return outbound command queue depth and latency metrics"""
+        if self._publisher is None:
+            return {}
+        return self._publisher.stats
+
     async def refresh(self):
         """Force refresh data"""
         LOGGER.debug("Force Refresh: Getting Version Info")
@@ -647,6 +886,12 @@ class BambuClient:
             self._watchdog.stop()
             self._watchdog.join(timeout=5)
             self._watchdog = None
+
+        if self._publisher is not None:
+            LOGGER.debug("Stopping publish thread")
+            self._publisher.stop()
+            self._publisher.join(timeout=5)
+            self._publisher = None
             
         if self._camera is not None:
             LOGGER.debug("Stopping camera thread")
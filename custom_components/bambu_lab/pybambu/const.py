@@ -243,4 +243,7 @@ BAMBU_URL = {
     BambuUrl.TASKS: 'https://api.bambulab.com/v1/user-service/my/tasks',
     BambuUrl.PROJECTS: 'https://api.bambulab.com/v1/iot-service/api/user/project',
     BambuUrl.PREFERENCE: 'https://api.bambulab.com/v1/design-user-service/my/preference',
-}
\ No newline at end of file
+}
+# Minimum spacing in seconds between outbound MQTT commands. The printer firmware is known to
+# drop or lag commands that arrive in a rapid burst.
+MQTT_PUBLISH_INTERVAL = 0.25
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ftplib
+import functools
 import json
 import math
 import os
@@ -94,6 +95,7 @@ class Device:
         self.cover_image = CoverImage(client = client)
         self.pick_image = PickImage(client = client)
         self.print_fun = PrintFun(client = client)
+        self.performance = PerformanceCounters()
 
     def print_update(self, data) -> bool:
         send_event = False
@@ -877,8 +879,8 @@ class PrintJob:
         self.print_error = 0
         self.print_weight = 0
         self.ams_mapping = []
-        self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
-        self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
+        self._ams_print_weights = [0.0] * AMS_TRAY_SLOTS # Indexed by global tray slot, see get_ams_tray_slot()
+        self._ams_print_lengths = [0.0] * AMS_TRAY_SLOTS # Indexed by global tray slot, see get_ams_tray_slot()
         self.print_length = 0
         self.print_bed_type = "unknown"
         self.file_type_icon = "mdi:file"
@@ -1247,6 +1249,7 @@ class PrintJob:
             end_time = time.time()
             download_time = end_time - start_time
             download_speed = size / download_time if download_time > 0 else 0
+            self._client._device.performance.record_ftp_transfer(size, download_time)
             
             LOGGER.debug(f"Successfully downloaded '{file_path}' to cache. Time: {download_time:.0f}s, Speed: {download_speed/1024:.0f} KB/s")
             return str(cache_file_path)
@@ -1649,8 +1652,8 @@ class PrintJob:
                 plate_filament_count = len(plate.findall('filament'))
 
                 # Reset filament data
-                self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
-                self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
+                self._ams_print_weights = [0.0] * AMS_TRAY_SLOTS # Indexed by global tray slot, see get_ams_tray_slot()
+                self._ams_print_lengths = [0.0] * AMS_TRAY_SLOTS # Indexed by global tray slot, see get_ams_tray_slot()
 
                 for metadata in plate:
                     if (metadata.get('key') == 'index'):
@@ -1819,8 +1822,8 @@ class PrintJob:
             return
 
         self._task_data = self._client.bambu_cloud.get_latest_task_for_printer(self._client._serial)
-        self._ams_print_weights = [0.0] * 136 # TODO: Convert to a dict in the future?
-        self._ams_print_lengths = [0.0] * 136 # TODO: Convert to a dict in the future?
+        self._ams_print_weights = [0.0] * AMS_TRAY_SLOTS # Indexed by global tray slot, see get_ams_tray_slot()
+        self._ams_print_lengths = [0.0] * AMS_TRAY_SLOTS # Indexed by global tray slot, see get_ams_tray_slot()
         if self._task_data is None:
             LOGGER.debug("No bambu cloud task data found for printer.")
             self._client._device.cover_image.set_image(None)
@@ -1985,6 +1988,7 @@ class PrintJob:
                         "total": file_size,
                     })
 
+            start_time = time.monotonic()
             with open(local_path, 'rb') as f:
                 try:
                     ftp.storbinary_no_unwrap(f'STOR {remote_path}', f, blocksize=chunk_size, callback=internal_progress_callback)
@@ -2002,6 +2006,7 @@ class PrintJob:
                 raise ValueError(f"FTP upload verification failed: remote={remote_size}, local={file_size}")
 
             LOGGER.debug(f"FTP upload: Upload completed successfully")
+            self._client._device.performance.record_ftp_transfer(file_size, time.monotonic() - start_time)
 
             return True
 
@@ -2357,6 +2362,84 @@ class Info:
         return flow_prefix + _MATERIALS.get(material_code, "unknown")
 
 
+# Trays are stored in flat per-field arrays indexed by their global tray slot. Regular AMS units use
+# slots ams_index * 4 + tray_index. Single tray AMS HT units have indices 128-135 and use that as their slot,
+# matching the global tray ids the printer uses in ams_mapping.
+AMS_TRAY_SLOTS = 136
+
+AMS_TRAY_DEFAULTS = {
+    "empty": True,
+    "idx": "",
+    "name": "",
+    "type": "",
+    "sub_brands": "",
+    "color": "00000000",  # RRGGBBAA
+    "nozzle_temp_min": 0,
+    "nozzle_temp_max": 0,
+    "remain": -1,
+    "k": 0,
+    "tag_uid": "",
+    "tray_uuid": "",
+    "tray_weight": 0,
+    "active": False,
+}
+
+# Tray payload key -> tray field
+AMS_TRAY_PAYLOAD_FIELDS = {
+    "tray_info_idx": "idx",
+    "tray_type": "type",
+    "tray_sub_brands": "sub_brands",
+    "tray_color": "color",
+    "nozzle_temp_min": "nozzle_temp_min",
+    "nozzle_temp_max": "nozzle_temp_max",
+    "remain": "remain",
+    "tag_uid": "tag_uid",
+    "tray_uuid": "tray_uuid",
+    "k": "k",
+    "tray_weight": "tray_weight",
+}
+
+
+# Values an empty tray is reset to.
+AMS_TRAY_EMPTY_VALUES = {
+    "type": "Empty",
+    "sub_brands": "",
+    "remain": -1,
+    "tag_uid": "",
+    "tray_uuid": "",
+    "k": 0,
+    "tray_weight": 0,
+}
+
+
+def get_ams_tray_slot(ams_index: int, tray_index: int) -> int:
+    if ams_index >= 128:
+        return ams_index
+    return ams_index * 4 + tray_index
+
+
+class AMSTrayTable:
+    """Structure of arrays holding the state of every tray"""
+
+    def __init__(self, size: int):
+        self.size = 0
+        self.columns = { field: [] for field in AMS_TRAY_DEFAULTS }
+        self.reserve(size)
+
+    def reserve(self, size: int):
+        if size > self.size:
+            for field, default in AMS_TRAY_DEFAULTS.items():
+                self.columns[field].extend([default] * (size - self.size))
+            self.size = size
+
+    def set(self, slot: int, field: str, value) -> bool:
+        column = self.columns[field]
+        if column[slot] == value:
+            return False
+        column[slot] = value
+        return True
+
+
 @dataclass
 class AMSInstance:
     """Return all AMS instance related info"""
@@ -2373,18 +2456,12 @@ class AMSInstance:
     temperature: int = 0
     remaining_drying_time: int = 0
 
-    def __init__(self, client, model, index):
+    def __init__(self, client, model, index, table: AMSTrayTable):
         self.model = model
         self.index = index
-        if index >= 128:
-            self.tray = [None]
-            self.tray[0] = AMSTray(client)
-        else:
-            self.tray = [None] * 4
-            self.tray[0] = AMSTray(client)
-            self.tray[1] = AMSTray(client)
-            self.tray[2] = AMSTray(client)
-            self.tray[3] = AMSTray(client)
+        tray_count = 1 if index >= 128 else 4
+        table.reserve(get_ams_tray_slot(index, tray_count - 1) + 1)
+        self.tray = [AMSTray(client, table, get_ams_tray_slot(index, tray_id)) for tray_id in range(tray_count)]
 
     @property
     def active(self):
@@ -2405,6 +2482,7 @@ class AMSList:
         self._nozzle_tray_index = { 0: 0, 1: 0, 15: 0}
         self._nozzle_ams_index = { 0: 0, 1: 0, 15: 0}
         self.data = {}
+        self.trays = AMSTrayTable(AMS_TRAY_SLOTS)
 
     @property
     def active_ams_index(self):
@@ -2434,8 +2512,6 @@ class AMSList:
             return self.data[self.active_ams_index].tray[self.active_tray_index]
 
     def info_update(self, data):
-        old_data = f"{self.__dict__}"
-
         # First determine if this the version info data or the json payload data. We use the version info to determine
         # what devices to add to humidity_index assistant and add all the sensors as entities. And then then json payload data
         # to populate the values for all those entities.
@@ -2487,7 +2563,7 @@ class AMSList:
                     # May get data before info so create entries if necessary
                     if index not in self.data:
                         data_changed = True
-                        self.data[index] = AMSInstance(self._client, model, index)
+                        self.data[index] = AMSInstance(self._client, model, index, self.trays)
                     if self.data[index].model != model:
                         data_changed = True
                         self.data[index].model = model
@@ -2504,10 +2580,9 @@ class AMSList:
                 self._first_initialization_done = True
                 data_changed = True
 
-        data_changed = data_changed or (old_data != f"{self.__dict__}")
-
     def print_update(self, data) -> bool:
-        old_data = f"{self.__dict__}"
+        old_nozzle_indices = (dict(self._nozzle_ams_index), dict(self._nozzle_tray_index))
+        data_changed = False
 
         # AMS json payload is of the form:
         # "ams": {
@@ -2604,128 +2679,134 @@ class AMSList:
                 index = int(ams['id'])
                 # May get data before info so create entry if necessary
                 if index not in self.data:
-                    self.data[index] = AMSInstance(self._client, "Unknown", index)
+                    self.data[index] = AMSInstance(self._client, "Unknown", index, self.trays)
+                    data_changed = True
+                instance = self.data[index]
 
                 # Sometimes when the AMS is being powered on it may send bogus humidity and temperature values.
                 # So ignore these values if they are out of a sensible range.
 
                 humidity_index = int(ams['humidity'])
-                if 1 <= humidity_index <= 5 and self.data[index].humidity_index != humidity_index:
-                    self.data[index].humidity_index = humidity_index
+                if 1 <= humidity_index <= 5 and instance.humidity_index != humidity_index:
+                    instance.humidity_index = humidity_index
+                    data_changed = True
 
                 humidity = int(ams.get("humidity_raw", 0))
-                if 1 <= humidity <= 100 and self.data[index].humidity != humidity:
-                    self.data[index].humidity = humidity
+                if 1 <= humidity <= 100 and instance.humidity != humidity:
+                    instance.humidity = humidity
+                    data_changed = True
 
                 temperature = float(ams['temp'])
-                if 0 <= temperature <= 100 and self.data[index].temperature != temperature:
-                    self.data[index].temperature = temperature
+                if 0 <= temperature <= 100 and instance.temperature != temperature:
+                    instance.temperature = temperature
+                    data_changed = True
 
-                if self.data[index].remaining_drying_time != int(ams.get('dry_time', 0)):
-                    self.data[index].remaining_drying_time = int(ams.get('dry_time', 0))
+                remaining_drying_time = int(ams.get('dry_time', 0))
+                if instance.remaining_drying_time != remaining_drying_time:
+                    instance.remaining_drying_time = remaining_drying_time
+                    data_changed = True
 
+                # Partial pushes only list the trays that changed so only those are patched.
                 tray_list = ams['tray']
                 for tray in tray_list:
                     tray_id = int(tray['id'])
-                    self.data[index].tray[tray_id].print_update(tray)
+                    if instance.tray[tray_id].print_update(tray):
+                        data_changed = True
 
         # Now that we've populated the AMS/Trays (if this is first time through), we must
         # loop over all the ams and trays to set active states correctly.
+        active_ams_index = self.active_ams_index
+        active_tray_index = self.active_tray_index
         for index in self.data:
-            self.data[index]._active = (index == self.active_ams_index)
+            active = (index == active_ams_index)
+            if self.data[index]._active != active:
+                self.data[index]._active = active
+                data_changed = True
             for tray_id, tray in enumerate(self.data[index].tray):
-                active_tray = (index == self.active_ams_index) and (self.active_tray_index == tray_id)
-                tray.active = active_tray
+                tray_active = active and (active_tray_index == tray_id)
+                if tray.active != tray_active:
+                    tray.active = tray_active
+                    data_changed = True
 
-        data_changed = (old_data != f"{self.__dict__}")
+        data_changed = data_changed or (old_nozzle_indices != (self._nozzle_ams_index, self._nozzle_tray_index))
         return data_changed
 
-@dataclass
+
+def _tray_field(field: str):
+    """A tray attribute backed by its column in the tray table"""
+    def getter(self):
+        return self._table.columns[field][self._slot]
+
+    def setter(self, value):
+        self._table.set(self._slot, field, value)
+
+    return property(getter, setter)
+
+
 class AMSTray:
     """Return all AMS tray related info"""
-    empty: bool
-    idx: int
-    name: str
-    type: str
-    sub_brands: str
-    color: str
-    nozzle_temp_min: int
-    nozzle_temp_max: int
-    _remain: int
-    k: float
-    tag_uid: str
-    tray_uuid: str
-    tray_weight: int
-    _active: bool
-
-    def __init__(self, client):
+    empty = _tray_field("empty")
+    idx = _tray_field("idx")
+    name = _tray_field("name")
+    type = _tray_field("type")
+    sub_brands = _tray_field("sub_brands")
+    color = _tray_field("color")
+    nozzle_temp_min = _tray_field("nozzle_temp_min")
+    nozzle_temp_max = _tray_field("nozzle_temp_max")
+    _remain = _tray_field("remain")
+    k = _tray_field("k")
+    tag_uid = _tray_field("tag_uid")
+    tray_uuid = _tray_field("tray_uuid")
+    tray_weight = _tray_field("tray_weight")
+    active = _tray_field("active")
+
+    def __init__(self, client, table: AMSTrayTable | None = None, slot: int = 0):
         self._client = client
-        self.empty = True
-        self.idx = ""
-        self.name = ""
-        self.type = ""
-        self.sub_brands = ""
-        self.color = "00000000"  # RRGGBBAA
-        self.nozzle_temp_min = 0
-        self.nozzle_temp_max = 0
-        self._remain = -1
-        self.k = 0
-        self.tag_uid = ""
-        self.tray_uuid = ""
-        self.tray_weight = 0
-        self._active = False
+        # Trays that don't belong to an AMS (the external spools) get their own single entry table.
+        self._table = table if table is not None else AMSTrayTable(1)
+        self._slot = slot
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={column[self._slot]!r}" for field, column in self._table.columns.items())
+        return f"{type(self).__name__}({fields})"
 
     @property
     def remain(self) -> int:
         return self._remain
 
-    @property
-    def active(self) -> bool:
-        return self._active
-    
-    @active.setter
-    def active(self, value: bool):
-        self._active = value
-
     @property
     def remain_enabled(self) -> bool:
         return self._client._device.supports_feature(Features.AMS_FILAMENT_REMAINING) and self._client._device.home_flag.ams_calibrate_remaining
 
+    def as_dict(self) -> dict:
+        """The tray's values, the table only holds the raw columns shared by all trays"""
+        return { field: getattr(self, field) for field in AMS_TRAY_DEFAULTS }
+
     def print_update(self, data) -> bool:
-        old_data = f"{self.__dict__}"
+        table = self._table
+        slot = self._slot
+        changed = False
+
+        for key, field in AMS_TRAY_PAYLOAD_FIELDS.items():
+            if key in data and table.set(slot, field, data[key]):
+                changed = True
 
-        self.idx = data.get('tray_info_idx', self.idx)
-        self.name = get_filament_name(self.idx, self._client.slicer_settings.custom_filaments)
-        self.type = data.get('tray_type', self.type)
-        self.sub_brands = data.get('tray_sub_brands', self.sub_brands)
-        self.color = data.get('tray_color', self.color)
-        self.nozzle_temp_min = data.get('nozzle_temp_min', self.nozzle_temp_min)
-        self.nozzle_temp_max = data.get('nozzle_temp_max', self.nozzle_temp_max)
-        self._remain = data.get('remain', self._remain)
-        self.tag_uid = data.get('tag_uid', self.tag_uid)
-        self.tray_uuid = data.get('tray_uuid', self.tray_uuid)
-        self.k = data.get('k', self.k)
-        self.tray_weight = data.get('tray_weight', self.tray_weight)
-        if self.name == "unknown":
+        name = get_filament_name(self.idx, self._client.slicer_settings.custom_filaments)
+        if name == "unknown":
             # Fallback to the type if the name is unknown
-            self.name = self.type
-        self.empty = (self.name == "Empty")
-        if self.name == "Empty":
-            self.type = "Empty"
-            self.sub_brands = ""
-            self._remain = -1
-            self.tag_uid = ""
-            self.tray_uuid = ""
-            self.k = 0
-            self.tray_weight = 0
+            name = self.type
+        values = { "name": name, "empty": name == "Empty" }
+        if name == "Empty":
+            values.update(AMS_TRAY_EMPTY_VALUES)
+        for field, value in values.items():
+            if table.set(slot, field, value):
+                changed = True
 
-        return (old_data != f"{self.__dict__}")
+        return changed
 
 
-@dataclass
 class ExternalSpool(AMSTray):
     """Return the virtual tray related info"""
-    _index: int
 
     def __init__(self, client, index: int):
         super().__init__(client)
@@ -2900,6 +2981,13 @@ class HMSList:
         self._client = client
         self._errors = {}
         self._errors["Count"] = 0
+        # Notifications are keyed by their raw (attr, code) pair and kept across pushes so the
+        # code string, wiki url and localized text are only resolved once per active error.
+        self._notifications: dict[tuple[int, int], HMSNotification] = {}
+        self._active_keys: tuple = ()
+        self._text_context = None
+        self._added: list[HMSNotification] = []
+        self._cleared: list[HMSNotification] = []
         
     def print_update(self, data) -> bool:
         # Example payload:
@@ -2915,20 +3003,42 @@ class HMSList:
 
         if 'hms' in data.keys():
             hmsList = data.get('hms', [])
-            errors = {}
+            keys = tuple((int(hms['attr']), int(hms['code'])) for hms in hmsList)
+
+            # The error text depends on the printer type and language so a change to either
+            # invalidates every cached notification.
+            text_context = (self._client._device.info.device_type, self._client.user_language)
+            stale = text_context != self._text_context
+            if not stale and keys == self._active_keys:
+                return False
+            self._text_context = text_context
+
+            previous = self._notifications
+            notifications = {}
+            for key in keys:
+                if key in notifications:
+                    continue
+                hms_notif = None if stale else previous.get(key)
+                if hms_notif is None:
+                    hms_notif = HMSNotification(
+                        device_type=text_context[0],
+                        user_language=text_context[1],
+                        attr=key[0],
+                        code=key[1]
+                        )
+                    if not hms_notif.hms_error:
+                        LOGGER.debug("Skipping HMS notification with code %s (no text).", hms_notif.hms_code)
+                notifications[key] = hms_notif
+
+            self._added = [notif for key, notif in notifications.items() if key not in previous and notif.hms_error]
+            self._cleared = [notif for key, notif in previous.items() if key not in notifications and notif.hms_error]
+            self._notifications = notifications
+            self._active_keys = keys
 
+            errors = {}
             index: int = 0
-            for hms in hmsList:
-                attr = int(hms['attr'])
-                code = int(hms['code'])
-                hms_notif = HMSNotification(
-                    device_type=self._client._device.info.device_type,
-                    user_language=self._client.user_language,
-                    attr=attr,
-                    code=code
-                    )
+            for hms_notif in notifications.values():
                 if not hms_notif.hms_error:
-                    LOGGER.debug("Skipping HMS notification with code %s (no text).", hms_notif.hms_code)
                     continue  # skip invalid entries
 
                 index = index + 1
@@ -2960,6 +3070,16 @@ class HMSList:
     def error_count(self) -> int:
         return self._errors["Count"]
 
+    @property
+    def added(self) -> list[HMSNotification]:
+        """HMS notifications that appeared in the most recent change to the list"""
+        return self._added
+
+    @property
+    def cleared(self) -> list[HMSNotification]:
+        """HMS notifications that went away in the most recent change to the list"""
+        return self._cleared
+
 @dataclass
 class PrintError:
     """Return all print_error related info"""
@@ -2967,6 +3087,7 @@ class PrintError:
 
     def __init__(self, client):
         self._error = None
+        self._key = (0, None, None)
         self._client = client
         
     def print_update(self, data) -> bool:
@@ -2977,15 +3098,22 @@ class PrintError:
         # 'Unable to feed filament into the extruder. This could be due to entangled filament or a stuck spool. If not, please check if the AMS PTFE tube is connected.'
 
         if 'print_error' in data.keys():
-            errors = None
             code = data.get('print_error')
+            device_type = self._client._device.info.device_type
+            key = (code, device_type, self._client.user_language)
+            if key == self._key:
+                # Same raw code, device type and language as the last push so the looked up text can't have changed.
+                return False
+            self._key = key
+
+            errors = None
             if code != 0:
                 code = f'0{int(code):x}'
                 code = code[slice(0,4,1)] + "_" + code[slice(4,8,1)]
                 code = code.upper()
                 errors = {}
                 errors[f"code"] = code
-                error_text = get_print_error_text(code, self._client._device.info.device_type, self._client.user_language)
+                error_text = get_print_error_text(code, device_type, self._client.user_language)
                 errors[f"error"] = error_text
                 if error_text == 'unknown':
                     # Suppress unknown errors as they get fired when there are no errors.
@@ -3027,18 +3155,18 @@ class HMSNotification:
     def module(self):
         return get_HMS_module(self.attr)
 
-    @property
+    @functools.cached_property
     def hms_code(self):
         if self.attr > 0 and self.code > 0:
             return f'{int(self.attr / 0x10000):0>4X}_{self.attr & 0xFFFF:0>4X}_{int(self.code / 0x10000):0>4X}_{self.code & 0xFFFF:0>4X}' # 0300_0100_0001_0007
         return ""
     
-    @property
+    @functools.cached_property
     def hms_error(self) -> str:
         error_text = get_HMS_error_text(self.hms_code, self._device_type, self._user_language)
         return error_text
 
-    @property
+    @functools.cached_property
     def wiki_url(self):
         if self.attr > 0 and self.code > 0:
             # Only English wiki content seems to exist
@@ -3361,4 +3489,103 @@ class Extruder:
 
     @property
     def active_nozzle_index(self):
-        return self._active_nozzle_index
\ No newline at end of file
+        return self._active_nozzle_index
+
+class RateCounter:
+    """Counts events over a sliding window of whole seconds"""
+
+    def __init__(self, window: int = 60):
+        self._window = window
+        self._seconds = [-1] * window
+        self._counts = [0] * window
+        self.total = 0
+
+    def record(self, count: int = 1):
+        second = int(time.monotonic())
+        slot = second % self._window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += count
+        self.total += count
+
+    @property
+    def rate(self) -> float:
+        """Average events per second over the window"""
+        oldest = int(time.monotonic()) - self._window
+        return sum(count for second, count in zip(self._seconds, self._counts) if second > oldest) / self._window
+
+
+class Histogram:
+    """Fixed size histogram of durations with power of two microsecond buckets"""
+    BUCKETS = 24 # Last bucket holds everything from ~4.2s up.
+
+    def __init__(self):
+        self._counts = [0] * Histogram.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self._counts[min(int(seconds * 1000000).bit_length(), Histogram.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """Upper bound in milliseconds of the bucket holding the given percentile"""
+        if self.count == 0:
+            return 0
+        target = self.count * percent / 100
+        cumulative = 0
+        for bucket, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= target:
+                return (1 << bucket) / 1000
+        return self.max * 1000
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class PerformanceCounters:
+    """Runtime counters for the printer connection. Cheap enough to always be on."""
+
+    def __init__(self):
+        self.mqtt_messages = RateCounter()
+        self.print_update_time = Histogram()
+        self.coordinator_refreshes = RateCounter()
+        self.callback_lag = Histogram()
+        self.camera_frames = RateCounter()
+        self.camera_decode_time = Histogram()
+        self.ftp_bytes = 0
+        self.ftp_seconds = 0.0
+        self.ftp_last_throughput = 0.0
+
+    def record_ftp_transfer(self, size: int, seconds: float):
+        self.ftp_bytes += size
+        self.ftp_seconds += seconds
+        if seconds > 0:
+            self.ftp_last_throughput = size / seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "mqtt_messages_per_second": round(self.mqtt_messages.rate, 2),
+            "mqtt_messages_total": self.mqtt_messages.total,
+            "print_update_time": self.print_update_time.as_dict(),
+            "coordinator_refreshes_per_second": round(self.coordinator_refreshes.rate, 2),
+            "callback_lag": self.callback_lag.as_dict(),
+            "camera_frames_per_second": round(self.camera_frames.rate, 2),
+            "camera_decode_time": self.camera_decode_time.as_dict(),
+            "ftp_bytes_total": self.ftp_bytes,
+            "ftp_average_kbps": round(self.ftp_bytes / self.ftp_seconds / 1024, 1) if self.ftp_seconds > 0 else 0,
+            "ftp_last_kbps": round(self.ftp_last_throughput / 1024, 1),
+        }
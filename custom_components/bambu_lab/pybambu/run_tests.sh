@@ -31,6 +31,7 @@ suite = unittest.defaultTestLoader.loadTestsFromNames(
 		"pybambu.tests.test_models",
 		"pybambu.tests.test_error_lookup",
 		"pybambu.tests.test_utils",
+		"pybambu.tests.test_bambu_client",
 	]
 )
 result = unittest.TextTestRunner(verbosity=2).run(suite)
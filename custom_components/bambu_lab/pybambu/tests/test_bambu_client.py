@@ -0,0 +1,150 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import time
+
+# Add the parent directory to the Python path to find pybambu
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pybambu.bambu_client import (
+    PublishThread,
+    get_command_coalesce_key,
+    get_command_priority,
+    PUBLISH_PRIORITY_BACKGROUND,
+    PUBLISH_PRIORITY_NORMAL,
+    PUBLISH_PRIORITY_SAFETY,
+)
+from pybambu.commands import (
+    PAUSE, PUSH_ALL, RESUME, START_PUSH, STOP, CHAMBER_LIGHT_ON, CHAMBER_LIGHT_OFF, BUZZER_SET_SILENT,
+    PROMPT_SOUND_ENABLE, PROMPT_SOUND_DISABLE,
+)
+from pybambu.const import FansEnum, TempEnum
+from pybambu.utils import fan_percentage_to_gcode, set_temperature_to_gcode
+
+def gcode(line: str) -> dict:
+    return {"print": {"sequence_id": "0", "command": "gcode_line", "param": line}}
+
+class TestCommandClassification(unittest.TestCase):
+
+    def test_priority(self):
+        self.assertEqual(PUBLISH_PRIORITY_SAFETY, get_command_priority(STOP))
+        self.assertEqual(PUBLISH_PRIORITY_SAFETY, get_command_priority(PAUSE))
+        self.assertEqual(PUBLISH_PRIORITY_BACKGROUND, get_command_priority(PUSH_ALL))
+        self.assertEqual(PUBLISH_PRIORITY_NORMAL, get_command_priority(CHAMBER_LIGHT_ON))
+
+    def test_coalesce_key(self):
+        """Commands setting the same thing share a key; unrelated or multi-line commands don't coalesce."""
+        part = get_command_coalesce_key(gcode("M106 P1 S255\n"))
+        self.assertEqual(part, get_command_coalesce_key(gcode("M106 P1 S0\n")))
+        self.assertNotEqual(part, get_command_coalesce_key(gcode("M106 P2 S0\n")))
+        self.assertEqual(get_command_coalesce_key(CHAMBER_LIGHT_ON), get_command_coalesce_key(CHAMBER_LIGHT_OFF))
+        self.assertIsNotNone(get_command_coalesce_key(PUSH_ALL))
+        self.assertIsNone(get_command_coalesce_key(gcode("G28\n")))
+        self.assertIsNone(get_command_coalesce_key(gcode("M106 P1 S255\nM106 P2 S255\n")))
+        self.assertIsNone(get_command_coalesce_key(STOP))
+        self.assertIsNone(get_command_coalesce_key(BUZZER_SET_SILENT))
+
+    def test_coalesce_key_targets(self):
+        """Commands that set different targets never share a key."""
+        self.assertNotEqual(
+            get_command_coalesce_key(gcode("M104 T0 S220\n")),
+            get_command_coalesce_key(gcode("M104 T1 S220\n")))
+        self.assertEqual(
+            get_command_coalesce_key(gcode("M104 T1 S220\n")),
+            get_command_coalesce_key(gcode("M104 T1 S0\n")))
+        self.assertEqual(
+            get_command_coalesce_key(PROMPT_SOUND_ENABLE),
+            get_command_coalesce_key(PROMPT_SOUND_DISABLE))
+        auto_recovery = {"print": {"sequence_id": "0", "command": "print_option", "auto_recovery": True}}
+        self.assertNotEqual(
+            get_command_coalesce_key(auto_recovery),
+            get_command_coalesce_key(PROMPT_SOUND_ENABLE))
+
+    def test_print_start_priority(self):
+        """Only the status push start is background work."""
+        self.assertEqual(PUBLISH_PRIORITY_BACKGROUND, get_command_priority(START_PUSH))
+        self.assertEqual(
+            PUBLISH_PRIORITY_NORMAL,
+            get_command_priority({"print": {"sequence_id": "0", "command": "start"}}))
+
+class TestPublishThread(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.publisher = PublishThread(self.client, interval=0)
+
+    def drain(self) -> list:
+        payloads = []
+        while self.publisher.depth != 0:
+            payloads.append(self.publisher._next_entry()[2])
+        return payloads
+
+    def test_coalesces_superseded_commands(self):
+        """Only the last queued fan speed is sent, and templates mutated after queueing are unaffected."""
+        self.publisher.enqueue(fan_percentage_to_gcode(FansEnum.PART_COOLING, 10))
+        self.publisher.enqueue(set_temperature_to_gcode(TempEnum.HEATBED, 60))
+        self.publisher.enqueue(fan_percentage_to_gcode(FansEnum.PART_COOLING, 100))
+
+        payloads = self.drain()
+        self.assertEqual(2, len(payloads))
+        self.assertIn("M106 P1 S255", payloads[0])
+        self.assertIn("M140 S60", payloads[1])
+        self.assertEqual(1, self.publisher.coalesced)
+
+    def test_safety_commands_jump_the_queue(self):
+        self.publisher.enqueue(PUSH_ALL)
+        self.publisher.enqueue(CHAMBER_LIGHT_ON)
+        self.publisher.enqueue(STOP)
+
+        payloads = self.drain()
+        self.assertIn('"stop"', payloads[0])
+        self.assertIn('"ledctrl"', payloads[1])
+        self.assertIn('"pushall"', payloads[2])
+        self.assertEqual(3, self.publisher.max_depth)
+
+    def test_safety_commands_keep_print_control_order(self):
+        """A stop is never sent before the print start queued ahead of it, nor a pause before a resume."""
+        project_file = {"print": {"sequence_id": "0", "command": "project_file", "url": "file:///sdcard/a.3mf"}}
+        self.publisher.enqueue(CHAMBER_LIGHT_ON)
+        self.publisher.enqueue(project_file)
+        self.publisher.enqueue(STOP)
+
+        payloads = self.drain()
+        self.assertIn('"project_file"', payloads[0])
+        self.assertIn('"stop"', payloads[1])
+        self.assertIn('"ledctrl"', payloads[2])
+
+        self.publisher.enqueue(RESUME)
+        self.publisher.enqueue(PAUSE)
+        payloads = self.drain()
+        self.assertIn('"resume"', payloads[0])
+        self.assertIn('"pause"', payloads[1])
+
+    def test_enqueue_result(self):
+        """Commands can't be queued once the publisher stopped or the client is gone."""
+        self.assertTrue(self.publisher.enqueue(PUSH_ALL))
+        self.assertTrue(self.publisher.enqueue(PUSH_ALL))
+        self.client.client = None
+        self.assertFalse(self.publisher.enqueue(STOP))
+        self.client.client = MagicMock()
+        self.publisher.stop()
+        self.assertFalse(self.publisher.enqueue(STOP))
+
+    def test_sends_in_background(self):
+        self.publisher.start()
+        self.publisher.enqueue(PAUSE)
+        self.publisher.enqueue(PUSH_ALL)
+        for _ in range(50):
+            if self.client._send.call_count == 2:
+                break
+            time.sleep(0.1)
+        self.publisher.stop()
+        self.publisher.join(timeout=5)
+
+        self.assertEqual(2, self.client._send.call_count)
+        self.assertEqual(2, self.publisher.stats["sent"])
+        self.assertEqual(0, self.publisher.stats["depth"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,7 @@ import json
 # Add the parent directory to the Python path to find pybambu
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from pybambu.models import PrintJob, Info, AMSList, Extruder, HMSList, PrintError, Temperature
+from pybambu.models import PrintJob, Info, AMSList, Extruder, HMSList, PrintError, Temperature, Histogram, PerformanceCounters, AMS_TRAY_DEFAULTS
 from pybambu.const import Printers
 
 class TestPrintJob(unittest.TestCase):
@@ -206,6 +206,37 @@ class TestAMSList(unittest.TestCase):
         self.assertEqual(tray0.color, "000000FF")
         self.assertEqual(tray0.tray_weight, "1000")
 
+    def test_partial_tray_update(self):
+        """A partial push only patches the trays it mentions."""
+        data = self.test_data['push_all']
+
+        self.client._device.extruder.print_update(data)
+        self.assertTrue(self.ams_list.print_update(data))
+
+        # Re-sending identical data is not a change.
+        self.assertFalse(self.ams_list.print_update(data))
+
+        tray1 = self.ams_list.data[0].tray[1]
+        tray2 = self.ams_list.data[0].tray[2].as_dict()
+        partial = {"ams": {"ams": [{"id": "0", "humidity": "4", "temp": "0.0", "tray": [{"id": "1", "remain": 42}]}]}}
+        self.assertTrue(self.ams_list.print_update(partial))
+        self.assertEqual(42, tray1.remain)
+        self.assertEqual(tray2, self.ams_list.data[0].tray[2].as_dict())
+
+    def test_tray_as_dict(self):
+        """Every tray field is reported with the tray's own values."""
+        data = self.test_data['push_all']
+
+        self.client._device.extruder.print_update(data)
+        self.ams_list.print_update(data)
+        tray = self.ams_list.data[0].tray[1]
+        values = tray.as_dict()
+        self.assertEqual(set(AMS_TRAY_DEFAULTS), set(values))
+        self.assertEqual(tray.remain, values["remain"])
+        self.assertEqual(tray.type, values["type"])
+        self.assertEqual(tray.color, values["color"])
+        self.assertNotEqual(values, self.ams_list.data[0].tray[0].as_dict())
+
 class TestHms(unittest.TestCase):
 
     def setUp(self):
@@ -350,6 +381,68 @@ class TestHms(unittest.TestCase):
         self.assertEqual(0, self.hms.error_count)
         self.assertDictEqual({"Count": 0}, self.hms.errors)
 
+    def test_error_unchanged(self):
+        """When the same HMS list is pushed again, nothing is re-processed or re-sent."""
+        self.client._device.info.device_type = Printers.X1
+        self.client.user_language = "en"
+        data = {"hms": [{"attr": 50331904, "code": 65543}]}
+
+        result = self.hms.print_update(data)
+        self.assertTrue(result)
+        notif = self.hms.added[0]
+
+        result = self.hms.print_update(data)
+        self.assertFalse(result)
+        self.client.callback.assert_called_once_with("event_printer_error")
+        self.assertIs(notif, self.hms.added[0])
+
+    def test_error_deltas(self):
+        """Only newly raised and cleared HMS codes are reported as deltas."""
+        self.client._device.info.device_type = Printers.A1
+        self.client.user_language = "en"
+
+        self.hms.print_update({"hms": [{"attr": 50331904, "code": 65543}]})
+        self.assertEqual(["0300_0100_0001_0007"], [n.hms_code for n in self.hms.added])
+        self.assertEqual([], self.hms.cleared)
+        first = self.hms.added[0]
+
+        self.hms.print_update({"hms": [{"attr": 50331904, "code": 65543}, {"attr": 134180864, "code": 131075}]})
+        self.assertEqual(["07FF_7000_0002_0003"], [n.hms_code for n in self.hms.added])
+        self.assertEqual([], self.hms.cleared)
+        self.assertEqual(2, self.hms.error_count)
+
+        self.hms.print_update({"hms": [{"attr": 134180864, "code": 131075}]})
+        self.assertEqual([], self.hms.added)
+        self.assertEqual([first], self.hms.cleared)
+        self.assertEqual("HMS_07FF_7000_0002_0003", self.hms.errors["1-Code"])
+
+class TestPerformanceCounters(unittest.TestCase):
+
+    def test_histogram_percentiles(self):
+        """Percentiles report the upper bound of the bucket the sample falls in."""
+        histogram = Histogram()
+        for _ in range(99):
+            histogram.record(0.0005)  # 500us -> 512us bucket
+        histogram.record(0.1)         # 100ms -> 131.072ms bucket
+
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(0.512, histogram.percentile(50))
+        self.assertEqual(0.512, histogram.percentile(99))
+        self.assertEqual(131.072, histogram.percentile(100))
+        self.assertEqual(100.0, histogram.as_dict()["max_ms"])
+
+    def test_summary(self):
+        performance = PerformanceCounters()
+        performance.mqtt_messages.record()
+        performance.mqtt_messages.record()
+        performance.record_ftp_transfer(2048, 2.0)
+
+        summary = performance.as_dict()
+        self.assertEqual(2, summary["mqtt_messages_total"])
+        self.assertGreater(summary["mqtt_messages_per_second"], 0)
+        self.assertEqual(1.0, summary["ftp_average_kbps"])
+        self.assertEqual(0, summary["print_update_time"]["count"])
+
 class TestPrintErrors(unittest.TestCase):
 
     def setUp(self):
@@ -418,6 +511,22 @@ class TestPrintErrors(unittest.TestCase):
         self.assertFalse(self.print_error.on)
         self.assertIsNone(self.print_error.error)
 
+    def test_error_language_changed(self):
+        """The error text is looked up again when the user language changes."""
+        self.client._device.info.device_type = Printers.X1
+        self.client.user_language = "en"
+
+        data = {"print_error": 50348041}  # 0x03004009
+        self.print_error.print_update(data)
+        english = self.print_error.error["error"]
+
+        self.client.user_language = "es"
+        self.print_error.print_update(data)
+
+        self.assertEqual(self.print_error.error["error"], "Homing Ejes XY Fallido")
+        self.assertNotEqual(self.print_error.error["error"], english)
+        self.client.callback.assert_has_calls([call("event_print_error")] * 2)
+
 
 class TestH2D(unittest.TestCase):
     def setUp(self):
@@ -25,6 +25,7 @@ from .const import DOMAIN, HACS_SYSTEM_ID, MINIMUM_HA_VERSION, STARTUP
 from .data_client import HacsDataClient
 from .enums import HacsDisabledReason, HacsStage, LovelaceMode
 from .frontend import async_register_frontend
+from .utils.content_cache import HacsContentCache
 from .utils.data import HacsData
 from .utils.queue_manager import QueueManager
 from .utils.version import version_left_higher_or_equal_then_right
@@ -68,9 +69,11 @@ async def _async_initialize_integration(
     hacs.hass = hass
     hacs.queue = QueueManager(hass=hass)
     hacs.data = HacsData(hacs=hacs)
+    hacs.content_cache = HacsContentCache(hass=hass, session=clientsession)
     hacs.data_client = HacsDataClient(
         session=clientsession,
         client_name=f"HACS/{integration.version}",
+        hass=hass,
     )
     hacs.system.running = True
     hacs.session = clientsession
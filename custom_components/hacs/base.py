@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, KeysView, ValuesView
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
-import gzip
+from functools import partial
 import math
 import os
 import pathlib
-import shutil
 from typing import TYPE_CHECKING, Any
 
 from aiogithubapi import (
@@ -23,6 +22,7 @@ from aiogithubapi import (
     GitHubRatelimitException,
 )
 from aiogithubapi.objects.repository import AIOGitHubAPIRepository
+from aiohttp import ClientError
 from aiohttp.client import ClientSession, ClientTimeout
 from awesomeversion import AwesomeVersion
 from homeassistant.components.persistent_notification import (
@@ -33,11 +33,23 @@ from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
+from homeassistant.helpers.issue_registry import (
+    IssueSeverity,
+    async_create_issue,
+    async_delete_issue,
+)
 from homeassistant.loader import Integration
 from homeassistant.util import dt
 
-from .const import DOMAIN, TV, URL_BASE
+from .const import (
+    DOMAIN,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_ATTEMPTS,
+    DOWNLOAD_SEGMENT_MIN_SIZE,
+    DOWNLOAD_WRITE_BUFFER_SIZE,
+    GRAPHQL_BATCH_SIZE,
+    TV,
+)
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
@@ -47,6 +59,7 @@ from .enums import (
     HacsGitHubRepo,
     HacsStage,
     LovelaceMode,
+    QueuePriority,
 )
 from .exceptions import (
     AddonRepositoryException,
@@ -56,19 +69,34 @@ from .exceptions import (
     HacsNotModifiedException,
     HacsRepositoryArchivedException,
     HacsRepositoryExistException,
+    HacsRetryableDownloadException,
     HomeAssistantCoreRepositoryException,
 )
 from .repositories import REPOSITORY_CLASSES
 from .repositories.base import HACS_MANIFEST_KEYS_TO_EXPORT, REPOSITORY_KEYS_TO_EXPORT
+from .utils.content_cache import HacsContentCache
+from .utils.download import (
+    content_length,
+    content_range,
+    download_retry_delay,
+    file_sha256,
+    identity_headers,
+    open_for_range,
+    preallocate_file,
+    remove_file,
+    retry_after,
+    write_chunks,
+)
 from .utils.file_system import async_exists
+from .utils.github_graphql_query import build_repositories_status_query
 from .utils.json import json_loads
 from .utils.logger import LOGGER
+from .utils.plugin_files import HacsPluginFilesView, precompress_file
 from .utils.queue_manager import QueueManager
 from .utils.store import async_load_from_store, async_save_to_store
-from .utils.workarounds import async_register_static_path
 
 if TYPE_CHECKING:
-    from .repositories.base import HacsRepository
+    from .repositories.base import HacsRepository, RepositoryRecord
     from .utils.data import HacsData
     from .validate.manager import ValidationManager
 
@@ -197,11 +225,27 @@ class HacsRepositories:
     """HACS Repositories."""
 
     _default_repositories: set[str] = field(default_factory=set)
-    _repositories: set[HacsRepository] = field(default_factory=set)
+    _repositories: dict[HacsRepository, None] = field(default_factory=dict)
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
 
+    # Secondary indexes, dicts are used as ordered sets so views can be handed out
+    _custom_repositories: dict[HacsRepository, None] = field(default_factory=dict)
+    _downloaded_repositories: dict[HacsRepository, None] = field(default_factory=dict)
+    _repositories_by_category: dict[str, dict[HacsRepository, None]] = field(
+        default_factory=dict
+    )
+    _downloaded_repositories_by_category: dict[str, dict[HacsRepository, None]] = field(
+        default_factory=dict
+    )
+    _repositories_by_domain: dict[str, dict[HacsRepository, None]] = field(default_factory=dict)
+
+    # Compact records for repositories that are not downloaded, see RepositoryRecord
+    _records_by_id: dict[str, RepositoryRecord] = field(default_factory=dict)
+    _record_ids_by_full_name: dict[str, str] = field(default_factory=dict)
+    _record_factory: Callable[[RepositoryRecord], HacsRepository] | None = None
+
     @property
     def list_all(self) -> list[HacsRepository]:
         """Return a list of repositories."""
@@ -215,14 +259,156 @@ class HacsRepositories:
     @property
     def list_downloaded(self) -> list[HacsRepository]:
         """Return a list of downloaded repositories."""
-        return [repo for repo in self._repositories if repo.data.installed]
+        return list(self._downloaded_repositories)
+
+    @property
+    def view_all(self) -> KeysView[HacsRepository]:
+        """Return a view of all repositories, do not register or unregister while iterating."""
+        return self._repositories.keys()
+
+    @property
+    def view_downloaded(self) -> KeysView[HacsRepository]:
+        """Return a view of downloaded repositories."""
+        return self._downloaded_repositories.keys()
+
+    @property
+    def view_custom(self) -> KeysView[HacsRepository]:
+        """Return a view of repositories that are not in the default list."""
+        return self._custom_repositories.keys()
+
+    @property
+    def view_records(self) -> ValuesView[RepositoryRecord]:
+        """Return a view of the records of repositories without a repository object."""
+        return self._records_by_id.values()
+
+    def view_category(
+        self, category: str, *, downloaded: bool = False
+    ) -> KeysView[HacsRepository]:
+        """Return a view of the (downloaded) repositories in a category."""
+        index = (
+            self._downloaded_repositories_by_category
+            if downloaded
+            else self._repositories_by_category
+        )
+        return index.get(category, {}).keys()
 
     def category_downloaded(self, category: HacsCategory) -> bool:
         """Check if a given category has been downloaded."""
-        for repository in self.list_downloaded:
-            if repository.data.category == category:
-                return True
-        return False
+        return bool(self._downloaded_repositories_by_category.get(category))
+
+    def _index(self, repository: HacsRepository) -> None:
+        """Add a repository to the secondary indexes."""
+        data = repository.data
+        self._repositories_by_category.setdefault(data.category, {})[repository] = None
+        if data.domain:
+            self._repositories_by_domain.setdefault(data.domain, {})[repository] = None
+        if data.installed:
+            self._downloaded_repositories[repository] = None
+            self._downloaded_repositories_by_category.setdefault(data.category, {})[
+                repository
+            ] = None
+        if not self.is_default(str(data.id)):
+            self._custom_repositories[repository] = None
+        data.set_index_listener(partial(self._reindex, repository))
+
+    def _unindex(self, repository: HacsRepository) -> None:
+        """Remove a repository from the secondary indexes."""
+        data = repository.data
+        data.set_index_listener(None)
+        self._custom_repositories.pop(repository, None)
+        self._downloaded_repositories.pop(repository, None)
+        for index, key in (
+            (self._repositories_by_category, data.category),
+            (self._downloaded_repositories_by_category, data.category),
+            (self._repositories_by_domain, data.domain),
+        ):
+            if (entries := index.get(key)) is not None:
+                entries.pop(repository, None)
+                if not entries:
+                    index.pop(key)
+
+    def _reindex(self, repository: HacsRepository, key: str, previous: Any, value: Any) -> None:
+        """Update the secondary indexes when an indexed attribute of a repository changes."""
+        data = repository.data
+        if key == "category":
+            self._move_in_index(self._repositories_by_category, repository, previous, value)
+            if data.installed:
+                self._move_in_index(
+                    self._downloaded_repositories_by_category, repository, previous, value
+                )
+        elif key == "domain":
+            self._move_in_index(self._repositories_by_domain, repository, previous, value)
+        elif key == "installed":
+            if value:
+                self._downloaded_repositories[repository] = None
+                self._move_in_index(
+                    self._downloaded_repositories_by_category, repository, None, data.category
+                )
+            else:
+                self._downloaded_repositories.pop(repository, None)
+                self._move_in_index(
+                    self._downloaded_repositories_by_category, repository, data.category, None
+                )
+
+    @staticmethod
+    def _move_in_index(
+        index: dict[str, dict[HacsRepository, None]],
+        repository: HacsRepository,
+        previous: str | None,
+        value: str | None,
+    ) -> None:
+        """Move a repository between two keys of an index."""
+        if previous and (entries := index.get(previous)) is not None:
+            entries.pop(repository, None)
+            if not entries:
+                index.pop(previous)
+        if value:
+            index.setdefault(value, {})[repository] = None
+
+    def set_record_factory(
+        self, factory: Callable[[RepositoryRecord], HacsRepository] | None
+    ) -> None:
+        """Set the function used to create a repository object from a record."""
+        self._record_factory = factory
+
+    def add_record(self, record: RepositoryRecord, default: bool = False) -> None:
+        """Add or replace the record of a repository that has no repository object."""
+        if record.id == "0" or record.id in self._repositories_by_id:
+            return
+        if (previous := self._records_by_id.get(record.id)) is not None:
+            self._record_ids_by_full_name.pop(previous.full_name.lower(), None)
+        self._records_by_id[record.id] = record
+        self._record_ids_by_full_name[record.full_name.lower()] = record.id
+        if default:
+            self._default_repositories.add(record.id)
+
+    def remove_record(self, record: RepositoryRecord) -> None:
+        """Remove a record."""
+        if self._records_by_id.get(record.id) is not record:
+            return
+        self._records_by_id.pop(record.id)
+        self._record_ids_by_full_name.pop(record.full_name.lower(), None)
+        self._default_repositories.discard(record.id)
+
+    def get_record(
+        self,
+        repository_id: str | None = None,
+        repository_full_name: str | None = None,
+    ) -> RepositoryRecord | None:
+        """Get the record of a repository that has no repository object."""
+        if repository_full_name is not None:
+            repository_id = self._record_ids_by_full_name.get(repository_full_name.lower())
+        if not repository_id:
+            return None
+        return self._records_by_id.get(str(repository_id))
+
+    def _promote(self, record: RepositoryRecord | None) -> HacsRepository | None:
+        """Replace a record with a registered repository object."""
+        if record is None or self._record_factory is None:
+            return None
+        repository = self._record_factory(record)
+        self.register(repository)
+        return repository
 
     def register(self, repository: HacsRepository, default: bool = False) -> None:
         """Register a repository."""
@@ -231,6 +417,9 @@ class HacsRepositories:
         if repo_id == "0":
             return
 
+        if (record := self._records_by_id.pop(repo_id, None)) is not None:
+            self._record_ids_by_full_name.pop(record.full_name.lower(), None)
+
         if registered_repo := self._repositories_by_id.get(repo_id):
             if registered_repo.data.full_name == repository.data.full_name:
                 return
@@ -242,7 +431,8 @@ class HacsRepositories:
             repository = registered_repo
 
         if repository not in self._repositories:
-            self._repositories.add(repository)
+            self._repositories[repository] = None
+            self._index(repository)
 
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
@@ -264,7 +454,8 @@ class HacsRepositories:
             self._default_repositories.remove(repo_id)
 
         if repository in self._repositories:
-            self._repositories.remove(repository)
+            self._repositories.pop(repository)
+            self._unindex(repository)
 
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
@@ -280,6 +471,7 @@ class HacsRepositories:
             return
 
         self._default_repositories.add(repo_id)
+        self._custom_repositories.pop(repository, None)
 
     def set_repository_id(self, repository: HacsRepository, repo_id: str):
         """Update a repository id."""
@@ -307,9 +499,14 @@ class HacsRepositories:
     ) -> bool:
         """Check if a repository is registered."""
         if repository_id is not None:
-            return repository_id in self._repositories_by_id
+            return (
+                repository_id in self._repositories_by_id or repository_id in self._records_by_id
+            )
         if repository_full_name is not None:
-            return repository_full_name in self._repositories_by_full_name
+            return (
+                repository_full_name in self._repositories_by_full_name
+                or repository_full_name in self._record_ids_by_full_name
+            )
         return False
 
     def is_downloaded(
@@ -319,24 +516,43 @@ class HacsRepositories:
     ) -> bool:
         """Check if a repository is registered."""
         if repository_id is not None:
-            repo = self.get_by_id(repository_id)
+            repo = self.get_by_id(repository_id, promote=False)
         if repository_full_name is not None:
-            repo = self.get_by_full_name(repository_full_name)
+            repo = self.get_by_full_name(repository_full_name, promote=False)
         if repo is None:
             return False
         return repo.data.installed
 
-    def get_by_id(self, repository_id: str | None) -> HacsRepository | None:
-        """Get repository by id."""
+    def get_by_id(
+        self, repository_id: str | None, *, promote: bool = True
+    ) -> HacsRepository | None:
+        """Get repository by id, creating the repository object from its record if needed."""
         if not repository_id:
             return None
-        return self._repositories_by_id.get(str(repository_id))
+        repository_id = str(repository_id)
+        if (repository := self._repositories_by_id.get(repository_id)) is None and promote:
+            repository = self._promote(self._records_by_id.get(repository_id))
+        return repository
+
+    def get_by_domain(self, domain: str | None) -> HacsRepository | None:
+        """Get repository by domain, preferring a downloaded one."""
+        if not domain or not (entries := self._repositories_by_domain.get(domain)):
+            return None
+        for repository in entries:
+            if repository.data.installed:
+                return repository
+        return next(iter(entries))
 
-    def get_by_full_name(self, repository_full_name: str | None) -> HacsRepository | None:
-        """Get repository by full name."""
+    def get_by_full_name(
+        self, repository_full_name: str | None, *, promote: bool = True
+    ) -> HacsRepository | None:
+        """Get repository by full name, creating the repository object from its record if needed."""
         if not repository_full_name:
             return None
-        return self._repositories_by_full_name.get(repository_full_name.lower())
+        repository = self._repositories_by_full_name.get(repository_full_name.lower())
+        if repository is None and promote:
+            repository = self._promote(self.get_record(repository_full_name=repository_full_name))
+        return repository
 
     def is_removed(self, repository_full_name: str) -> bool:
         """Check if a repository is removed."""
@@ -351,11 +567,16 @@ class HacsRepositories:
         self._removed_repositories_by_full_name[repository_full_name] = removed
         return removed
 
+    def unregister_removed(self, repository_full_name: str) -> None:
+        """Forget a repository that is no longer removed."""
+        self._removed_repositories_by_full_name.pop(repository_full_name, None)
+
 
 class HacsBase:
     """Base HACS class."""
 
     data: HacsData | None = None
+    content_cache: HacsContentCache | None = None
     data_client: HacsDataClient | None = None
     frontend_version: str | None = None
     github: GitHub | None = None
@@ -380,6 +601,9 @@ class HacsBase:
         self.repositories = HacsRepositories()
         self.status = HacsStatus()
         self.system = HacsSystem()
+        self.refresh_rate_limit: dict[str, Any] = {}
+        # The removed repositories list as it was last applied, by full name
+        self._applied_removed: dict[str, dict[str, Any]] = {}
 
     @property
     def integration_dir(self) -> pathlib.Path:
@@ -440,12 +664,10 @@ class HacsBase:
             ) as file_handler:
                 file_handler.write(content)
 
-            # Create gz for .js files
+            # Create precompressed copies of .js files
             if os.path.isfile(file_path):
                 if file_path.endswith(".js"):
-                    with open(file_path, "rb") as f_in:
-                        with gzip.open(file_path + ".gz", "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
+                    precompress_file(file_path)
 
             # LEGACY! Remove with 2.0
             if "themes" in file_path and file_path.endswith(".yaml"):
@@ -692,9 +914,9 @@ class HacsBase:
             url = url.replace("tags/", "")
 
         self.log.debug("Trying to download %s", url)
-        timeouts = 0
+        attempt = 0
 
-        while timeouts < 5:
+        while True:
             try:
                 request = await self.session.get(
                     url=url,
@@ -706,24 +928,34 @@ class HacsBase:
                 if request.status == 200:
                     return await request.read()
 
+                if request.status == 429 or request.status >= 500:
+                    raise HacsRetryableDownloadException(
+                        f"Got status code {request.status} when trying to download {url}",
+                        retry_after=retry_after(request.headers),
+                    )
+
                 raise HacsException(
                     f"Got status code {
                         request.status} when trying to download {url}"
                 )
-            except TimeoutError:
+            except (TimeoutError, ClientError, HacsRetryableDownloadException) as exception:
+                attempt += 1
+                if attempt >= DOWNLOAD_MAX_ATTEMPTS:
+                    if not nolog:
+                        self.log.error(
+                            "Download of %s failed after %s attempts - %s", url, attempt, exception
+                        )
+                    return None
+                delay = download_retry_delay(attempt, getattr(exception, "retry_after", None))
                 self.log.warning(
-                    "A timeout of 60! seconds was encountered while downloading %s, "
-                    "using over 60 seconds to download a single file is not normal. "
-                    "This is not a problem with HACS but how your host communicates with GitHub. "
-                    "Retrying up to 5 times to mask/hide your host/network problems to "
-                    "stop the flow of issues opened about it. "
-                    "Tries left %s",
+                    "Download of %s failed (%s), this is usually caused by how your host "
+                    "communicates with GitHub. Retrying in %.1f seconds, tries left %s",
                     url,
-                    (4 - timeouts),
+                    exception or type(exception).__name__,
+                    delay,
+                    DOWNLOAD_MAX_ATTEMPTS - attempt,
                 )
-                timeouts += 1
-                await asyncio.sleep(1)
-                continue
+                await asyncio.sleep(delay)
 
             except (
                 # lgtm [py/catch-base-exception] pylint: disable=broad-except
@@ -731,8 +963,315 @@ class HacsBase:
             ) as exception:
                 if not nolog:
                     self.log.exception("Download failed - %s", exception)
+                return None
 
-            return None
+    async def async_download_file_to_path(
+        self,
+        url: str,
+        file_path: str,
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+        expected_size: int | None = None,
+        expected_sha256: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        segments: int = 1,
+        **_,
+    ) -> bool:
+        """Download a file in chunks directly to file_path.
+
+        The response is written to a ".part" file next to the destination and
+        only renamed into place once the size (and hash, if given) checks out,
+        so memory use does not grow with the size of the download.
+
+        Interrupted transfers are resumed with a Range request from the last
+        byte written. When segments is above 1 and the server supports ranges,
+        large files are fetched as that many concurrent byte ranges.
+        """
+        if url is None:
+            return False
+
+        if not keep_url and "tags/" in url:
+            url = url.replace("tags/", "")
+
+        self.log.debug("Trying to download %s to %s", url, file_path)
+        part_path = f"{file_path}.part"
+        received = 0
+        total = expected_size
+
+        def _on_chunk(size: int, remote_total: int | None) -> None:
+            nonlocal received, total
+            received += size
+            total = total or remote_total
+            if progress_callback is not None:
+                progress_callback(received, total)
+
+        try:
+            ranges_supported = False
+            if segments > 1:
+                probed_size, ranges_supported = await self._async_probe_download(url, headers)
+                total = probed_size or total
+
+            if ranges_supported and total and total >= DOWNLOAD_SEGMENT_MIN_SIZE:
+                segment_size = math.ceil(total / segments)
+                await self.hass.async_add_executor_job(preallocate_file, part_path, total)
+                # The task group cancels and waits for the other segments if one fails,
+                # so none of them is still writing when the part file is removed
+                try:
+                    async with asyncio.TaskGroup() as group:
+                        for start in range(0, total, segment_size):
+                            group.create_task(
+                                self._async_download_range(
+                                    url,
+                                    part_path,
+                                    start,
+                                    min(start + segment_size, total) - 1,
+                                    headers,
+                                    _on_chunk,
+                                )
+                            )
+                except ExceptionGroup as exception_group:
+                    raise exception_group.exceptions[0] from None
+            else:
+                total = (
+                    await self._async_download_range(url, part_path, 0, None, headers, _on_chunk)
+                    or total
+                )
+
+            downloaded = await self.hass.async_add_executor_job(os.path.getsize, part_path)
+            if total is not None and downloaded != total:
+                raise HacsException(
+                    f"Got {downloaded} of {total} bytes when trying to download {url}"
+                )
+            if expected_size is not None and downloaded != expected_size:
+                raise HacsException(
+                    f"Expected {expected_size} bytes but got {downloaded} when "
+                    f"trying to download {url}"
+                )
+            if expected_sha256 is not None:
+                checksum = await self.hass.async_add_executor_job(file_sha256, part_path)
+                if checksum != expected_sha256.lower():
+                    raise HacsException(f"Checksum mismatch when trying to download {url}")
+
+            await self.hass.async_add_executor_job(os.replace, part_path, file_path)
+            return True
+
+        except (
+            # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            BaseException
+        ) as exception:
+            if not nolog:
+                self.log.exception("Download failed - %s", exception)
+
+        await self.hass.async_add_executor_job(remove_file, part_path)
+        return False
+
+    async def async_download_stream(
+        self,
+        url: str,
+        consumer: Callable[[bytes], None],
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        **_,
+    ) -> bool:
+        """Download a file and pass every chunk to consumer as it arrives.
+
+        consumer is called in the executor, in order. Nothing is written to
+        disk by this. Attempts that fail before the first chunk are retried
+        like async_download_file, but as the consumer can not be rewound a
+        download that fails after that is not; the caller is expected to fall
+        back to async_download_file_to_path.
+        """
+        if url is None:
+            return False
+
+        if not keep_url and "tags/" in url:
+            url = url.replace("tags/", "")
+
+        self.log.debug("Trying to stream %s", url)
+        received = 0
+        attempt = 0
+
+        while True:
+            try:
+                async with self.session.get(
+                    url=url,
+                    timeout=ClientTimeout(total=None, sock_connect=60, sock_read=60),
+                    headers=identity_headers(headers),
+                ) as request:
+                    if request.status == 429 or request.status >= 500:
+                        raise HacsRetryableDownloadException(
+                            f"Got status code {request.status} when trying to download {url}",
+                            retry_after=retry_after(request.headers),
+                        )
+                    if request.status != 200:
+                        raise HacsException(
+                            f"Got status code {request.status} when trying to download {url}"
+                        )
+                    total = content_length(request.headers)
+                    async for chunk in request.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await self.hass.async_add_executor_job(consumer, chunk)
+                        received += len(chunk)
+                        if progress_callback is not None:
+                            progress_callback(received, total)
+
+                if total is not None and received != total:
+                    raise HacsException(
+                        f"Got {received} of {total} bytes when trying to stream {url}"
+                    )
+                return True
+
+            except (TimeoutError, ClientError, HacsRetryableDownloadException) as exception:
+                attempt += 1
+                if received or attempt >= DOWNLOAD_MAX_ATTEMPTS:
+                    if not nolog:
+                        self.log.debug("Streaming %s failed - %s", url, exception)
+                    return False
+                delay = download_retry_delay(attempt, getattr(exception, "retry_after", None))
+                self.log.debug(
+                    "Streaming %s failed (%s), retrying in %.1f seconds",
+                    url,
+                    exception or type(exception).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+            except (
+                # lgtm [py/catch-base-exception] pylint: disable=broad-except
+                BaseException
+            ) as exception:
+                if not nolog:
+                    self.log.debug("Streaming %s failed - %s", url, exception)
+                return False
+
+    async def _async_probe_download(
+        self, url: str, headers: dict | None
+    ) -> tuple[int | None, bool]:
+        """Return the size of url and whether the server accepts byte ranges."""
+        try:
+            async with self.session.head(
+                url,
+                headers=identity_headers(headers),
+                allow_redirects=True,
+                timeout=ClientTimeout(total=30),
+            ) as request:
+                if request.status != 200:
+                    return None, False
+                return (
+                    content_length(request.headers),
+                    request.headers.get("Accept-Ranges", "").lower() == "bytes",
+                )
+        except (TimeoutError, ClientError):
+            return None, False
+
+    async def _async_download_range(
+        self,
+        url: str,
+        part_path: str,
+        start: int,
+        end: int | None,
+        headers: dict | None,
+        on_chunk: Callable[[int, int | None], None],
+    ) -> int | None:
+        """Download bytes start-end (inclusive, None for the rest) of url into part_path.
+
+        Connection drops, timeouts, 429 and 5xx responses are retried with
+        exponential backoff and jitter, resuming from the last byte written.
+        Returns the full size of the remote file if the server reported it.
+        """
+        offset = start
+        attempt = 0
+        total = None
+
+        while True:
+            request_headers = identity_headers(headers)
+            if offset or end is not None:
+                request_headers["Range"] = f"bytes={offset}-{'' if end is None else end}"
+            attempt_offset = offset
+
+            try:
+                async with self.session.get(
+                    url=url,
+                    timeout=ClientTimeout(total=None, sock_connect=60, sock_read=60),
+                    headers=request_headers,
+                ) as request:
+                    if request.status == 206:
+                        received = content_range(request.headers)
+                        if (
+                            received is None
+                            or received[0] != offset
+                            or (end is not None and received[1] > end)
+                        ):
+                            raise HacsException(
+                                f"Got range {request.headers.get('Content-Range')} for bytes "
+                                f"{offset}-{'' if end is None else end} when trying to "
+                                f"download {url}"
+                            )
+                        total = received[2] or total
+                    elif request.status == 200 and end is None:
+                        # The server ignored the range, start over
+                        total = content_length(request.headers)
+                        on_chunk(start - offset, total)
+                        offset = attempt_offset = start
+                    elif request.status == 429 or request.status >= 500:
+                        raise HacsRetryableDownloadException(
+                            f"Got status code {request.status} when trying to download {url}",
+                            retry_after=retry_after(request.headers),
+                        )
+                    else:
+                        raise HacsException(
+                            f"Got status code {request.status} when trying to download {url}"
+                        )
+
+                    file_handler = await self.hass.async_add_executor_job(
+                        open_for_range, part_path, offset, end is None
+                    )
+                    # Chunks are buffered so the writes take one executor job per
+                    # DOWNLOAD_WRITE_BUFFER_SIZE, what is left is written before closing
+                    buffer: list[bytes] = []
+                    buffered = 0
+                    try:
+                        async for chunk in request.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            buffer.append(chunk)
+                            buffered += len(chunk)
+                            offset += len(chunk)
+                            on_chunk(len(chunk), total)
+                            if buffered >= DOWNLOAD_WRITE_BUFFER_SIZE:
+                                await self.hass.async_add_executor_job(
+                                    write_chunks, file_handler, buffer
+                                )
+                                buffer = []
+                                buffered = 0
+                    finally:
+                        await self.hass.async_add_executor_job(
+                            write_chunks, file_handler, buffer, True
+                        )
+
+                expected_end = end + 1 if end is not None else total
+                if expected_end is not None and offset < expected_end:
+                    raise HacsRetryableDownloadException(
+                        f"Connection closed after {offset} of {expected_end} bytes"
+                    )
+                return total
+
+            except (TimeoutError, ClientError, HacsRetryableDownloadException) as exception:
+                # Only consecutive attempts without progress count towards the limit
+                attempt = 1 if offset > attempt_offset else attempt + 1
+                if attempt >= DOWNLOAD_MAX_ATTEMPTS:
+                    raise
+                delay = download_retry_delay(attempt, getattr(exception, "retry_after", None))
+                self.log.warning(
+                    "Download of %s interrupted at byte %s (%s), resuming in %.1f seconds",
+                    url,
+                    offset,
+                    exception or type(exception).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
 
     async def async_recreate_entities(self) -> None:
         """Recreate entities."""
@@ -829,10 +1368,33 @@ class HacsBase:
         if self.system.disabled:
             return
         self.log.info("Loading known repositories")
+        categories = list(self.common.categories or [])
+
+        if self.stage == HacsStage.STARTUP:
+            # Serve categories from the local copy of the last fetch, and
+            # revalidate them against data-v2 in the background
+            cached = await asyncio.gather(
+                *[self.data_client.async_get_cached_data(category) for category in categories]
+            )
+            for category, category_data in zip(categories, cached, strict=True):
+                if not category_data:
+                    continue
+                self.log.debug("Loaded stored content for %s", category)
+                await self.async_process_category_repositories(category, category_data)
+                self.hass.async_create_background_task(
+                    self.async_get_category_repositories_experimental(category),
+                    f"hacs_revalidate_{category}",
+                )
+            categories = [
+                category
+                for category, category_data in zip(categories, cached, strict=True)
+                if not category_data
+            ]
+
         await asyncio.gather(
             *[
                 self.async_get_category_repositories_experimental(category)
-                for category in self.common.categories or []
+                for category in categories
             ]
         )
 
@@ -848,7 +1410,14 @@ class HacsBase:
             self.log.error("Could not update %s - %s", category, exception)
             return
 
+        await self.async_process_category_repositories(category, category_data)
+
+    async def async_process_category_repositories(
+        self, category: str, category_data: dict[str, dict[str, Any]]
+    ) -> None:
+        """Register and update the repositories of a category from data-v2 content."""
         await self.data.register_unknown_repositories(category_data, category)
+        updated: set[str] = set()
 
         for repo_id, repo_data in category_data.items():
             repo_name = repo_data["full_name"]
@@ -858,13 +1427,28 @@ class HacsBase:
                 continue
             if repo_name in self.common.archived_repositories:
                 continue
-            if repository := self.repositories.get_by_full_name(repo_name):
+            if record := self.repositories.get_record(repository_full_name=repo_name):
+                if record.stored.get("last_fetched") is None or (
+                    record.stored["last_fetched"] < repo_data["last_fetched"]
+                ):
+                    record = record._replace(
+                        stored={
+                            **repo_data,
+                            "category": category,
+                            "full_name": record.full_name,
+                            "new": record.stored.get("new", False),
+                        },
+                    )
+                    updated.add(record.id)
+                self.repositories.add_record(record, default=True)
+            elif repository := self.repositories.get_by_full_name(repo_name, promote=False):
                 self.repositories.set_repository_id(repository, repo_id)
                 self.repositories.mark_default(repository)
                 if repository.data.last_fetched is None or (
                     repository.data.last_fetched.timestamp() < repo_data["last_fetched"]
                 ):
                     repository.data.update_data({**dict(REPOSITORY_KEYS_TO_EXPORT), **repo_data})
+                    updated.add(str(repository.data.id))
                     if (manifest := repo_data.get("manifest")) is not None:
                         repository.repository_manifest.update_data(
                             {**dict(HACS_MANIFEST_KEYS_TO_EXPORT), **manifest}
@@ -874,19 +1458,37 @@ class HacsBase:
             self.status.inital_fetch_done = True
 
         if self.stage == HacsStage.STARTUP:
-            for repository in self.repositories.list_all:
-                if (
-                    repository.data.category == category
-                    and not repository.data.installed
-                    and not self.repositories.is_default(repository.data.id)
-                ):
-                    repository.logger.debug(
-                        "%s Unregister stale custom repository", repository.string
-                    )
-                    self.repositories.unregister(repository)
+            stale = [
+                repository
+                for repository in self.repositories.view_category(category)
+                if not repository.data.installed
+                and not self.repositories.is_default(repository.data.id)
+            ]
+            for repository in stale:
+                repository.logger.debug("%s Unregister stale custom repository", repository.string)
+                self.repositories.unregister(repository)
+            for record in [
+                record
+                for record in self.repositories.view_records
+                if record.category == category and not self.repositories.is_default(record.id)
+            ]:
+                self.repositories.remove_record(record)
+
+        updated.update(self.async_update_category_listeners(category))
+        self.async_dispatch(HacsDispatchEvent.REPOSITORY, {"repository_ids": sorted(updated)})
 
-        self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
-        self.coordinators[category].async_update_listeners()
+    @callback
+    def async_update_category_listeners(self, category: str) -> list[str]:
+        """Update the entities of downloaded repositories in a category that changed.
+
+        Returns the ids of the repositories that changed.
+        """
+        return self.coordinators[category].async_update_changed_listeners(
+            {
+                str(repository.data.id): repository.update_state
+                for repository in self.repositories.view_category(category, downloaded=True)
+            }
+        )
 
     async def async_check_rate_limit(self, _=None) -> None:
         """Check rate limit."""
@@ -933,55 +1535,108 @@ class HacsBase:
         await _handle_queue()
 
     async def async_handle_removed_repositories(self, _=None) -> None:
-        """Handle removed repositories."""
+        """Handle removed repositories.
+
+        At startup the list stored by the previous run is applied again in
+        full, repair issues do not survive a restart. After that the list is
+        compared with the one that was applied last, so only entries that were
+        added, changed or dropped are processed.
+        """
         if self.system.disabled:
             return
-        need_to_save = False
         self.log.info("Loading removed repositories")
 
+        removed_ids = []
+        if cached := await self.data_client.async_get_cached_data("removed"):
+            for item in cached:
+                removed = self.repositories.removed_repository(item["repository"])
+                removed.update_data(item)
+                if (repository_id := self.async_apply_removed_repository(removed)) is not None:
+                    removed_ids.append(repository_id)
+            self._applied_removed = {item["repository"]: item for item in cached}
+
         try:
             removed_repositories = await self.data_client.get_data("removed", validate=True)
         except HacsException:
+            if removed_ids:
+                self.data.async_remove_repositories(removed_ids)
             return
 
-        for item in removed_repositories:
+        current = {item["repository"]: item for item in removed_repositories}
+        added = [
+            item
+            for full_name, item in current.items()
+            if self._applied_removed.get(full_name) != item
+        ]
+        dropped = self._applied_removed.keys() - current.keys()
+        self._applied_removed = current
+
+        for item in added:
             removed = self.repositories.removed_repository(item["repository"])
             removed.update_data(item)
+            if (repository_id := self.async_apply_removed_repository(removed)) is not None:
+                removed_ids.append(repository_id)
 
-        for removed in self.repositories.list_removed:
-            if (repository := self.repositories.get_by_full_name(removed.repository)) is None:
-                continue
-            if repository.data.full_name in self.common.ignored_repositories:
-                continue
-            if repository.data.installed:
-                if removed.removal_type != "critical":
-                    async_create_issue(
-                        hass=self.hass,
-                        domain=DOMAIN,
-                        issue_id=f"removed_{repository.data.id}",
-                        is_fixable=False,
-                        issue_domain=DOMAIN,
-                        severity=IssueSeverity.WARNING,
-                        translation_key="removed",
-                        translation_placeholders={
-                            "name": repository.data.full_name,
-                            "reason": removed.reason,
-                            "repositry_id": repository.data.id,
-                        },
-                    )
-                    self.log.warning(
-                        "You have '%s' installed with HACS "
-                        "this repository has been removed from HACS, please consider removing it. "
-                        "Removal reason (%s)",
-                        repository.data.full_name,
-                        removed.reason,
-                    )
-            else:
-                need_to_save = True
-                repository.remove()
+        critical = {stored["repository"] for stored in await self.async_get_stored_critical()}
+        for full_name in dropped:
+            if (
+                repository := self.repositories.get_by_full_name(full_name, promote=False)
+            ) is not None:
+                async_delete_issue(self.hass, DOMAIN, f"removed_{repository.data.id}")
+            if full_name not in critical:
+                self.repositories.unregister_removed(full_name)
+
+        self.log.debug(
+            "Removed repositories: %s added or changed, %s dropped", len(added), len(dropped)
+        )
+        if removed_ids:
+            self.data.async_remove_repositories(removed_ids)
+        self.data_client.async_store_data("removed", removed_repositories)
 
-        if need_to_save:
-            await self.data.async_write()
+    @callback
+    def async_apply_removed_repository(self, removed: RemovedRepository) -> str | None:
+        """Act on a removed repository.
+
+        Installed repositories get a repair issue, others are removed from HACS.
+        Returns the ID of the repository if it was removed.
+        """
+        if record := self.repositories.get_record(repository_full_name=removed.repository):
+            if record.full_name in self.common.ignored_repositories:
+                return None
+            self.repositories.remove_record(record)
+            return record.id
+        if (
+            repository := self.repositories.get_by_full_name(removed.repository, promote=False)
+        ) is None:
+            return None
+        if repository.data.full_name in self.common.ignored_repositories:
+            return None
+        if repository.data.installed:
+            if removed.removal_type != "critical":
+                async_create_issue(
+                    hass=self.hass,
+                    domain=DOMAIN,
+                    issue_id=f"removed_{repository.data.id}",
+                    is_fixable=False,
+                    issue_domain=DOMAIN,
+                    severity=IssueSeverity.WARNING,
+                    translation_key="removed",
+                    translation_placeholders={
+                        "name": repository.data.full_name,
+                        "reason": removed.reason,
+                        "repositry_id": repository.data.id,
+                    },
+                )
+                self.log.warning(
+                    "You have '%s' installed with HACS "
+                    "this repository has been removed from HACS, please consider removing it. "
+                    "Removal reason (%s)",
+                    repository.data.full_name,
+                    removed.reason,
+                )
+            return None
+        repository.remove()
+        return str(repository.data.id)
 
     async def async_update_downloaded_custom_repositories(self, _=None) -> None:
         """Execute the task."""
@@ -991,28 +1646,47 @@ class HacsBase:
 
         repositories_to_update = 0
         repositories_updated = asyncio.Event()
+        core_remaining = await self.async_get_core_rate_limit_remaining()
 
         async def update_repository(repository: HacsRepository) -> None:
             """Update a repository"""
             nonlocal repositories_to_update
-            await repository.update_repository(ignore_issues=True)
-            repositories_to_update -= 1
-            if not repositories_to_update:
-                repositories_updated.set()
+            try:
+                await repository.update_repository(ignore_issues=True)
+            finally:
+                repositories_to_update -= 1
+                if not repositories_to_update:
+                    repositories_updated.set()
+
+        changed, graphql_cost = await self.async_get_changed_repositories(
+            [
+                repository
+                for repository in self.repositories.view_downloaded
+                if repository.data.category in self.common.categories
+                and repository in self.repositories.view_custom
+            ]
+        )
+        for repository in changed:
+            repositories_to_update += 1
+            self.queue.add(update_repository(repository))
 
-        for repository in self.repositories.list_downloaded:
-            if (
-                repository.data.category in self.common.categories
-                and not self.repositories.is_default(repository.data.id)
-            ):
-                repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+        if not repositories_to_update:
+            self.log.debug("No downloaded custom repositories have upstream changes")
+            await self.async_report_refresh_rate_limit(graphql_cost, core_remaining, 0)
+            return
 
         async def update_coordinators() -> None:
-            """Update all coordinators."""
+            """Update the entities of repositories that changed."""
             await repositories_updated.wait()
-            for coordinator in self.coordinators.values():
-                coordinator.async_update_listeners()
+            await self.async_report_refresh_rate_limit(graphql_cost, core_remaining, len(changed))
+            updated = [
+                repository_id
+                for category in {repository.data.category for repository in changed}
+                if category in self.coordinators
+                for repository_id in self.async_update_category_listeners(category)
+            ]
+            if updated:
+                self.async_dispatch(HacsDispatchEvent.REPOSITORY, {"repository_ids": updated})
 
         if config_entry := self.configuration.config_entry:
             config_entry.async_create_background_task(
@@ -1023,13 +1697,104 @@ class HacsBase:
 
         self.log.debug("Recurring background task for downloaded custom repositories done")
 
+    async def async_get_changed_repositories(
+        self, repositories: list[HacsRepository]
+    ) -> tuple[list[HacsRepository], int]:
+        """Return the repositories that changed upstream since they were last updated.
+
+        The status of the repositories is fetched with one GraphQL query per
+        GRAPHQL_BATCH_SIZE repositories, if a batch can not be checked all
+        repositories in it are considered changed. The information in the
+        status is applied to unchanged repositories, and kept on the changed
+        ones for their next update. Also returns the GraphQL cost of the queries.
+        """
+        changed = []
+        cost = 0
+        for start in range(0, len(repositories), GRAPHQL_BATCH_SIZE):
+            batch = repositories[start : start + GRAPHQL_BATCH_SIZE]
+            try:
+                response = await self.async_github_api_method(
+                    method=self.githubapi.graphql,
+                    query=build_repositories_status_query(
+                        [repository.data.full_name for repository in batch]
+                    ),
+                )
+                statuses = response.data or {}
+            except HacsException as exception:
+                self.log.debug("Could not check repositories for changes - %s", exception)
+                changed.extend(batch)
+                continue
+
+            cost += (statuses.get("rateLimit") or {}).get("cost") or 0
+            for index, repository in enumerate(batch):
+                status = statuses.get(f"r{index}")
+                if repository.has_upstream_changes(status):
+                    repository.upstream_status = status
+                    changed.append(repository)
+                else:
+                    repository.apply_upstream_status(status)
+                    repository.logger.debug("%s No upstream changes", repository.string)
+
+        return changed, cost
+
+    async def async_get_core_rate_limit_remaining(self) -> int | None:
+        """Return the remaining requests of the REST API, None if that is not known."""
+        try:
+            response = await self.async_github_api_method(self.githubapi.rate_limit)
+            return response.data.resources.core.remaining
+        except HacsException:
+            return None
+
+    async def async_report_refresh_rate_limit(
+        self, graphql_cost: int, core_remaining_before: int | None, updated: int
+    ) -> None:
+        """Log and keep the rate limit used by a refresh of the downloaded repositories."""
+        core_remaining = await self.async_get_core_rate_limit_remaining()
+        core_used = None
+        if core_remaining_before is not None and core_remaining is not None:
+            # Requests made for other things are counted as well, and a reset in between is ignored
+            core_used = max(core_remaining_before - core_remaining, 0)
+
+        self.refresh_rate_limit = {
+            "timestamp": dt.utcnow().isoformat(),
+            "updated_repositories": updated,
+            "graphql_cost": graphql_cost,
+            "core_used": core_used,
+            "core_remaining": core_remaining,
+        }
+        self.log.debug(
+            "Refresh of downloaded custom repositories updated %s repositories, "
+            "using %s GraphQL points and %s REST requests (%s remaining)",
+            updated,
+            graphql_cost,
+            core_used,
+            core_remaining,
+        )
+
+    async def async_get_stored_critical(self) -> list[dict[str, Any]]:
+        """Return the stored critical repositories, and make sure they are marked as removed."""
+        stored_critical = await async_load_from_store(self.hass, "critical") or []
+        for stored in stored_critical:
+            if not self.repositories.is_removed(stored["repository"]):
+                removed = self.repositories.removed_repository(stored["repository"])
+                removed.removal_type = "critical"
+                removed.update_data(stored)
+        return stored_critical
+
     async def async_handle_critical_repositories(self, _=None) -> None:
-        """Handle critical repositories."""
+        """Handle critical repositories.
+
+        Only repositories that are not in the stored list are acted on, and the
+        store is only written when the list changed.
+        """
         critical_queue = QueueManager(hass=self.hass)
-        instored = []
         critical = []
         was_installed = False
 
+        stored_critical = {
+            stored["repository"]: stored for stored in await self.async_get_stored_critical()
+        }
+
         try:
             critical = await self.data_client.get_data("critical", validate=True)
         except (GitHubNotModifiedException, HacsNotModifiedException):
@@ -1041,44 +1806,59 @@ class HacsBase:
             self.log.debug("No critical repositories")
             return
 
-        stored_critical = await async_load_from_store(self.hass, "critical")
-
-        for stored in stored_critical or []:
-            instored.append(stored["repository"])
-
-        stored_critical = []
-
+        current = {}
+        removed_ids = []
         for repository in critical:
-            removed_repo = self.repositories.removed_repository(repository["repository"])
+            full_name = repository["repository"]
+            if (stored := stored_critical.get(full_name)) is not None:
+                current[full_name] = {
+                    **stored,
+                    "reason": repository["reason"],
+                    "link": repository["link"],
+                }
+                if current[full_name] != stored:
+                    self.repositories.removed_repository(full_name).update_data(current[full_name])
+                continue
+
+            removed_repo = self.repositories.removed_repository(full_name)
             removed_repo.removal_type = "critical"
-            repo = self.repositories.get_by_full_name(repository["repository"])
+            repo = self.repositories.get_by_full_name(full_name, promote=False)
 
             stored = {
-                "repository": repository["repository"],
+                "repository": full_name,
                 "reason": repository["reason"],
                 "link": repository["link"],
                 "acknowledged": True,
             }
-            if repository["repository"] not in instored:
-                if repo is not None and repo.data.installed:
-                    self.log.critical(
-                        "Removing repository %s, it is marked as critical",
-                        repository["repository"],
-                    )
-                    was_installed = True
-                    stored["acknowledged"] = False
-                    # Remove from HACS
-                    critical_queue.add(repo.uninstall())
-                    repo.remove()
-
-            stored_critical.append(stored)
+            if repo is not None and repo.data.installed:
+                self.log.critical("Removing repository %s, it is marked as critical", full_name)
+                was_installed = True
+                stored["acknowledged"] = False
+                # Remove from HACS
+                critical_queue.add(repo.uninstall(), QueuePriority.CRITICAL)
+                repo.remove()
+                removed_ids.append(str(repo.data.id))
+            elif (repository_id := self.async_apply_removed_repository(removed_repo)) is not None:
+                removed_ids.append(repository_id)
+
+            current[full_name] = stored
             removed_repo.update_data(stored)
 
+        for full_name in stored_critical.keys() - current.keys():
+            if (item := self._applied_removed.get(full_name)) is not None:
+                self.repositories.removed_repository(full_name).update_data(item)
+            else:
+                self.repositories.unregister_removed(full_name)
+
         # Uninstall
         await critical_queue.execute()
 
+        if removed_ids:
+            self.data.async_remove_repositories(removed_ids)
+
         # Save to FS
-        await async_save_to_store(self.hass, "critical", stored_critical)
+        if current != stored_critical:
+            await async_save_to_store(self.hass, "critical", list(current.values()))
 
         # Restart HASS
         if was_installed:
@@ -1100,11 +1880,8 @@ class HacsBase:
             use_cache,
         )
 
-        await async_register_static_path(
-            self.hass,
-            URL_BASE,
-            self.hass.config.path("www/community"),
-            cache_headers=use_cache,
+        self.hass.http.register_view(
+            HacsPluginFilesView(self.hass, self.hass.config.path("www/community"), use_cache)
         )
 
         self.status.active_frontend_endpoint_plugin = True
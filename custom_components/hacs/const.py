@@ -18,8 +18,19 @@ PACKAGE_NAME = "custom_components.hacs"
 DEFAULT_CONCURRENT_TASKS = 15
 DEFAULT_CONCURRENT_BACKOFF_TIME = 1
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Chunks are written to disk in batches of about this size, one executor job each
+DOWNLOAD_WRITE_BUFFER_SIZE = 1024 * 1024
+DOWNLOAD_MAX_ATTEMPTS = 5
+DOWNLOAD_BACKOFF_BASE = 1
+DOWNLOAD_BACKOFF_MAX = 30
+DOWNLOAD_SEGMENTS = 4
+DOWNLOAD_SEGMENT_MIN_SIZE = 8 * 1024 * 1024
+
 HACS_REPOSITORY_ID = "172733314"
 
+GRAPHQL_BATCH_SIZE = 25
+
 HACS_ACTION_GITHUB_API_HEADERS = {
     "User-Agent": "HACS/action",
     "Accept": ACCEPT_HEADERS["preview"],
@@ -27,6 +38,16 @@ HACS_ACTION_GITHUB_API_HEADERS = {
 
 VERSION_STORAGE = "6"
 STORENAME = "hacs"
+STORE_SAVE_DELAY = 10
+
+# Documentation and release notes, size in characters and age in seconds
+CONTENT_CACHE_MAX_SIZE = 5 * 1024 * 1024
+CONTENT_CACHE_MAX_AGE = 60 * 60
+
+# Values shared by the validators of all repositories are fetched again after this
+VALIDATION_SHARED_MAX_AGE = 60 * 60
+# Number of validator results kept for content that was validated before
+VALIDATION_RESULTS_MAX_SIZE = 4096
 
 HACS_SYSTEM_ID = "0717a0cd-745c-48fd-9b16-c8534c9704f9-bc944b0f-fd42-4a58-a072-ade38d1444cd"
 
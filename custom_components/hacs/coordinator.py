@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from typing import Any
 
 from homeassistant.core import CALLBACK_TYPE, callback
@@ -15,6 +15,7 @@ class HacsUpdateCoordinator(BaseDataUpdateCoordinatorProtocol):
     def __init__(self) -> None:
         """Initialize."""
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        self._states: dict[Any, Hashable] = {}
 
     @callback
     def async_add_listener(
@@ -32,7 +33,24 @@ class HacsUpdateCoordinator(BaseDataUpdateCoordinatorProtocol):
         return remove_listener
 
     @callback
-    def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+    def async_update_listeners(self, contexts: Iterable[Any] | None = None) -> None:
+        """Update all registered listeners, or only the ones for contexts if given."""
+        if contexts is not None:
+            contexts = set(contexts)
+        for update_callback, context in list(self._listeners.values()):
+            if contexts is None or context in contexts:
+                update_callback()
+
+    @callback
+    def async_update_changed_listeners(self, states: dict[Any, Hashable]) -> list[Any]:
+        """Update the listeners of contexts with a state that changed since the last call.
+
+        Returns the contexts that changed.
+        """
+        changed = [
+            context for context, state in states.items() if self._states.get(context) != state
+        ]
+        self._states = states
+        if changed:
+            self.async_update_listeners(changed)
+        return changed
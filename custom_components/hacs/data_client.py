@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from typing import Any
 
 from aiohttp import ClientSession, ClientTimeout
+from homeassistant.core import HomeAssistant, callback
 import voluptuous as vol
 
+from .const import STORE_SAVE_DELAY
 from .exceptions import HacsException, HacsNotModifiedException
+from .utils.json import json_loads
 from .utils.logger import LOGGER
+from .utils.store import async_delay_save_to_store, get_store_for_key
 from .utils.validate import (
     VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
     VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
-    VALIDATE_FETCHED_V2_REPO_DATA,
+    VALIDATE_FETCHED_V2_REPO_DATA_COMPILED,
 )
 
 CRITICAL_REMOVED_VALIDATORS = {
@@ -25,11 +30,72 @@ CRITICAL_REMOVED_VALIDATORS = {
 class HacsDataClient:
     """HACS Data client."""
 
-    def __init__(self, session: ClientSession, client_name: str) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        client_name: str,
+        hass: HomeAssistant | None = None,
+    ) -> None:
         """Initialize."""
         self._client_name = client_name
+        self._digests = {}
         self._etags = {}
+        self._hass = hass
+        self._loaded_sections = set()
         self._session = session
+        self._validated_last_fetched: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def _endpoint(filename: str, section: str | None) -> str:
+        """Return the endpoint of a file in a section."""
+        return "/".join([v for v in [section, filename] if v is not None])
+
+    @staticmethod
+    def _store_key(section: str | None) -> str:
+        """Return the store key used to persist a section."""
+        return f"data_v2_{section or 'hacs'}"
+
+    async def async_get_cached_data(self, section: str | None) -> Any | None:
+        """Return the validated data stored by the last successful fetch of a section.
+
+        This also restores the ETag and digest of that fetch, so the next
+        request is made with If-None-Match.
+        """
+        if self._hass is None or section in self._loaded_sections:
+            return None
+        self._loaded_sections.add(section)
+
+        try:
+            cached = await get_store_for_key(self._hass, self._store_key(section)).async_load()
+        except HacsException:
+            return None
+        if not cached:
+            return None
+
+        endpoint = self._endpoint("data.json", section)
+        self._etags[endpoint] = cached.get("etag")
+        self._digests[endpoint] = cached.get("digest")
+        if (data := cached.get("data")) and section in VALIDATE_FETCHED_V2_REPO_DATA_COMPILED:
+            self._validated_last_fetched[section] = {
+                key: repo_data.get("last_fetched") for key, repo_data in data.items()
+            }
+        return data
+
+    @callback
+    def async_store_data(self, section: str | None, data: Any) -> None:
+        """Persist the validated data of a section together with its ETag and digest."""
+        if self._hass is None:
+            return
+        endpoint = self._endpoint("data.json", section)
+        self._loaded_sections.add(section)
+        content = {
+            "etag": self._etags.get(endpoint),
+            "digest": self._digests.get(endpoint),
+            "data": data,
+        }
+        async_delay_save_to_store(
+            self._hass, self._store_key(section), lambda: content, STORE_SAVE_DELAY
+        )
 
     async def _do_request(
         self,
@@ -37,19 +103,20 @@ class HacsDataClient:
         section: str | None = None,
     ) -> dict[str, dict[str, Any]] | list[str]:
         """Do request."""
-        endpoint = "/".join([v for v in [section, filename] if v is not None])
+        endpoint = self._endpoint(filename, section)
         try:
             response = await self._session.get(
                 f"https://data-v2.hacs.xyz/{endpoint}",
                 timeout=ClientTimeout(total=60),
                 headers={
                     "User-Agent": self._client_name,
-                    "If-None-Match": self._etags.get(endpoint, ""),
+                    "If-None-Match": self._etags.get(endpoint) or "",
                 },
             )
             if response.status == 304:
                 raise HacsNotModifiedException() from None
             response.raise_for_status()
+            body = await response.read()
         except HacsNotModifiedException:
             raise
         except TimeoutError:
@@ -59,7 +126,13 @@ class HacsDataClient:
 
         self._etags[endpoint] = response.headers.get("etag")
 
-        return await response.json()
+        # The ETag can change without the content changing (e.g. a new CDN edge)
+        digest = hashlib.sha256(body).hexdigest()
+        if self._digests.get(endpoint) == digest:
+            raise HacsNotModifiedException()
+        self._digests[endpoint] = digest
+
+        return json_loads(body)
 
     async def get_data(self, section: str | None, *, validate: bool) -> dict[str, dict[str, Any]]:
         """Get data."""
@@ -67,17 +140,14 @@ class HacsDataClient:
         if not validate:
             return data
 
-        if section in VALIDATE_FETCHED_V2_REPO_DATA:
-            validated = {}
-            for key, repo_data in data.items():
-                try:
-                    validated[key] = VALIDATE_FETCHED_V2_REPO_DATA[section](repo_data)
-                except vol.Invalid as exception:
-                    LOGGER.info(
-                        "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
-                    )
-                    continue
-
+        if section in VALIDATE_FETCHED_V2_REPO_DATA_COMPILED:
+            if self._hass is None:
+                validated = self._validate_repo_data(section, data)
+            else:
+                validated = await self._hass.async_add_executor_job(
+                    self._validate_repo_data, section, data
+                )
+            self.async_store_data(section, validated)
             return validated
 
         if not (validator := CRITICAL_REMOVED_VALIDATORS.get(section)):
@@ -93,6 +163,38 @@ class HacsDataClient:
 
         return validated
 
+    def _validate_repo_data(
+        self, section: str, data: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Validate the repositories of a category.
+
+        Entries with the same last_fetched as when they were last accepted
+        are unchanged and are not validated again.
+        """
+        validator = VALIDATE_FETCHED_V2_REPO_DATA_COMPILED[section]
+        previous = self._validated_last_fetched.get(section, {})
+        validated = {}
+        for key, repo_data in data.items():
+            if (
+                isinstance(repo_data, dict)
+                and (last_fetched := repo_data.get("last_fetched")) is not None
+                and previous.get(key) == last_fetched
+            ):
+                validated[key] = repo_data
+                continue
+            try:
+                validated[key] = validator(repo_data)
+            except vol.Invalid as exception:
+                LOGGER.info(
+                    "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
+                )
+                continue
+
+        self._validated_last_fetched[section] = {
+            key: repo_data["last_fetched"] for key, repo_data in validated.items()
+        }
+        return validated
+
     async def get_repositories(self, section: str) -> list[str]:
         """Get repositories."""
         return await self._do_request(filename="repositories.json", section=section)
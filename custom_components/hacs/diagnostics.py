@@ -33,12 +33,12 @@ async def async_get_config_entry_diagnostics(
             "archived_repositories": hacs.common.archived_repositories,
             "ignored_repositories": hacs.common.ignored_repositories,
             "lovelace_mode": hacs.core.lovelace_mode,
+            "refresh_rate_limit": hacs.refresh_rate_limit,
             "configuration": {},
         },
         "custom_repositories": [
             repo.data.full_name
-            for repo in hacs.repositories.list_all
-            if not hacs.repositories.is_default(str(repo.data.id))
+            for repo in hacs.repositories.view_custom
         ],
         "repositories": [],
     }
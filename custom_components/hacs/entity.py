@@ -92,11 +92,12 @@ class HacsRepositoryEntity(BaseCoordinatorEntity[HacsUpdateCoordinator], HacsBas
         repository: HacsRepository,
     ) -> None:
         """Initialize."""
-        BaseCoordinatorEntity.__init__(self, hacs.coordinators[repository.data.category])
+        BaseCoordinatorEntity.__init__(
+            self, hacs.coordinators[repository.data.category], context=str(repository.data.id)
+        )
         HacsBaseEntity.__init__(self, hacs=hacs)
         self.repository = repository
         self._attr_unique_id = str(repository.data.id)
-        self._repo_last_fetched = repository.data.last_fetched
 
     @property
     def available(self) -> bool:
@@ -125,15 +126,10 @@ class HacsRepositoryEntity(BaseCoordinatorEntity[HacsUpdateCoordinator], HacsBas
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if (
-            self._repo_last_fetched is not None
-            and self.repository.data.last_fetched is not None
-            and self._repo_last_fetched >= self.repository.data.last_fetched
-        ):
-            return
-
-        self._repo_last_fetched = self.repository.data.last_fetched
+        """Handle updated data from the coordinator.
+
+        The coordinator only calls this when the state of the repository changed.
+        """
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
@@ -1,7 +1,7 @@
 """Helper constants."""
 
 # pylint: disable=missing-class-docstring
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class HacsGitHubRepo(StrEnum):
@@ -69,3 +69,11 @@ class HacsDisabledReason(StrEnum):
     CONSTRAINS = "constrains"
     LOAD_HACS = "load_hacs"
     RESTORE = "restore"
+
+
+class QueuePriority(IntEnum):
+    """Priority of queued tasks, lower runs first."""
+
+    USER = 0
+    CRITICAL = 1
+    BACKGROUND = 2
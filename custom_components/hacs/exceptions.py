@@ -47,3 +47,15 @@ class HomeAssistantCoreRepositoryException(HacsException):
 
     def __init__(self) -> None:
         super().__init__(self.exception_message)
+
+
+class HacsRetryableDownloadException(HacsException):
+    """Exception to raise when a download failed in a way that is worth retrying."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class HacsStreamingUnsupportedException(HacsException):
+    """Exception to raise when an archive can not be extracted while it is downloaded."""
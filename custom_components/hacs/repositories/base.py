@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 from asyncio import sleep
+from collections.abc import Callable
 from datetime import UTC, datetime
 import os
 import pathlib
 import shutil
-import tempfile
-from typing import TYPE_CHECKING, Any
-import zipfile
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from aiogithubapi import (
     AIOGitHubAPIException,
@@ -20,19 +19,26 @@ from aiogithubapi.objects.repository import AIOGitHubAPIRepository
 import attr
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
 
-from ..const import DOMAIN
+from ..const import DOMAIN, DOWNLOAD_SEGMENTS
 from ..enums import HacsDispatchEvent, RepositoryFile
 from ..exceptions import (
     HacsException,
     HacsNotModifiedException,
     HacsRepositoryArchivedException,
     HacsRepositoryExistException,
+    HacsStreamingUnsupportedException,
 )
 from ..types import DownloadableContent
-from ..utils.backup import Backup
+from ..utils.backup import Backup, StagedInstall
 from ..utils.decode import decode_content
 from ..utils.decorator import concurrent
-from ..utils.file_system import async_exists, async_remove, async_remove_directory
+from ..utils.download import remove_file
+from ..utils.file_system import (
+    async_exists,
+    async_remove,
+    async_remove_directory,
+    git_blob_sha,
+)
 from ..utils.filters import filter_content_return_one_of_type
 from ..utils.github_graphql_query import GET_REPOSITORY_RELEASES
 from ..utils.json import json_loads
@@ -47,6 +53,7 @@ from ..utils.version import (
     version_left_higher_then_right,
 )
 from ..utils.workarounds import DOMAIN_OVERRIDES
+from ..utils.zip_stream import StreamingZipExtractor, extract_zip_members, safe_member_path
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -119,6 +126,9 @@ REPOSITORY_KEYS_TO_EXPORT = (
     ("topics", []),
 )
 
+# Attributes of RepositoryData that HacsRepositories keeps indexes for
+REPOSITORY_INDEXED_KEYS = ("category", "domain", "installed")
+
 HACS_MANIFEST_KEYS_TO_EXPORT = (
     # Keys can not be removed from this list until v3
     # If keys are added, the action need to be re-run with force
@@ -130,10 +140,26 @@ HACS_MANIFEST_KEYS_TO_EXPORT = (
 class FileInformation:
     """FileInformation."""
 
-    def __init__(self, url, path, name):
+    def __init__(self, url, path, name, sha=None):
         self.download_url = url
         self.path = path
         self.name = name
+        self.sha = sha
+
+
+def tree_file_sha(treefile) -> str | None:
+    """Return the git blob SHA of a tree file."""
+    return getattr(treefile, "attributes", {}).get("sha")
+
+
+def upstream_releases(status: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the releases in a GraphQL repository status, newest first."""
+    return (status.get("releases") or {}).get("nodes") or []
+
+
+def upstream_commit(status: dict[str, Any]) -> str | None:
+    """Return the default branch commit in a GraphQL repository status."""
+    return ((status.get("defaultBranchRef") or {}).get("target") or {}).get("oid")
 
 
 @attr.s(auto_attribs=True)
@@ -174,6 +200,24 @@ class RepositoryData:
     stargazers_count: int = 0
     topics: list[str] = []
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and bump the revision used to track unsaved changes."""
+        previous = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_revision", self.__dict__.get("_revision", 0) + 1)
+        if name in REPOSITORY_INDEXED_KEYS and previous != value:
+            if (listener := self.__dict__.get("_index_listener")) is not None:
+                listener(name, previous, value)
+
+    def set_index_listener(self, listener: Callable[[str, Any, Any], None] | None) -> None:
+        """Set a listener called when an indexed attribute changes."""
+        object.__setattr__(self, "_index_listener", listener)
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes every time the data is modified."""
+        return self.__dict__.get("_revision", 0)
+
     @property
     def name(self):
         """Return the name."""
@@ -230,6 +274,16 @@ class HacsManifest:
     render_readme: bool = False
     zip_release: bool = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and bump the revision."""
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_revision", self.__dict__.get("_revision", 0) + 1)
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes every time the manifest is modified."""
+        return self.__dict__.get("_revision", 0)
+
     def to_dict(self):
         """Export to json."""
         return attr.asdict(self)
@@ -296,6 +350,20 @@ class RepositoryContent:
     single = False
 
 
+class RepositoryRecord(NamedTuple):
+    """Catalog entry for a repository that is not downloaded.
+
+    stored holds the repository data in the format of the repositories store
+    and is never changed in place, changes replace the whole record.
+    A HacsRepository is only created when the repository is used.
+    """
+
+    id: str
+    full_name: str
+    category: str
+    stored: dict[str, Any]
+
+
 class HacsRepository:
     """HacsRepository."""
 
@@ -316,8 +384,11 @@ class HacsRepository:
         self.releases = RepositoryReleases()
         self.pending_restart = False
         self.tree = []
+        self.tree_key = None
         self.treefiles = []
         self.ref = None
+        self.release_tags: list[str] | None = None
+        self.upstream_status: dict[str, Any] | None = None
         self.logger = LOGGER
 
     def __str__(self) -> str:
@@ -398,6 +469,16 @@ class HacsRepository:
                 available = ""
         return str(available)
 
+    @property
+    def update_state(self) -> tuple:
+        """Return what the state of the update entity of the repository depends on."""
+        return (
+            self.display_installed_version,
+            self.display_available_version,
+            self.display_status,
+            self.pending_restart,
+        )
+
     @property
     def display_version_or_commit(self) -> str:
         """Does the repositoriy use releases or commits?"""
@@ -485,6 +566,77 @@ class HacsRepository:
                     action=self.hacs.system.action,
                 )
 
+    def has_upstream_changes(self, status: dict[str, Any] | None) -> bool:
+        """Return True if a GraphQL repository status differs from the stored data."""
+        if not status:
+            return True
+        if status.get("nameWithOwner", "").lower() != self.data.full_name_lower:
+            return True
+        if status.get("isArchived") != self.data.archived:
+            return True
+        if status.get("pushedAt") != self.data.last_updated:
+            return True
+
+        last_version = prerelease = None
+        for release in upstream_releases(status):
+            if release["isDraft"]:
+                continue
+            if not release["isPrerelease"]:
+                last_version = release["tagName"]
+                break
+            if prerelease is None:
+                prerelease = release["tagName"]
+        if self.data.releases and (
+            last_version != self.data.last_version or prerelease != self.data.prerelease
+        ):
+            return True
+        if not self.data.releases and last_version is not None:
+            return True
+
+        oid = upstream_commit(status) or ""
+        return bool(self.data.last_commit) and not oid.startswith(self.data.last_commit)
+
+    def apply_upstream_status(self, status: dict[str, Any] | None) -> bool:
+        """Update the repository information from a GraphQL repository status.
+
+        Returns False if the status is not for this repository (it was renamed).
+        """
+        if not status or status.get("nameWithOwner", "").lower() != self.data.full_name_lower:
+            return False
+
+        attributes = {
+            "archived": status.get("isArchived", False),
+            "description": status.get("description") or "",
+            "pushed_at": status.get("pushedAt"),
+            "stargazers_count": status.get("stargazerCount", 0),
+            "topics": [
+                node["topic"]["name"]
+                for node in (status.get("repositoryTopics") or {}).get("nodes") or []
+            ],
+        }
+        if default_branch := (status.get("defaultBranchRef") or {}).get("name"):
+            attributes["default_branch"] = default_branch
+
+        if self.repository_object is not None:
+            # Keep the repository object in line, it is used for the rest of the update
+            self.repository_object.attributes.update(attributes)
+        self.data.update_data(attributes, action=self.hacs.system.action)
+        return True
+
+    def get_tree_key(self, status: dict[str, Any] | None) -> str | None:
+        """Return what identifies the tree of self.ref, None if that is not known."""
+        if self.ref is None:
+            return None
+        if self.ref == self.data.last_version or self.ref in self.data.published_tags:
+            return f"tags/{self.ref}"
+        if (
+            status
+            and (oid := upstream_commit(status))
+            and self.ref == (status.get("defaultBranchRef") or {}).get("name")
+        ):
+            return f"{self.ref}@{oid}"
+        return None
+
     async def common_registration(self) -> None:
         """Common registration steps of the repository."""
         # Attach repository
@@ -510,6 +662,16 @@ class HacsRepository:
     async def common_update(self, ignore_issues=False, force=False, skip_releases=False) -> bool:
         """Common information update steps of the repository."""
         self.logger.debug("%s Getting repository information", self.string)
+        try:
+            return await self._async_common_update(ignore_issues, force, skip_releases)
+        finally:
+            # The status is only valid for the update it was fetched for
+            self.upstream_status = None
+
+    async def _async_common_update(self, ignore_issues, force, skip_releases) -> bool:
+        """Update the repository information, using the upstream status when possible."""
+        status = None if force else self.upstream_status
+        tree_key = self.tree_key
 
         # Attach repository
         current_etag = self.data.etag_repository
@@ -536,8 +698,17 @@ class HacsRepository:
             self.data.last_updated = self.repository_object.attributes.get("pushed_at", 0)
 
             # Update last available commit
-            await self.repository_object.set_last_commit()
-            self.data.last_commit = self.repository_object.last_commit
+            if status and (oid := upstream_commit(status)):
+                self.data.last_commit = oid[0:7]
+            else:
+                await self.repository_object.set_last_commit()
+                self.data.last_commit = self.repository_object.last_commit
+
+        if status and tree_key is not None and tree_key == self.tree_key:
+            # The tree did not change, and neither did the files read from it
+            self.logger.debug("%s Content did not change", self.string)
+            self.data.last_fetched = datetime.now(UTC)
+            return True
 
         # Get the content of hacs.json
         if RepositoryFile.HACS_JSON in [x.filename for x in self.tree]:
@@ -585,38 +756,162 @@ class HacsRepository:
     ) -> None:
         """Download ZIP archive from repository release."""
         try:
-            filecontent = await self.hacs.async_download_file(content["url"])
-
-            if filecontent is None:
+            if (
+                await self.async_stream_zip_archive(
+                    content["url"], lambda name: name, segments=DOWNLOAD_SEGMENTS
+                )
+                is None
+            ):
                 validate.errors.append(f"Failed to download {content['url']}")
                 return
 
-            temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-            temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
+            self.logger.info("%s Download of %s completed", self.string, content["name"])
+        # lgtm [py/catch-base-exception] pylint: disable=broad-except
+        except BaseException:
+            validate.errors.append("Download was not completed")
+
+    async def async_stream_zip_archive(
+        self,
+        url: str,
+        member_path: Callable[[str], str | None],
+        **kwargs,
+    ) -> list[str] | None:
+        """Extract a zip archive to the local path while it is downloaded.
+
+        member_path returns the path of an archive member relative to the local
+        path, or None to skip it. Returns the extracted files, or None if the
+        server did not answer with the archive.
+
+        The response is also spooled to a file next to the local path. If the
+        archive can not be extracted while it is read, the rest of the same
+        response is only spooled and the archive is extracted from that file.
+        If the connection fails once the response has started, the archive is
+        downloaded to that file one more time.
+
+        Members are extracted to a staging directory next to the local path and
+        only moved into place once the whole archive was read, so nothing is
+        left behind in the local path if the download or the archive fails.
+        """
+        local = self.content.path.local.rstrip("/")
+        staging = f"{local}.hacs_stream"
+        spool_path = f"{staging}.zip"
+        spool = None
+        streaming = True
+
+        def _select(name: str) -> str | None:
+            if (path := member_path(name)) is None:
+                return None
+            return safe_member_path(staging, path)
+
+        def _consume(chunk: bytes) -> None:
+            nonlocal spool, streaming
+            if spool is None:
+                spool = open(spool_path, "wb")  # pylint: disable=consider-using-with
+            spool.write(chunk)
+            if not streaming:
+                return
+            try:
+                extractor.feed(chunk)
+            except HacsStreamingUnsupportedException as exception:
+                self.logger.debug("%s Could not stream %s - %s", self.string, url, exception)
+                streaming = False
+
+        def _close_spool() -> None:
+            if spool is not None:
+                spool.close()
+
+        def _move_into_place(extracted: list[str]) -> list[str]:
+            for root, _, files in os.walk(staging):
+                target = local + root[len(staging) :]
+                os.makedirs(target, exist_ok=True)
+                for file in files:
+                    os.replace(os.path.join(root, file), os.path.join(target, file))
+            return [local + path[len(staging) :] for path in extracted]
+
+        def _cleanup() -> None:
+            _close_spool()
+            shutil.rmtree(staging, True)
+            remove_file(spool_path)
+
+        await self.hacs.hass.async_add_executor_job(_cleanup)
+        extractor = StreamingZipExtractor(_select)
+        progress_callback = self._download_progress_callback()
+        try:
+            result = await self.hacs.async_download_stream(
+                url,
+                _consume,
+                progress_callback=progress_callback,
+                **kwargs,
+            )
+            await self.hacs.hass.async_add_executor_job(_close_spool)
+            if spool is None:
+                return None
 
-            result = await self.hacs.async_save_file(temp_file, filecontent)
+            if result and streaming:
+                try:
+                    await self.hacs.hass.async_add_executor_job(extractor.close)
+                    return await self.hacs.hass.async_add_executor_job(
+                        _move_into_place, extractor.extracted
+                    )
+                except HacsException as exception:
+                    self.logger.debug("%s Could not stream %s - %s", self.string, url, exception)
+
+            await self.hacs.hass.async_add_executor_job(extractor.abort)
+            await self.hacs.hass.async_add_executor_job(shutil.rmtree, staging, True)
+            if not result and not await self.hacs.async_download_file_to_path(
+                url,
+                spool_path,
+                progress_callback=progress_callback,
+                **kwargs,
+            ):
+                raise HacsException(f"Failed to download {url}")
 
-            def _extract_zip_file():
-                with zipfile.ZipFile(temp_file, "r") as zip_file:
-                    zip_file.extractall(self.content.path.local)
+            extracted = await self.hacs.hass.async_add_executor_job(
+                extract_zip_members, spool_path, _select
+            )
+            return await self.hacs.hass.async_add_executor_job(_move_into_place, extracted)
+        finally:
+            await self.hacs.hass.async_add_executor_job(_cleanup)
+
+    def _repository_archive_member_path(self, name: str) -> str | None:
+        """Return the path of a repository archive member in the content, None to skip it."""
+        # Members are in a "<repository>-<ref>/" directory
+        filename = "/".join(name.split("/")[1:])
+        remote = self.content.path.remote
+        if not filename.startswith(remote) or filename == remote:
+            return None
+        filename = filename.replace(remote, "")
+        if filename == "/":
+            # Blank files is not valid, and will start to throw in Python 3.12
+            return None
+        return filename
 
-            await self.hacs.hass.async_add_executor_job(_extract_zip_file)
+    def _download_progress_callback(self) -> Callable[[int, int | None], None]:
+        """Return a callback reporting byte progress of a download to the update entity.
 
-            def cleanup_temp_dir():
-                """Cleanup temp_dir."""
-                if os.path.exists(temp_dir):
-                    self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                    shutil.rmtree(temp_dir)
+        The download step is reported within the 50-70% range of the install progress.
+        """
+        last_progress = None
 
-            if result:
-                self.logger.info("%s Download of %s completed", self.string, content["name"])
-                await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
+        def _progress(downloaded: int, total: int | None) -> None:
+            nonlocal last_progress
+            if not total:
                 return
+            progress = 50 + int(20 * min(downloaded, total) / total)
+            if progress == last_progress:
+                return
+            last_progress = progress
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {
+                    "repository": self.data.full_name,
+                    "progress": progress,
+                    "downloaded": downloaded,
+                    "total": total,
+                },
+            )
 
-            validate.errors.append(f"[{content['name']}] was not downloaded")
-        # lgtm [py/catch-base-exception] pylint: disable=broad-except
-        except BaseException:
-            validate.errors.append("Download was not completed")
+        return _progress
 
     async def download_content(self, version: string | None = None) -> None:
         """Download the content of a directory."""
@@ -662,54 +957,20 @@ class HacsRepository:
         if not ref:
             raise HacsException("Missing required elements.")
 
-        filecontent = await self.hacs.async_download_file(
-            github_archive(repository=self.data.full_name, version=ref, variant="tags"),
-            keep_url=True,
-            nolog=True,
-        )
-
-        if filecontent is None:
-            filecontent = await self.hacs.async_download_file(
-                github_archive(repository=self.data.full_name, version=ref, variant="heads"),
+        for variant in ("tags", "heads"):
+            extracted = await self.async_stream_zip_archive(
+                github_archive(repository=self.data.full_name, version=ref, variant=variant),
+                self._repository_archive_member_path,
                 keep_url=True,
+                nolog=variant == "tags",
             )
-        if filecontent is None:
+            if extracted is not None:
+                break
+        else:
             raise HacsException(f"[{self}] Failed to download zipball")
 
-        temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-        temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-        result = await self.hacs.async_save_file(temp_file, filecontent)
-        if not result:
-            raise HacsException("Could not save ZIP file")
-
-        def _extract_zip_file():
-            with zipfile.ZipFile(temp_file, "r") as zip_file:
-                extractable = []
-                for path in zip_file.filelist:
-                    filename = "/".join(path.filename.split("/")[1:])
-                    if (
-                        filename.startswith(self.content.path.remote)
-                        and filename != self.content.path.remote
-                    ):
-                        path.filename = filename.replace(self.content.path.remote, "")
-                        if path.filename == "/":
-                            # Blank files is not valid, and will start to throw in Python 3.12
-                            continue
-                        extractable.append(path)
-
-                if len(extractable) == 0:
-                    raise HacsException("No content to extract")
-                zip_file.extractall(self.content.path.local, extractable)
-
-        await self.hacs.hass.async_add_executor_job(_extract_zip_file)
-
-        def cleanup_temp_dir():
-            """Cleanup temp_dir."""
-            if os.path.exists(temp_dir):
-                self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                shutil.rmtree(temp_dir)
-
-        await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
+        if not extracted:
+            raise HacsException("No content to extract")
         self.logger.info("%s Content was extracted to %s", self.string, self.content.path.local)
 
     async def async_get_hacs_json(self, ref: str = None) -> dict[str, Any] | None:
@@ -779,6 +1040,13 @@ class HacsRepository:
         await self.async_remove_entity_device()
         ir.async_delete_issue(self.hacs.hass, DOMAIN, f"removed_{self.data.id}")
 
+        if (
+            self.hacs.repositories.is_removed(self.data.full_name)
+            and self.data.full_name not in self.hacs.common.ignored_repositories
+        ):
+            # Removed repositories are only kept while they are installed
+            self.remove()
+
     async def remove_local_directory(self) -> None:
         """Check the local directory."""
 
@@ -919,6 +1187,81 @@ class HacsRepository:
         )
         self.logger.info("%s Post installation steps completed", self.string)
 
+    async def async_install_changed_files(self) -> bool:
+        """Update an installed repository by only downloading files that changed.
+
+        The blob SHAs of the remote tree are compared with the installed files,
+        the new content is staged next to the install location and swapped in
+        with renames. Returns False if this is not possible and a full install
+        is needed, errors while downloading are added to self.validate.
+        """
+        if (
+            not self.data.installed
+            or self.content.single
+            or self.repository_manifest.zip_release
+            or self.content.path.local is None
+            or not await async_exists(self.hacs.hass, self.content.path.local)
+        ):
+            return False
+
+        try:
+            self.tree = await self.get_tree(f"{self.ref}".replace("tags/", ""))
+        except HacsException:
+            return False
+        # The tree is now the one of the installed ref, not of the tracked one, make sure the
+        # next update fetches the tree again instead of reusing this one
+        self.tree_key = None
+        self.treefiles = [treefile.full_path for treefile in self.tree]
+
+        contents = self.gather_files_to_download()
+        if self.repository_manifest.content_in_root and self.repository_manifest.filename:
+            contents = [
+                content
+                for content in contents
+                if content.name == self.repository_manifest.filename
+            ]
+        if not contents or any(content.sha is None for content in contents):
+            return False
+
+        local_files = [(content, self.local_file_path(content)) for content in contents]
+
+        def _changed_files() -> list[FileInformation]:
+            return [
+                content
+                for content, path in local_files
+                if not os.path.isfile(path) or git_blob_sha(path) != content.sha
+            ]
+
+        changed = await self.hacs.hass.async_add_executor_job(_changed_files)
+        if len(changed) == len(contents):
+            return False
+
+        staged = StagedInstall(self.hacs, self.content.path.local)
+        try:
+            await self.hacs.hass.async_add_executor_job(
+                staged.prepare,
+                [path for content, path in local_files if content not in changed],
+            )
+
+            download_queue = QueueManager(hass=self.hacs.hass)
+            for content in changed:
+                download_queue.add(
+                    self.dowload_repository_content(content, staged.staging_path)
+                )
+            await download_queue.execute()
+
+            if self.validate.errors:
+                return True
+
+            await self.hacs.hass.async_add_executor_job(staged.swap)
+        finally:
+            # Nothing is left to clean up after a successful swap
+            await self.hacs.hass.async_add_executor_job(staged.cleanup)
+        self.logger.info(
+            "%s Downloaded %s changed of %s files", self.string, len(changed), len(contents)
+        )
+        return True
+
     async def async_install_repository(self, *, version: str | None = None, **_) -> None:
         """Common installation steps of the repository."""
         persistent_directory = None
@@ -947,52 +1290,59 @@ class HacsRepository:
                     hacs=self.hacs,
                     local_path=f"{
                         self.content.path.local}/{self.repository_manifest.persistent_directory}",
-                    backup_path=tempfile.gettempdir() + "/hacs_persistent_directory/",
+                    backup_path=f"{self.content.path.local.rstrip('/')}.hacs_persistent/",
                 )
                 await self.hacs.hass.async_add_executor_job(persistent_directory.create)
 
-        if self.data.installed and not self.content.single:
-            backup = Backup(hacs=self.hacs, local_path=self.content.path.local)
-            await self.hacs.hass.async_add_executor_job(backup.create)
-
-        self.hacs.log.debug("%s Local path is set to %s", self.string, self.content.path.local)
-        self.hacs.log.debug("%s Remote path is set to %s", self.string, self.content.path.remote)
-        self.hacs.log.debug("%s Version to install: %s", self.string, version_to_install)
-
-        self.hacs.async_dispatch(
-            HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 50},
-        )
+        try:
+            incremental = await self.async_install_changed_files()
+            if not incremental and self.data.installed and not self.content.single:
+                backup = Backup(hacs=self.hacs, local_path=self.content.path.local)
+                await self.hacs.hass.async_add_executor_job(backup.create)
+
+            self.hacs.log.debug("%s Local path is set to %s", self.string, self.content.path.local)
+            self.hacs.log.debug(
+                "%s Remote path is set to %s", self.string, self.content.path.remote
+            )
+            self.hacs.log.debug("%s Version to install: %s", self.string, version_to_install)
 
-        if self.repository_manifest.zip_release and self.repository_manifest.filename:
-            await self.download_zip_files(self.validate)
-        else:
-            await self.download_content(version_to_install)
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {"repository": self.data.full_name, "progress": 50},
+            )
 
-        self.hacs.async_dispatch(
-            HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 70},
-        )
+            if incremental:
+                pass
+            elif self.repository_manifest.zip_release and self.repository_manifest.filename:
+                await self.download_zip_files(self.validate)
+            else:
+                await self.download_content(version_to_install)
 
-        if self.validate.errors:
-            for error in self.validate.errors:
-                self.logger.error("%s %s", self.string, error)
-            if self.data.installed and not self.content.single:
-                await self.hacs.hass.async_add_executor_job(backup.restore)
-                await self.hacs.hass.async_add_executor_job(backup.cleanup)
-            raise HacsException("Could not download, see log for details")
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {"repository": self.data.full_name, "progress": 70},
+            )
 
-        self.hacs.async_dispatch(
-            HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 80},
-        )
+            if self.validate.errors:
+                for error in self.validate.errors:
+                    self.logger.error("%s %s", self.string, error)
+                if not incremental and self.data.installed and not self.content.single:
+                    await self.hacs.hass.async_add_executor_job(backup.restore)
+                    await self.hacs.hass.async_add_executor_job(backup.cleanup)
+                raise HacsException("Could not download, see log for details")
 
-        if self.data.installed and not self.content.single:
-            await self.hacs.hass.async_add_executor_job(backup.cleanup)
+            self.hacs.async_dispatch(
+                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                {"repository": self.data.full_name, "progress": 80},
+            )
 
-        if persistent_directory is not None:
-            await self.hacs.hass.async_add_executor_job(persistent_directory.restore)
-            await self.hacs.hass.async_add_executor_job(persistent_directory.cleanup)
+            if not incremental and self.data.installed and not self.content.single:
+                await self.hacs.hass.async_add_executor_job(backup.cleanup)
+        finally:
+            # Also put the persistent directory back when installing raised
+            if persistent_directory is not None:
+                await self.hacs.hass.async_add_executor_job(persistent_directory.restore)
+                await self.hacs.hass.async_add_executor_job(persistent_directory.cleanup)
 
         if self.validate.success:
             self.data.installed = True
@@ -1053,25 +1403,31 @@ class HacsRepository:
     ) -> None:
         """Common update data."""
         releases = []
+        status = None if force else self.upstream_status
         try:
-            repository_object, etag = await self.async_get_legacy_repository_object(
-                etag=None if force or self.data.installed else self.data.etag_repository,
-            )
-            self.repository_object = repository_object
-            if self.data.full_name.lower() != repository_object.full_name.lower():
-                self.hacs.common.renamed_repositories[self.data.full_name] = (
-                    repository_object.full_name
+            if self.repository_object is not None and self.apply_upstream_status(status):
+                self.logger.debug("%s Using the upstream status", self.string)
+            else:
+                repository_object, etag = await self.async_get_legacy_repository_object(
+                    etag=None if force or self.data.installed else self.data.etag_repository,
                 )
-                if not self.hacs.system.generator:
-                    raise HacsRepositoryExistException
-                self.logger.error(
-                    "%s Repository has been renamed - %s", self.string, repository_object.full_name
+                self.repository_object = repository_object
+                if self.data.full_name.lower() != repository_object.full_name.lower():
+                    self.hacs.common.renamed_repositories[self.data.full_name] = (
+                        repository_object.full_name
+                    )
+                    if not self.hacs.system.generator:
+                        raise HacsRepositoryExistException
+                    self.logger.error(
+                        "%s Repository has been renamed - %s",
+                        self.string,
+                        repository_object.full_name,
+                    )
+                self.data.update_data(
+                    repository_object.attributes,
+                    action=self.hacs.system.action,
                 )
-            self.data.update_data(
-                repository_object.attributes,
-                action=self.hacs.system.action,
-            )
-            self.data.etag_repository = etag
+                self.data.etag_repository = etag
         except HacsNotModifiedException:
             return
         except HacsRepositoryExistException:
@@ -1097,10 +1453,20 @@ class HacsRepository:
                 self.validate.errors.append("Repository has been requested to be removed.")
                 raise HacsException(f"{self} Repository has been requested to be removed.")
 
-        # Get releases.
+        # Get releases, unless the latest ones are the same as last time.
+        if status and self.release_tags is not None:
+            tags = [
+                release["tagName"]
+                for release in upstream_releases(status)
+                if not release["isDraft"]
+            ]
+            if self.release_tags[: len(tags)] == tags and (tags or not self.release_tags):
+                skip_releases = True
+
         if not skip_releases:
             try:
                 releases = await self.get_releases(prerelease=True, returnlimit=30)
+                self.release_tags = [release.tag_name for release in releases]
                 if releases:
                     self.data.prerelease = None
                     for release in releases:
@@ -1125,6 +1491,7 @@ class HacsRepository:
 
             except HacsException:
                 self.data.releases = False
+                self.release_tags = None
 
         if not self.force_branch:
             self.ref = self.version_to_download()
@@ -1143,7 +1510,12 @@ class HacsRepository:
         )
 
         try:
-            self.tree = await self.get_tree(self.ref)
+            tree_key = self.get_tree_key(status)
+            if status and self.tree and tree_key is not None and tree_key == self.tree_key:
+                self.logger.debug("%s Tree of %s did not change", self.string, self.ref)
+            else:
+                self.tree = await self.get_tree(self.ref)
+                self.tree_key = tree_key
             if not self.tree:
                 raise HacsException("No files in tree")
             self.treefiles = []
@@ -1193,7 +1565,10 @@ class HacsRepository:
                 if treefile.filename == self.data.file_name:
                     files.append(
                         FileInformation(
-                            treefile.download_url, treefile.full_path, treefile.filename
+                            treefile.download_url,
+                            treefile.full_path,
+                            treefile.filename,
+                            tree_file_sha(treefile),
                         )
                     )
             return files
@@ -1211,7 +1586,10 @@ class HacsRepository:
                     if not treefile.is_directory:
                         files.append(
                             FileInformation(
-                                treefile.download_url, treefile.full_path, treefile.filename
+                                treefile.download_url,
+                                treefile.full_path,
+                                treefile.filename,
+                                tree_file_sha(treefile),
                             )
                         )
             if files:
@@ -1226,7 +1604,11 @@ class HacsRepository:
             if path.is_directory:
                 continue
             if path.full_path.startswith(self.content.path.remote):
-                files.append(FileInformation(path.download_url, path.full_path, path.filename))
+                files.append(
+                    FileInformation(
+                        path.download_url, path.full_path, path.filename, tree_file_sha(path)
+                    )
+                )
         return files
 
     async def release_contents(self, version: str | None = None) -> list[FileInformation] | None:
@@ -1248,9 +1630,29 @@ class HacsRepository:
             for asset in release.data.get("assets", [])
         ]
 
+    def local_file_path(self, content: FileInformation, local_path: str | None = None) -> str:
+        """Return where a file of the repository is stored locally."""
+        local_path = local_path or self.content.path.local
+        if self.content.single or content.path is None:
+            local_directory = local_path
+
+        else:
+            _content_path = content.path
+            if not self.repository_manifest.content_in_root:
+                _content_path = _content_path.replace(f"{self.content.path.remote}", "")
+
+            local_directory = f"{local_path}/{_content_path}"
+            local_directory = local_directory.split("/")
+            del local_directory[-1]
+            local_directory = "/".join(local_directory)
+
+        return (f"{local_directory}/{content.name}").replace("//", "/")
+
     @concurrent(concurrenttasks=10)
-    async def dowload_repository_content(self, content: FileInformation) -> None:
-        """Download content."""
+    async def dowload_repository_content(
+        self, content: FileInformation, local_path: str | None = None
+    ) -> None:
+        """Download content, into local_path instead of the install location if given."""
         try:
             self.logger.debug("%s Downloading %s", self.string, content.name)
 
@@ -1261,23 +1663,10 @@ class HacsRepository:
                 return
 
             # Save the content of the file.
-            if self.content.single or content.path is None:
-                local_directory = self.content.path.local
-
-            else:
-                _content_path = content.path
-                if not self.repository_manifest.content_in_root:
-                    _content_path = _content_path.replace(f"{self.content.path.remote}", "")
-
-                local_directory = f"{self.content.path.local}/{_content_path}"
-                local_directory = local_directory.split("/")
-                del local_directory[-1]
-                local_directory = "/".join(local_directory)
+            local_file_path = self.local_file_path(content, local_path)
 
             # Check local directory
-            pathlib.Path(local_directory).mkdir(parents=True, exist_ok=True)
-
-            local_file_path = (f"{local_directory}/{content.name}").replace("//", "/")
+            pathlib.Path(local_file_path).parent.mkdir(parents=True, exist_ok=True)
 
             result = await self.hacs.async_save_file(local_file_path, filecontent)
             if result:
@@ -1346,18 +1735,14 @@ class HacsRepository:
         if target_version is None:
             return None
 
-        result = await self.hacs.async_download_file(
+        target_version = target_version.removeprefix("tags/")
+        return await self.hacs.content_cache.async_fetch(
+            f"documentation/{self.data.full_name}/{target_version}/{filename}",
             f"https://raw.githubusercontent.com/{
                 self.data.full_name}/{target_version}/{filename}",
-            nolog=True,
-        )
-
-        return (
-            result.decode(encoding="utf-8")
+            lambda result: result.decode(encoding="utf-8")
             .replace("<svg", "<disabled")
-            .replace("</svg", "</disabled")
-            if result
-            else None
+            .replace("</svg", "</disabled"),
         )
 
     async def get_hacs_json(self, *, version: str, **kwargs) -> HacsManifest | None:
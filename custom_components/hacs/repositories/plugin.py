@@ -9,6 +9,7 @@ from ..enums import HacsCategory, HacsDispatchEvent
 from ..exceptions import HacsException
 from ..utils.decorator import concurrent
 from ..utils.json import json_loads
+from ..utils.plugin_files import file_content_hash
 from .base import HacsRepository
 
 HACSTAG_REPLACER = re.compile(r"\D+")
@@ -159,16 +160,29 @@ class HacsPluginRepository(HacsRepository):
         """Get the dashboard resource namespace."""
         return f"/hacsfiles/{self.data.full_name.split("/")[1]}"
 
-    def generate_dashboard_resource_url(self) -> str:
+    def generate_dashboard_resource_url(self, content_hash: str | None = None) -> str:
         """Get the dashboard resource namespace."""
         filename = self.data.file_name
         if "/" in filename:
             self.logger.warning("%s have defined an invalid file name %s", self.string, filename)
             filename = filename.split("/")[-1]
-        return (
+        url = (
             f"{self.generate_dashboard_resource_namespace()}/{filename}"
             f"?hacstag={self.generate_dashboard_resource_hacstag()}"
         )
+        if content_hash is not None:
+            url += f"&hacshash={content_hash}"
+        return url
+
+    async def async_get_content_hash(self) -> str | None:
+        """Return the content hash of the downloaded file."""
+        if self.content.path.local is None or not self.data.file_name:
+            return None
+        file_path = f"{self.content.path.local}/{self.data.file_name.split('/')[-1]}"
+        try:
+            return await self.hacs.hass.async_add_executor_job(file_content_hash, file_path)
+        except OSError:
+            return None
 
     def _get_resource_handler(self) -> ResourceStorageCollection | None:
         """Get the resource handler."""
@@ -211,7 +225,7 @@ class HacsPluginRepository(HacsRepository):
             await resources.async_load()
 
         namespace = self.generate_dashboard_resource_namespace()
-        url = self.generate_dashboard_resource_url()
+        url = self.generate_dashboard_resource_url(await self.async_get_content_hash())
 
         for entry in resources.async_items():
             if (entry_url := entry["url"]).startswith(namespace):
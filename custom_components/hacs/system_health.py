@@ -42,8 +42,9 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "GitHub API Calls Remaining": response.data.resources.core.remaining,
         "Installed Version": hacs.version,
         "Stage": hacs.stage,
-        "Available Repositories": len(hacs.repositories.list_all),
-        "Downloaded Repositories": len(hacs.repositories.list_downloaded),
+        "Available Repositories": len(hacs.repositories.view_all)
+        + len(hacs.repositories.view_records),
+        "Downloaded Repositories": len(hacs.repositories.view_downloaded),
     }
 
     if hacs.system.disabled:
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+
+from ..base import HacsBase
+
+CONTENT = bytes(range(256)) * 4096  # 1 MiB
+
+
+class FaultyServer:
+    """Serves CONTENT, with faults injected by the test."""
+
+    def __init__(self):
+        self.requests = []
+        # Called with the request and its number, may return a response to send instead
+        self.fault = lambda request, number: None
+
+    async def _handle(self, request):
+        self.requests.append(dict(request.headers))
+        if request.method == "HEAD":
+            return web.Response(
+                headers={"Content-Length": str(len(CONTENT)), "Accept-Ranges": "bytes"}
+            )
+        if (response := await self.fault(request, len(self.requests))) is not None:
+            return response
+        return self.respond(request)
+
+    @staticmethod
+    def respond(request, start=None, end=None):
+        """Answer the range of the request, or start-end if given."""
+        if "Range" not in request.headers and start is None:
+            return web.Response(body=CONTENT)
+        if start is None:
+            first, last = request.headers["Range"][len("bytes="):].split("-")
+            start, end = int(first), int(last) if last else len(CONTENT) - 1
+        return web.Response(
+            status=206,
+            body=CONTENT[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(CONTENT)}"},
+        )
+
+    @staticmethod
+    async def drop(request, after):
+        """Send the start of the answer and close the connection."""
+        response = FaultyServer.respond(request)
+        body = response.body
+        stream = web.StreamResponse(status=response.status, headers=response.headers)
+        stream.content_length = len(body)
+        await stream.prepare(request)
+        await stream.write(body[:after])
+        request.transport.close()
+        return stream
+
+
+class TestDownloadFileToPath(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = FaultyServer()
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.server._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/file.zip"
+
+        loop = asyncio.get_running_loop()
+        self.hacs = HacsBase()
+        self.hacs.hass = SimpleNamespace(
+            async_add_executor_job=lambda target, *args: loop.run_in_executor(None, target, *args)
+        )
+        self.hacs.session = ClientSession()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "file.zip")
+        delay = patch("custom_components.hacs.base.download_retry_delay", return_value=0)
+        delay.start()
+        self.addCleanup(delay.stop)
+
+    async def asyncTearDown(self):
+        await self.hacs.session.close()
+        await self.runner.cleanup()
+        self.directory.cleanup()
+
+    def _read(self):
+        with open(self.path, "rb") as file_handler:
+            return file_handler.read()
+
+    async def test_resume_with_206(self):
+        """A dropped download is resumed from the last byte written."""
+        async def fault(request, number):
+            if number == 1:
+                return await FaultyServer.drop(request, 300000)
+            return None
+
+        self.server.fault = fault
+        self.assertTrue(await self.hacs.async_download_file_to_path(self.url, self.path))
+        self.assertEqual(CONTENT, self._read())
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual("bytes=300000-", self.server.requests[1]["Range"])
+        for headers in self.server.requests:
+            self.assertEqual("identity", headers["Accept-Encoding"])
+
+    async def test_mismatched_content_range(self):
+        """A 206 answer for other bytes than the ones asked for fails the download."""
+        async def fault(request, number):
+            if number == 1:
+                return await FaultyServer.drop(request, 300000)
+            # The right number of bytes, but from the start of the file
+            return FaultyServer.respond(request, 0, len(CONTENT) - 300001)
+
+        self.server.fault = fault
+        self.assertFalse(
+            await self.hacs.async_download_file_to_path(self.url, self.path, nolog=True)
+        )
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    async def test_failing_sibling_segment(self):
+        """A segment that fails cancels the others and nothing is left behind."""
+        started = asyncio.Event()
+
+        async def fault(request, number):
+            if request.headers["Range"].startswith("bytes=0-"):
+                await started.wait()
+                return web.Response(status=404)
+            started.set()
+            # Keep the other segments busy until they are cancelled
+            await asyncio.sleep(0.5)
+            return None
+
+        self.server.fault = fault
+        with patch("custom_components.hacs.base.DOWNLOAD_SEGMENT_MIN_SIZE", 1024):
+            result = await self.hacs.async_download_file_to_path(
+                self.url, self.path, segments=4, nolog=True
+            )
+        self.assertFalse(result)
+        self.assertEqual(5, len(self.server.requests))
+        self.assertEqual([], os.listdir(self.directory.name))
+
+
+if __name__ == '__main__':
+    unittest.main()
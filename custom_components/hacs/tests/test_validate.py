@@ -0,0 +1,125 @@
+import copy
+import unittest
+
+import voluptuous as vol
+
+from ..utils.validate import (
+    VALIDATE_FETCHED_V2_REPO_DATA,
+    VALIDATE_FETCHED_V2_REPO_DATA_COMPILED,
+)
+
+VALID_ENTRY = {
+    "description": "A repository",
+    "downloads": 42,
+    "etag_releases": 'W/"releases"',
+    "etag_repository": 'W/"repository"',
+    "full_name": "owner/repository",
+    "last_commit": "1234567",
+    "last_fetched": 1700000000.5,
+    "last_updated": "2026-01-01T00:00:00Z",
+    "last_version": "1.0.0",
+    "prerelease": "1.1.0b0",
+    "manifest": {"name": "Repository", "country": ["NO", "SE"]},
+    "open_issues": 3,
+    "stargazers_count": 7,
+    "topics": ["home-assistant"],
+}
+
+VALID_INTEGRATION_ENTRY = {
+    **VALID_ENTRY,
+    "domain": "repository",
+    "manifest_name": "Repository",
+}
+
+
+def _changed(entry: dict, **changes) -> dict:
+    """Return a copy of entry with changes applied, a value of ... removes the key."""
+    entry = copy.deepcopy(entry)
+    for key, value in changes.items():
+        if value is ...:
+            entry.pop(key, None)
+        else:
+            entry[key] = value
+    return entry
+
+
+def _variants(entry: dict) -> list:
+    """Entries the validators are expected to agree on, valid and invalid ones."""
+    return [
+        entry,
+        _changed(entry, description=None),
+        _changed(entry, description=1),
+        _changed(entry, downloads=...),
+        _changed(entry, downloads="42"),
+        _changed(entry, downloads=True),
+        _changed(entry, etag_repository=...),
+        _changed(entry, full_name=None),
+        _changed(entry, last_commit=...),
+        _changed(entry, last_version=...),
+        _changed(entry, last_commit=..., last_version=...),
+        _changed(entry, last_commit=1),
+        _changed(entry, last_fetched=1700000000),
+        _changed(entry, last_fetched="1700000000"),
+        _changed(entry, last_fetched=None),
+        _changed(entry, last_updated=...),
+        _changed(entry, manifest=...),
+        _changed(entry, manifest={}),
+        _changed(entry, manifest=None),
+        _changed(entry, manifest={"country": False}),
+        _changed(entry, manifest={"country": True}),
+        _changed(entry, manifest={"country": "NO"}),
+        _changed(entry, manifest={"country": ["NO", 1]}),
+        _changed(entry, manifest={"name": 1}),
+        _changed(entry, manifest={"name": "Repository", "extra": 1}),
+        _changed(entry, topics=[]),
+        _changed(entry, topics="home-assistant"),
+        _changed(entry, topics=["home-assistant", None]),
+        _changed(entry, open_issues=1.5),
+        _changed(entry, extra_key={"anything": 1}),
+        _changed(entry, domain=...),
+        _changed(entry, domain=1),
+        _changed(entry, manifest_name=...),
+        {},
+        {"last_commit": "1234567"},
+    ]
+
+
+class TestCompiledRepoDataValidator(unittest.TestCase):
+
+    def _result(self, validator, data):
+        """Return what the validator returned, or the error it raised."""
+        try:
+            return ("accepted", validator(copy.deepcopy(data)))
+        except vol.Invalid as err:
+            return ("rejected", str(err))
+        except TypeError as err:
+            # Data that is not an object does not reach the schema
+            return ("failed", str(err))
+
+    def test_same_result_as_voluptuous(self):
+        """Every entry is accepted or rejected the same way, with the same error."""
+        for category, validator in VALIDATE_FETCHED_V2_REPO_DATA.items():
+            compiled = VALIDATE_FETCHED_V2_REPO_DATA_COMPILED[category]
+            for entry in _variants(VALID_ENTRY) + _variants(VALID_INTEGRATION_ENTRY):
+                with self.subTest(category=category, entry=entry):
+                    self.assertEqual(self._result(validator, entry), self._result(compiled, entry))
+
+    def test_valid_entries_are_accepted(self):
+        """The reference entries are valid, so the compiled check is what accepts them."""
+        for category, compiled in VALIDATE_FETCHED_V2_REPO_DATA_COMPILED.items():
+            entry = VALID_INTEGRATION_ENTRY if category == "integration" else VALID_ENTRY
+            self.assertIs(entry, compiled(entry))
+
+    def test_non_dict_is_rejected(self):
+        """Data that is not an object fails the same way in both validators."""
+        for category, validator in VALIDATE_FETCHED_V2_REPO_DATA.items():
+            compiled = VALIDATE_FETCHED_V2_REPO_DATA_COMPILED[category]
+            for data in (None, [], "owner/repository"):
+                with self.subTest(category=category, data=data):
+                    result = self._result(validator, data)
+                    self.assertNotEqual("accepted", result[0])
+                    self.assertEqual(result, self._result(compiled, data))
+
+
+if __name__ == '__main__':
+    unittest.main()
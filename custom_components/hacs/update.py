@@ -85,7 +85,10 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
             raise HomeAssistantError(f"Version {self.installed_version} of {
                                      self.repository.data.full_name} is already downloaded")
         try:
-            await self.repository.async_download_repository(ref=version or self.latest_version)
+            await self.hacs.queue.async_run(
+                self.repository.async_download_repository(ref=version or self.latest_version),
+                name=f"Download {self.repository.data.full_name}",
+            )
         except HacsException as exception:
             raise HomeAssistantError(exception) from exception
 
@@ -94,30 +97,14 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
         if self.repository.pending_restart:
             return None
 
-        if self.latest_version not in self.repository.data.published_tags:
-            releases = await self.repository.get_releases(
-                prerelease=self.repository.data.show_beta,
-                returnlimit=self.hacs.configuration.release_limit,
-            )
-            if releases:
-                self.repository.data.releases = True
-                self.repository.releases.objects = releases
-                self.repository.data.published_tags = [x.tag_name for x in releases]
-                self.repository.data.last_version = next(iter(self.repository.data.published_tags))
-
-        release_notes = ""
-        # Compile release notes from installed version up to the latest
-        if self.installed_version in self.repository.data.published_tags:
-            for release in self.repository.releases.objects:
-                if release.tag_name == self.installed_version:
-                    break
-                release_notes += f"# {release.tag_name}"
-                if release.tag_name != release.name:
-                    release_notes += f"  - {release.name}"
-                release_notes += f"\n\n{release.body}"
-                release_notes += "\n\n---\n\n"
-        elif any(self.repository.releases.objects):
-            release_notes += self.repository.releases.objects[0].body
+        cache_key = (
+            f"release_notes/{self.repository.data.full_name}/"
+            f"{self.installed_version}..{self.latest_version}"
+        )
+        if (release_notes := await self.hacs.content_cache.async_get(cache_key)) is None:
+            release_notes = await self._async_compile_release_notes()
+            if release_notes:
+                await self.hacs.content_cache.async_set(cache_key, release_notes)
 
         if self.repository.pending_update:
             if self.repository.data.category == HacsCategory.INTEGRATION:
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import os
 import shutil
-import tempfile
-from time import sleep
 from typing import TYPE_CHECKING
 
 from .path import is_safe
@@ -15,61 +13,52 @@ if TYPE_CHECKING:
     from ..repositories.base import HacsRepository
 
 
-DEFAULT_BACKUP_PATH = f"{tempfile.gettempdir()}/hacs_backup/"
+BACKUP_SUFFIX = ".hacs_backup"
+REPLACED_SUFFIX = ".hacs_replaced"
+
+
+def _remove(path: str) -> None:
+    """Remove a file or directory if it exists."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
 
 
 class Backup:
-    """Backup."""
+    """Backup that moves the content out of the way, and moves it back to restore.
+
+    By default the backup is placed next to the content, on the same
+    filesystem, so creating and restoring it are renames and not copies.
+    """
 
     def __init__(
         self,
         hacs: HacsBase,
         local_path: str | None = None,
-        backup_path: str = DEFAULT_BACKUP_PATH,
+        backup_path: str | None = None,
         repository: HacsRepository | None = None,
     ) -> None:
         """Initialize."""
         self.hacs = hacs
         self.repository = repository
-        self.local_path = local_path or repository.content.path.local
+        self.local_path = (local_path or repository.content.path.local).rstrip("/")
         self.backup_path = backup_path
-        if repository:
-            self.backup_path = (
-                tempfile.gettempdir()
-                + f"/hacs_persistent_{repository.data.category}/"
-                + repository.data.name
-            )
-        self.backup_path_full = f"{self.backup_path}{self.local_path.split('/')[-1]}"
-
-    def _init_backup_dir(self) -> bool:
-        """Init backup dir."""
-        if not os.path.exists(self.local_path):
-            return False
-        if not is_safe(self.hacs, self.local_path):
-            return False
-        if os.path.exists(self.backup_path):
-            shutil.rmtree(self.backup_path)
-
-            # Wait for the folder to be removed
-            while os.path.exists(self.backup_path):
-                sleep(0.1)
-        os.makedirs(self.backup_path, exist_ok=True)
-        return True
+        if self.backup_path is None:
+            self.backup_path_full = f"{self.local_path}{BACKUP_SUFFIX}"
+        else:
+            self.backup_path_full = f"{self.backup_path}{self.local_path.split('/')[-1]}"
 
     def create(self) -> None:
-        """Create a backup in /tmp"""
-        if not self._init_backup_dir():
+        """Move the content to the backup location."""
+        if not os.path.exists(self.local_path) or not is_safe(self.hacs, self.local_path):
             return
 
         try:
-            if os.path.isfile(self.local_path):
-                shutil.copyfile(self.local_path, self.backup_path_full)
-                os.remove(self.local_path)
-            else:
-                shutil.copytree(self.local_path, self.backup_path_full)
-                shutil.rmtree(self.local_path)
-                while os.path.exists(self.local_path):
-                    sleep(0.1)
+            _remove(self.backup_path_full)
+            os.makedirs(os.path.dirname(self.backup_path_full), exist_ok=True)
+            # This is a rename, unless backup_path is on another filesystem
+            shutil.move(self.local_path, self.backup_path_full)
             self.hacs.log.debug(
                 "Backup for %s, created in %s",
                 self.local_path,
@@ -81,30 +70,84 @@ class Backup:
             self.hacs.log.warning("Could not create backup: %s", exception)
 
     def restore(self) -> None:
-        """Restore from backup."""
-        if not os.path.exists(self.backup_path_full):
+        """Move the backup back in place of the content."""
+        if not os.path.lexists(self.backup_path_full):
             return
 
-        if os.path.isfile(self.backup_path_full):
-            if os.path.exists(self.local_path):
-                os.remove(self.local_path)
-            shutil.copyfile(self.backup_path_full, self.local_path)
-        else:
-            if os.path.exists(self.local_path):
-                shutil.rmtree(self.local_path)
-                while os.path.exists(self.local_path):
-                    sleep(0.1)
-            shutil.copytree(self.backup_path_full, self.local_path)
+        replaced = f"{self.local_path}{REPLACED_SUFFIX}"
+        if os.path.lexists(self.local_path):
+            _remove(replaced)
+            os.rename(self.local_path, replaced)
+        try:
+            shutil.move(self.backup_path_full, self.local_path)
+        except OSError:
+            if os.path.lexists(replaced):
+                os.rename(replaced, self.local_path)
+            raise
+        _remove(replaced)
         self.hacs.log.debug("Restored %s, from backup %s", self.local_path, self.backup_path_full)
 
     def cleanup(self) -> None:
         """Cleanup backup files."""
-        if not os.path.exists(self.backup_path):
-            return
+        _remove(self.backup_path_full)
+        if self.backup_path is not None:
+            try:
+                os.rmdir(self.backup_path)
+            except OSError:
+                # Not empty, or already removed
+                pass
+        self.hacs.log.debug("Backup %s cleared", self.backup_path_full)
+
+
+class StagedInstall:
+    """Build the new content of a directory next to it, and swap it in with renames.
 
-        shutil.rmtree(self.backup_path)
+    Files that did not change are hard linked (or copied if that is not
+    possible) from the current directory, so only changed files need to be
+    written. The current directory is kept until the swap succeeded.
+    """
 
-        # Wait for the folder to be removed
-        while os.path.exists(self.backup_path):
-            sleep(0.1)
-        self.hacs.log.debug("Backup dir %s cleared", self.backup_path)
+    def __init__(self, hacs: HacsBase, local_path: str) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self.local_path = local_path.rstrip("/")
+        self.staging_path = f"{self.local_path}.hacs_staging"
+        self.previous_path = f"{self.local_path}.hacs_previous"
+
+    def prepare(self, unchanged: list[str]) -> None:
+        """Create the staging directory with the unchanged files."""
+        for path in (self.staging_path, self.previous_path):
+            _remove(path)
+        os.makedirs(self.staging_path)
+
+        for path in unchanged:
+            for source in (path, f"{path}.gz", f"{path}.br"):
+                if not os.path.isfile(source):
+                    continue
+                target = self.staged_path(source)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copy2(source, target)
+
+    def staged_path(self, path: str) -> str:
+        """Return where path in the local directory is placed in the staging directory."""
+        return self.staging_path + path[len(self.local_path) :]
+
+    def swap(self) -> None:
+        """Replace the local directory with the staging directory."""
+        if not is_safe(self.hacs, self.local_path):
+            raise OSError(f"Refusing to replace {self.local_path}")
+        os.rename(self.local_path, self.previous_path)
+        try:
+            os.rename(self.staging_path, self.local_path)
+        except OSError:
+            os.rename(self.previous_path, self.local_path)
+            raise
+        shutil.rmtree(self.previous_path, ignore_errors=True)
+        self.hacs.log.debug("Swapped in new content for %s", self.local_path)
+
+    def cleanup(self) -> None:
+        """Remove the staging directory."""
+        shutil.rmtree(self.staging_path, ignore_errors=True)
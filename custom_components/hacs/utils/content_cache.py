@@ -0,0 +1,141 @@
+"""Persistent cache for documentation and release notes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from aiohttp import ClientError, ClientTimeout
+from homeassistant.core import callback
+
+from ..const import CONTENT_CACHE_MAX_AGE, CONTENT_CACHE_MAX_SIZE, STORE_SAVE_DELAY
+from ..exceptions import HacsException
+from .logger import LOGGER
+from .store import async_delay_save_to_store, async_load_from_store
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+
+STORE_KEY = "content_cache"
+
+
+class ContentCacheEntry(NamedTuple):
+    """Processed content with the ETag it was fetched with and when it was last checked."""
+
+    content: str
+    etag: str | None
+    checked: float
+
+
+class HacsContentCache:
+    """Size bounded cache of processed text content, persisted to a store.
+
+    Entries are kept in least recently used order, and the least recently used
+    ones are evicted when the size of the cached content is above max_size.
+    Content is processed before it is cached, so that is only done once per entry.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: ClientSession,
+        max_size: int = CONTENT_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._session = session
+        self._max_size = max_size
+        self._entries: OrderedDict[str, ContentCacheEntry] = OrderedDict()
+        self._size = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def _async_load(self) -> None:
+        """Load the cached entries from the store."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                stored = await async_load_from_store(self._hass, STORE_KEY)
+            except HacsException:
+                stored = {}
+            for key, entry in stored.get("entries", {}).items():
+                self._async_set(key, ContentCacheEntry(*entry), save=False)
+            self._loaded = True
+
+    @callback
+    def _async_set(self, key: str, entry: ContentCacheEntry, save: bool = True) -> None:
+        """Add or replace an entry and evict the least recently used ones above the size."""
+        if (previous := self._entries.pop(key, None)) is not None:
+            self._size -= len(previous.content)
+        self._entries[key] = entry
+        self._size += len(entry.content)
+
+        while self._size > self._max_size and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.content)
+
+        if save:
+            async_delay_save_to_store(self._hass, STORE_KEY, self._data_to_save, STORE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the content to store."""
+        return {"entries": {key: list(entry) for key, entry in self._entries.items()}}
+
+    async def async_get(self, key: str) -> str | None:
+        """Return cached content that was checked within the maximum age."""
+        await self._async_load()
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if time.time() - entry.checked > CONTENT_CACHE_MAX_AGE:
+            return None
+        self._entries.move_to_end(key)
+        return entry.content
+
+    async def async_set(self, key: str, content: str) -> None:
+        """Cache content that has no ETag."""
+        await self._async_load()
+        self._async_set(key, ContentCacheEntry(content, None, time.time()))
+
+    async def async_fetch(
+        self,
+        key: str,
+        url: str,
+        process: Callable[[bytes], str],
+    ) -> str | None:
+        """Return the processed content of url, revalidated with the ETag when it is stale.
+
+        If the content can not be fetched the stale content is returned.
+        """
+        if (content := await self.async_get(key)) is not None:
+            return content
+
+        entry = self._entries.get(key)
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        try:
+            response = await self._session.get(
+                url, timeout=ClientTimeout(total=60), headers=headers
+            )
+            if response.status == 304 and entry is not None:
+                self._async_set(key, entry._replace(checked=time.time()))
+                return entry.content
+            if response.status == 404:
+                if (removed := self._entries.pop(key, None)) is not None:
+                    self._size -= len(removed.content)
+                return None
+            response.raise_for_status()
+            body = await response.read()
+        except (TimeoutError, ClientError) as exception:
+            LOGGER.debug("Could not fetch %s - %s", url, exception)
+            return entry.content if entry is not None else None
+
+        content = process(body)
+        self._async_set(key, ContentCacheEntry(content, response.headers.get("ETag"), time.time()))
+        return content
@@ -10,12 +10,13 @@ from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 
 from ..base import HacsBase
-from ..const import HACS_REPOSITORY_ID
+from ..const import HACS_REPOSITORY_ID, STORE_SAVE_DELAY
 from ..enums import HacsDisabledReason, HacsDispatchEvent
-from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
+from ..repositories import REPOSITORY_CLASSES
+from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository, RepositoryRecord
 from .logger import LOGGER
 from .path import is_safe
-from .store import async_load_from_store, async_save_to_store
+from .store import async_delay_save_to_store, async_load_from_store, async_save_to_store
 
 EXPORTED_BASE_DATA = (
     ("new", False),
@@ -62,14 +63,24 @@ class HacsData:
         """Initialize."""
         self.logger = LOGGER
         self.hacs = hacs
-        self.content = {}
+        self.content: dict[str, dict[str, Any]] = {}
+        self.experimental_content: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._revisions: dict[
+            str, tuple[int | RepositoryRecord, HacsManifest | None, int | None]
+        ] = {}
+        hacs.repositories.set_record_factory(self.async_create_from_record)
 
     async def async_force_write(self, _=None):
         """Force write."""
         await self.async_write(force=True)
 
     async def async_write(self, force: bool = False) -> None:
-        """Write content to the store files."""
+        """Write content to the store files.
+
+        Only repositories that changed since the last write are exported again,
+        and unless forced the repository stores are written after a delay so
+        multiple writes in a short time end up as a single one.
+        """
         if not force and self.hacs.system.disabled:
             return
 
@@ -85,34 +96,115 @@ class HacsData:
                 "ignored_repositories": self.hacs.common.ignored_repositories,
             },
         )
-        await self._async_store_experimental_content_and_repos()
-        await self._async_store_content_and_repos()
-
-    async def _async_store_content_and_repos(self, _=None):  # bb: ignore
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_repository_data(repository)
-
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
+
+        changed = self.async_update_content()
+        if force:
+            await async_save_to_store(
+                self.hacs.hass, "data", self._async_experimental_store_data()
+            )
+            await async_save_to_store(self.hacs.hass, "repositories", dict(self.content))
+        elif changed:
+            self.async_schedule_save()
+
         for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
             self.hacs.async_dispatch(event, {})
 
-    async def _async_store_experimental_content_and_repos(self, _=None):
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_experimental_repository_data(repository)
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the exported repositories after a delay."""
+        async_delay_save_to_store(
+            self.hacs.hass, "data", self._async_experimental_store_data, STORE_SAVE_DELAY
+        )
+        async_delay_save_to_store(
+            self.hacs.hass, "repositories", self.content.copy, STORE_SAVE_DELAY
+        )
+
+    @callback
+    def async_remove_repositories(self, repository_ids: list[str]) -> None:
+        """Drop repositories that were removed from HACS from the stores.
+
+        Unlike async_write this does not look at any other repository.
+        """
+        changed = False
+        for repository_id in repository_ids:
+            self._revisions.pop(repository_id, None)
+            self.experimental_content.pop(repository_id, None)
+            if self.content.pop(repository_id, None) is not None:
+                changed = True
+
+        if changed:
+            self.async_schedule_save()
+            self.hacs.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
+
+    @callback
+    def async_update_content(self) -> bool:
+        """Export repositories that changed since the last call, return True if any did."""
+        changed = False
+        current = set()
+
+        for repository in self.hacs.repositories.view_all:
+            if repository.data.category not in self.hacs.common.categories:
+                continue
+            repository_id = str(repository.data.id)
+            current.add(repository_id)
+
+            manifest = repository.repository_manifest
+            revisions = (repository.data.revision, manifest, manifest.revision)
+            if self._revisions.get(repository_id) == revisions:
+                continue
+            self._revisions[repository_id] = revisions
+
+            data = self.async_store_repository_data(repository)
+            experimental = (
+                repository.data.category,
+                self.async_store_experimental_repository_data(repository),
+            )
+            if (
+                self.content.get(repository_id) != data
+                or self.experimental_content.get(repository_id) != experimental
+            ):
+                self.content[repository_id] = data
+                self.experimental_content[repository_id] = experimental
+                changed = True
+
+        for record in self.hacs.repositories.view_records:
+            if record.category not in self.hacs.common.categories:
+                continue
+            current.add(record.id)
+            # Records are replaced when they change, so the identity is enough
+            if self._revisions.get(record.id, (None, None, None))[0] is record:
+                continue
+            self._revisions[record.id] = (record, None, None)
+            self.content[record.id] = record.stored
+            self.experimental_content[record.id] = (
+                record.category,
+                {
+                    key: value
+                    for key, default in EXPORTED_BASE_DATA
+                    if (value := record.stored.get(key, default)) != default
+                },
+            )
+            changed = True
+
+        for repository_id in self._revisions.keys() - current:
+            self._revisions.pop(repository_id)
+            self.content.pop(repository_id, None)
+            self.experimental_content.pop(repository_id, None)
+            changed = True
 
-        await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
+        return changed
+
+    @callback
+    def _async_experimental_store_data(self) -> dict[str, Any]:
+        """Return the content of the experimental data store."""
+        repositories: dict[str, list[dict[str, Any]]] = {}
+        for repository_id, (category, data) in self.experimental_content.items():
+            repositories.setdefault(category, []).append({"id": repository_id, **data})
+        return {"repositories": repositories}
 
     @callback
     def async_store_repository_data(self, repository: HacsRepository) -> dict:
-        """Store the repository data."""
+        """Return the repository data to store."""
         data = {"repository_manifest": repository.repository_manifest.manifest}
 
         for key, default in (
@@ -128,13 +220,12 @@ class HacsData:
         if repository.data.last_fetched:
             data["last_fetched"] = repository.data.last_fetched.timestamp()
 
-        self.content[str(repository.data.id)] = data
+        return data
 
     @callback
-    def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
-        """Store the experimental repository data for non downloaded repositories."""
+    def async_store_experimental_repository_data(self, repository: HacsRepository) -> dict:
+        """Return the experimental repository data to store for non downloaded repositories."""
         data = {}
-        self.content.setdefault(repository.data.category, [])
 
         if repository.data.installed:
             data["repository_manifest"] = repository.repository_manifest.manifest
@@ -151,7 +242,7 @@ class HacsData:
                 if (value := getattr(repository.data, key, default)) != default:
                     data[key] = value
 
-        self.content[repository.data.category].append({"id": str(repository.data.id), **data})
+        return data
 
     async def restore(self):
         """Restore saved data."""
@@ -245,6 +336,14 @@ class HacsData:
                 or self.hacs.repositories.is_registered(repository_id=entry)
             ):
                 continue
+            if (
+                self.hacs.repositories.is_removed(repo_data["full_name"])
+                and repo_data["full_name"] not in self.hacs.common.ignored_repositories
+            ):
+                # Do not add back repositories that were removed from HACS
+                continue
+            if self.async_add_repository_record(entry, repo_data, category):
+                continue
             await self.hacs.async_register_repository(
                 repository_full_name=repo_data["full_name"],
                 category=repo_data.get("category", category),
@@ -255,15 +354,53 @@ class HacsData:
                 # yield to avoid blocking the event loop
                 await asyncio.sleep(0)
 
+    @callback
+    def async_add_repository_record(
+        self, entry: str, repository_data: dict[str, Any], category: str | None = None
+    ) -> bool:
+        """Add a record for a repository that is not downloaded.
+
+        Returns False if the repository needs a repository object instead.
+        """
+        category = repository_data.get("category", category)
+        if (
+            entry == HACS_REPOSITORY_ID
+            or repository_data.get("installed")
+            or category not in REPOSITORY_CLASSES
+        ):
+            return False
+
+        full_name = repository_data["full_name"]
+        full_name = self.hacs.common.renamed_repositories.get(full_name, full_name)
+        if full_name in self.hacs.common.skip:
+            return True
+
+        stored = {**repository_data, "category": category, "full_name": full_name}
+        if "new" not in stored:
+            # Stored repositories only export new when it is set, repositories
+            # from data-v2 are new unless this is a new installation
+            stored["new"] = "category" not in repository_data and not self.hacs.status.new
+        self.hacs.repositories.add_record(RepositoryRecord(entry, full_name, category, stored))
+        return True
+
+    @callback
+    def async_create_from_record(self, record: RepositoryRecord) -> HacsRepository:
+        """Create a repository object from a record."""
+        repository = REPOSITORY_CLASSES[record.category](self.hacs, record.full_name)
+        repository.data.id = record.id
+        self.async_restore_repository_data(repository, record.id, record.stored)
+        return repository
+
     @callback
     def async_restore_repository(self, entry: str, repository_data: dict[str, Any]):
         """Restore repository."""
         repository: HacsRepository | None = None
         if full_name := repository_data.get("full_name"):
-            repository = self.hacs.repositories.get_by_full_name(full_name)
+            repository = self.hacs.repositories.get_by_full_name(full_name, promote=False)
         if not repository:
-            repository = self.hacs.repositories.get_by_id(entry)
+            repository = self.hacs.repositories.get_by_id(entry, promote=False)
         if not repository:
+            # Not registered, or a record that already holds this data
             return
 
         try:
@@ -272,7 +409,13 @@ class HacsData:
             self.logger.warning("<HacsData async_restore_repository> duplicate IDs %s", exception)
             return
 
-        # Restore repository attributes
+        self.async_restore_repository_data(repository, entry, repository_data)
+
+    @callback
+    def async_restore_repository_data(
+        self, repository: HacsRepository, entry: str, repository_data: dict[str, Any]
+    ) -> None:
+        """Restore the stored attributes of a repository."""
         repository.data.authors = repository_data.get("authors", [])
         repository.data.description = repository_data.get("description", "")
         repository.data.downloads = repository_data.get("downloads", 0)
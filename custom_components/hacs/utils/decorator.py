@@ -8,6 +8,8 @@ from functools import wraps
 from typing import TYPE_CHECKING, Any
 
 from ..const import DEFAULT_CONCURRENT_BACKOFF_TIME, DEFAULT_CONCURRENT_TASKS
+from ..enums import QueuePriority
+from .queue_manager import CURRENT_PRIORITY
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -26,6 +28,10 @@ def concurrent(
         async def wrapper(*args, **kwargs) -> None:
             hacs: HacsBase = getattr(args[0], "hacs", None)
 
+            if CURRENT_PRIORITY.get() == QueuePriority.USER:
+                # User actions should not wait behind background work
+                return await function(*args, **kwargs)
+
             async with max_concurrent:
                 result = await function(*args, **kwargs)
                 if (
@@ -0,0 +1,104 @@
+"""Download helpers for HACS."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import hashlib
+import os
+import random
+import re
+from typing import BinaryIO
+
+from ..const import DOWNLOAD_BACKOFF_BASE, DOWNLOAD_BACKOFF_MAX, DOWNLOAD_CHUNK_SIZE
+
+CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+def download_retry_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Return the delay before the next download attempt.
+
+    Uses exponential backoff with jitter, unless the server told us how long to wait.
+    """
+    if retry_after is not None:
+        return min(retry_after, DOWNLOAD_BACKOFF_MAX)
+    delay = min(DOWNLOAD_BACKOFF_MAX, DOWNLOAD_BACKOFF_BASE * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Return the Retry-After header in seconds, if it is set."""
+    value = headers.get("Retry-After")
+    if value is None or not value.isdigit():
+        return None
+    return float(value)
+
+
+def identity_headers(headers: Mapping[str, str] | None) -> dict[str, str]:
+    """Return headers asking for the file as it is, so sizes and ranges refer to its bytes."""
+    return {**(headers or {}), "Accept-Encoding": "identity"}
+
+
+def content_length(headers: Mapping[str, str]) -> int | None:
+    """Return the size of the file from the Content-Length header.
+
+    None if it is not set, or if the response is encoded and the header is
+    the size of the encoded body rather than of the file.
+    """
+    if headers.get("Content-Encoding", "identity").lower() != "identity":
+        return None
+    value = headers.get("Content-Length")
+    if value is None or not value.isdigit():
+        return None
+    return int(value)
+
+
+def content_range(headers: Mapping[str, str]) -> tuple[int, int, int | None] | None:
+    """Return the first byte, last byte and full size from the Content-Range header."""
+    if (match := CONTENT_RANGE.match(headers.get("Content-Range", ""))) is None:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == "*" else int(total)
+
+
+def preallocate_file(path: str, size: int) -> None:
+    """Create (or truncate) path with a size of size bytes."""
+    with open(path, "wb") as file_handler:
+        file_handler.truncate(size)
+
+
+def open_for_range(path: str, offset: int, truncate: bool) -> BinaryIO:
+    """Open path for writing at offset, optionally dropping anything after it.
+
+    Only an open ended range (truncate) creates the file, a bounded range is
+    written into a file that was preallocated and fails if it has been removed.
+    """
+    create = truncate and not os.path.exists(path)
+    file_handler = open(path, "wb" if create else "r+b")  # noqa: SIM115
+    file_handler.seek(offset)
+    if truncate:
+        file_handler.truncate()
+    return file_handler
+
+
+def write_chunks(file_handler: BinaryIO, chunks: list[bytes], close: bool = False) -> None:
+    """Write chunks to file_handler, and close it if close is set."""
+    try:
+        file_handler.writelines(chunks)
+    finally:
+        if close:
+            file_handler.close()
+
+
+def file_sha256(path: str) -> str:
+    """Return the sha256 hex digest of the file at path."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as file_handler:
+        while chunk := file_handler.read(DOWNLOAD_CHUNK_SIZE):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def remove_file(path: str) -> None:
+    """Remove path if it exists."""
+    if os.path.exists(path):
+        os.remove(path)
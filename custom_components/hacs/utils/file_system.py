@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 from typing import TypeAlias
@@ -40,3 +41,13 @@ async def async_remove_directory(
         if missing_ok:
             return
         raise
+
+
+def git_blob_sha(path: StrOrBytesPath) -> str:
+    """Return the SHA git uses for the content of a file (a blob)."""
+    checksum = hashlib.sha1(usedforsecurity=False)
+    checksum.update(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, "rb") as file_handler:
+        while chunk := file_handler.read(64 * 1024):
+            checksum.update(chunk)
+    return checksum.hexdigest()
@@ -1,5 +1,7 @@
 """GitHub GraphQL Queries."""
 
+import json
+
 GET_REPOSITORY_RELEASES = """
 query ($owner: String!, $name: String!, $first: Int!) {
   rateLimit {
@@ -17,3 +19,46 @@ query ($owner: String!, $name: String!, $first: Int!) {
   }
 }
 """
+
+
+def build_repositories_status_query(repositories: list[str], releases: int = 5) -> str:
+    """Return a query for the status of several repositories in one request.
+
+    Each repository is aliased as r<index> in the response, with enough of the
+    repository information, latest releases and default branch commit to
+    update the repository without the REST API when the tree did not change.
+    """
+    entries = []
+    for index, full_name in enumerate(repositories):
+        owner, name = full_name.split("/", 1)
+        entries.append(
+            f"""
+  r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{
+    nameWithOwner
+    description
+    stargazerCount
+    pushedAt
+    isArchived
+    repositoryTopics(first: 20) {{
+      nodes {{
+        topic {{
+          name
+        }}
+      }}
+    }}
+    defaultBranchRef {{
+      name
+      target {{
+        oid
+      }}
+    }}
+    releases(first: {releases}, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+      nodes {{
+        tagName
+        isDraft
+        isPrerelease
+      }}
+    }}
+  }}"""
+        )
+    return "query {\n  rateLimit {\n    cost\n    remaining\n  }" + "".join(entries) + "\n}\n"
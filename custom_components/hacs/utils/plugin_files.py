@@ -0,0 +1,222 @@
+"""Precompressed serving of plugin files."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import gzip
+import hashlib
+from http import HTTPStatus
+import mimetypes
+import os
+import pathlib
+from stat import S_ISREG
+import threading
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView
+
+from ..const import URL_BASE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Encodings in order of preference, with the suffix of the precompressed file
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# Number of files the content hash is kept for
+CONTENT_HASHES_MAX_SIZE = 1024
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    """Write content to path without exposing a partially written file."""
+    temporary = f"{path}.hacs_tmp"
+    with open(temporary, "wb") as file_handler:
+        file_handler.write(content)
+    os.replace(temporary, path)
+
+
+def precompress_file(file_path: str) -> None:
+    """Write gzip and, if brotli is available, brotli compressed copies of a file."""
+    with open(file_path, "rb") as file_handler:
+        content = file_handler.read()
+
+    _write_atomic(f"{file_path}.gz", gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(f"{file_path}.br", brotli.compress(content, quality=11))
+    elif os.path.exists(f"{file_path}.br"):
+        # Do not leave a copy of the previous version behind
+        os.remove(f"{file_path}.br")
+
+
+def file_content_hash(file_path: str | pathlib.Path) -> str:
+    """Return a short hash of the content of a file."""
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as file_handler:
+        while chunk := file_handler.read(1024 * 1024):
+            sha.update(chunk)
+    return sha.hexdigest()[:20]
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the content codings a client accepts."""
+    encodings = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, parameters = part.strip().partition(";")
+        if parameters.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        encodings.add(coding.strip())
+    return encodings
+
+
+class _PluginFileResponse(web.FileResponse):
+    """Send the file that was selected, with the headers it was given.
+
+    FileResponse would pick a precompressed variant and set an ETag from the
+    modification time on its own, here both are decided before, so that
+    stale variants are not served and the content hash ETag is kept.
+    Ranges, HEAD requests and sendfile are handled by FileResponse.
+    """
+
+    def __init__(
+        self, path: pathlib.Path, encoding: str | None, headers: dict[str, str]
+    ) -> None:
+        """Initialize."""
+        super().__init__(path, headers=headers)
+        self._encoding = encoding
+
+    def _get_file_path_stat_encoding(
+        self, accept_encoding: str
+    ) -> tuple[pathlib.Path | None, os.stat_result, str | None]:
+        """Return the selected file, its stat result and content coding."""
+        stat = self._path.stat()
+        return self._path if S_ISREG(stat.st_mode) else None, stat, self._encoding
+
+    @property
+    def etag(self):
+        """Return the ETag."""
+        return super().etag
+
+    @etag.setter
+    def etag(self, value) -> None:
+        """Keep the content hash ETag from the headers."""
+
+
+class HacsPluginFilesView(HomeAssistantView):
+    """Serve files in www/community with a content hash ETag.
+
+    Precompressed .br and .gz files next to the requested file are served
+    when the client accepts them. Requests with a hacshash query parameter
+    (added to dashboard resources) that matches the content hash of the
+    served file are allowed to be cached as immutable, as the URL changes
+    with the content. Other requests, including those with only a hacstag,
+    are revalidated with the ETag. Files are sent from disk, HEAD and Range
+    requests are answered.
+    """
+
+    url = URL_BASE + "/{requested_file:.+}"
+    name = "hacs:plugin_files"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant, path: str, use_cache: bool) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.base_path = pathlib.Path(path).resolve()
+        self.use_cache = use_cache
+        # Content hashes by path with the mtime and size they are valid for,
+        # in least recently used order, shared by the executor threads
+        self._hashes: OrderedDict[str, tuple[tuple[int, int], str]] = OrderedDict()
+        self._hashes_lock = threading.Lock()
+
+    def _resolve(self, requested_file: str) -> pathlib.Path | None:
+        """Return the path of the requested file if it is inside the base path."""
+        try:
+            path = (self.base_path / requested_file).resolve()
+        except (OSError, ValueError):
+            return None
+        if not path.is_relative_to(self.base_path):
+            return None
+        if not path.is_file():
+            with self._hashes_lock:
+                self._hashes.pop(str(path), None)
+            return None
+        return path
+
+    def _content_hash(self, path: pathlib.Path) -> tuple[str, os.stat_result]:
+        """Return the content hash of a file, cached until the file changes."""
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._hashes_lock:
+            if (cached := self._hashes.get(str(path))) is not None and cached[0] == key:
+                self._hashes.move_to_end(str(path))
+                return cached[1], stat
+
+        content_hash = file_content_hash(path)
+        with self._hashes_lock:
+            self._hashes[str(path)] = (key, content_hash)
+            self._hashes.move_to_end(str(path))
+            while len(self._hashes) > CONTENT_HASHES_MAX_SIZE:
+                self._hashes.popitem(last=False)
+        return content_hash, stat
+
+    def _select(
+        self, requested_file: str, encodings: set[str]
+    ) -> tuple[pathlib.Path, str, str | None] | None:
+        """Return the file to serve, its content hash and the content coding."""
+        if (path := self._resolve(requested_file)) is None:
+            return None
+        content_hash, stat = self._content_hash(path)
+
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in encodings:
+                continue
+            variant = path.with_name(path.name + suffix)
+            try:
+                # A variant older than the file was not made from this version of it
+                if variant.stat().st_mtime_ns >= stat.st_mtime_ns:
+                    return variant, content_hash, encoding
+            except OSError:
+                continue
+        return path, content_hash, None
+
+    async def get(self, request: web.Request, requested_file: str) -> web.StreamResponse:
+        """Serve a plugin file."""
+        encodings = accepted_encodings(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        if (
+            selected := await self.hass.async_add_executor_job(
+                self._select, requested_file, encodings
+            )
+        ) is None:
+            raise web.HTTPNotFound
+
+        path, content_hash, encoding = selected
+        etag = f'"{content_hash}-{encoding}"' if encoding else f'"{content_hash}"'
+        headers = {
+            hdrs.ETAG: etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+            hdrs.CACHE_CONTROL: (
+                IMMUTABLE_CACHE_CONTROL
+                if self.use_cache and request.query.get("hacshash") == content_hash
+                else REVALIDATE_CACHE_CONTROL
+            ),
+        }
+
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH, "")
+        if if_none_match.strip() == "*" or etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        content_type, _ = mimetypes.guess_type(requested_file)
+        headers[hdrs.CONTENT_TYPE] = content_type or "application/octet-stream"
+        return _PluginFileResponse(path, encoding, headers)
+
+    async def head(self, request: web.Request, requested_file: str) -> web.StreamResponse:
+        """Answer a HEAD request for a plugin file."""
+        return await self.get(request, requested_file)
@@ -4,23 +4,104 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Coroutine
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import heapq
+import itertools
 import time
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DEFAULT_CONCURRENT_TASKS
+from ..enums import QueuePriority
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+# Priority of the queue task the current coroutine runs in
+CURRENT_PRIORITY: ContextVar[QueuePriority] = ContextVar(
+    "hacs_queue_priority", default=QueuePriority.BACKGROUND
+)
+
+
+@dataclass
+class QueueTask:
+    """A task in the queue."""
+
+    task_id: int
+    coroutine: Coroutine
+    priority: QueuePriority
+    name: str
+    state: str = "pending"  # pending, running, done, failed, cancelled
+    added: float = field(default_factory=time.monotonic)
+    started: float | None = None
+    finished: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the task."""
+        return {
+            "id": self.task_id,
+            "name": self.name,
+            "priority": self.priority.name.lower(),
+            "state": self.state,
+        }
+
+
+class PrioritySemaphore:
+    """A semaphore where waiters with a lower priority value are woken first."""
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: QueuePriority) -> None:
+        """Acquire the semaphore."""
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were woken up but cancelled, hand the slot on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release the semaphore."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
 
 class QueueManager:
-    """The QueueManager class."""
+    """The QueueManager class.
+
+    Tasks are executed in priority order (user actions, then critical, then
+    background), with at most max_concurrent critical and background tasks
+    running at the same time. User tasks do not wait for a slot.
+    Background and critical tasks each use a token from the budget given to
+    execute, which is derived from the remaining GitHub rate limit.
+    """
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self, hass: HomeAssistant, max_concurrent: int = DEFAULT_CONCURRENT_TASKS
+    ) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.queue: list[tuple[int, int, QueueTask]] = []
         self.running = False
+        self._counter = itertools.count(1)
+        self._semaphore = PrioritySemaphore(max_concurrent)
+        self._tasks: dict[int, QueueTask] = {}
+        self._finished = 0
 
     @property
     def pending_tasks(self) -> int:
@@ -32,16 +113,111 @@ class QueueManager:
         """Return a count of pending tasks in the queue."""
         return self.pending_tasks != 0
 
+    @property
+    def progress(self) -> dict[str, Any]:
+        """Return the progress of the queue."""
+        running = [task for task in self._tasks.values() if task.state == "running"]
+        return {
+            "pending": self.pending_tasks,
+            "running": len(running),
+            "finished": self._finished,
+            "tasks": [task.as_dict() for task in self._tasks.values()],
+        }
+
     def clear(self) -> None:
         """Clear the queue."""
+        for _, _, task in self.queue:
+            self._cancel_pending(task)
         self.queue = []
 
-    def add(self, task: Coroutine) -> None:
+    def add(
+        self,
+        task: Coroutine,
+        priority: QueuePriority = QueuePriority.BACKGROUND,
+        name: str | None = None,
+    ) -> QueueTask:
         """Add a task to the queue."""
-        self.queue.append(task)
+        queue_task = QueueTask(
+            task_id=next(self._counter),
+            coroutine=task,
+            priority=priority,
+            name=name or getattr(task, "__qualname__", str(task)),
+        )
+        heapq.heappush(self.queue, (priority, queue_task.task_id, queue_task))
+        self._tasks[queue_task.task_id] = queue_task
+        return queue_task
+
+    def cancel(self, task_id: int) -> bool:
+        """Cancel a task that is still waiting in the queue, return True if it was removed.
+
+        Tasks that have been checked out by execute, and tasks started with
+        async_run, belong to the coroutine awaiting them and are not cancelled.
+        """
+        for index, (_, _, task) in enumerate(self.queue):
+            if task.task_id == task_id:
+                self.queue.pop(index)
+                heapq.heapify(self.queue)
+                self._cancel_pending(task)
+                return True
+        return False
+
+    def _cancel_pending(self, task: QueueTask) -> None:
+        """Mark a task that never started as cancelled."""
+        task.coroutine.close()
+        task.state = "cancelled"
+        self._tasks.pop(task.task_id, None)
+
+    async def _run(self, task: QueueTask) -> Any:
+        """Run a single task once a slot is available, user tasks run right away."""
+        uses_slot = task.priority != QueuePriority.USER
+        if uses_slot:
+            try:
+                await self._semaphore.acquire(task.priority)
+            except asyncio.CancelledError:
+                self._cancel_pending(task)
+                raise
+        token = CURRENT_PRIORITY.set(task.priority)
+        try:
+            task.state = "running"
+            task.started = time.monotonic()
+            result = await task.coroutine
+            task.state = "done"
+            return result
+        except asyncio.CancelledError:
+            task.state = "cancelled"
+            raise
+        except BaseException:
+            task.state = "failed"
+            raise
+        finally:
+            CURRENT_PRIORITY.reset(token)
+            task.finished = time.monotonic()
+            self._finished += 1
+            self._tasks.pop(task.task_id, None)
+            if uses_slot:
+                self._semaphore.release()
+
+    async def async_run(
+        self,
+        task: Coroutine,
+        priority: QueuePriority = QueuePriority.USER,
+        name: str | None = None,
+    ) -> Any:
+        """Run a task now, ahead of everything with a lower priority, and return its result."""
+        queue_task = QueueTask(
+            task_id=next(self._counter),
+            coroutine=task,
+            priority=priority,
+            name=name or getattr(task, "__qualname__", str(task)),
+        )
+        self._tasks[queue_task.task_id] = queue_task
+        return await self._run(queue_task)
 
     async def execute(self, number_of_tasks: int | None = None) -> None:
-        """Execute the tasks in the queue."""
+        """Execute the tasks in the queue.
+
+        number_of_tasks is the token budget for this run, user tasks do not use it.
+        """
         if self.running:
             _LOGGER.debug("<QueueManager> Execution is already running")
             raise HacsExecutionStillInProgress
@@ -52,26 +228,28 @@ class QueueManager:
         self.running = True
 
         _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
+        local_queue: list[QueueTask] = []
+        tokens = number_of_tasks or None
 
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
+        while self.queue:
+            priority, _, task = self.queue[0]
+            if priority != QueuePriority.USER and tokens is not None:
+                if tokens <= 0:
+                    break
+                tokens -= 1
+            heapq.heappop(self.queue)
+            local_queue.append(task)
 
         _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
+        result = await asyncio.gather(
+            *(self._run(task) for task in local_queue), return_exceptions=True
+        )
         for entry in result:
             if isinstance(entry, Exception):
                 _LOGGER.error("<QueueManager> %s", entry)
         end = time.time() - start
 
-        for task in local_queue:
-            self.queue.remove(task)
-
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
             len(local_queue),
@@ -1,6 +1,10 @@
 """Storage handers."""
 
-from homeassistant.helpers.json import JSONEncoder
+from collections.abc import Callable
+import hashlib
+from typing import Any
+
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.util import json as json_util
 
@@ -10,6 +14,9 @@ from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+STORE_CACHE = "hacs_store_cache"
+STORE_HASHES = "hacs_store_hashes"
+
 
 class HACSStore(Store):
     """A subclass of Store that allows multiple loads in the executor."""
@@ -47,24 +54,41 @@ def get_store_for_key(hass, key):
     return _get_store_for_key(hass, key, JSONEncoder)
 
 
+def _get_cached_store_for_key(hass, key):
+    """Return a Store object for the key that is shared between saves."""
+    stores = hass.data.setdefault(STORE_CACHE, {})
+    if (store := stores.get(key)) is None:
+        store = stores[key] = get_store_for_key(hass, key)
+    return store
+
+
+def _content_hash(data) -> bytes:
+    """Return a hash of the serialized data."""
+    return hashlib.sha256(json_bytes(data)).digest()
+
+
 async def async_load_from_store(hass, key):
     """Load the retained data from store and return de-serialized data."""
-    return await get_store_for_key(hass, key).async_load() or {}
+    data = await _get_cached_store_for_key(hass, key).async_load() or {}
+    hass.data.setdefault(STORE_HASHES, {})[key] = await hass.async_add_executor_job(
+        _content_hash, data
+    )
+    return data
 
 
 async def async_save_to_store(hass, key, data):
     """Generate dynamic data to store and save it to the filesystem.
 
-    The data is only written if the content on the disk has changed
-    by reading the existing content and comparing it.
-
-    If the data has changed this will generate two executor jobs
-
-    If the data has not changed this will generate one executor job
+    The data is only written if the content has changed, this is checked
+    against a hash of the content that was last loaded or saved for the key.
+    The hash is computed in the executor, like the store serializes the data
+    when it is written, so data must not be changed while this runs.
     """
-    current = await async_load_from_store(hass, key)
-    if current is None or current != data:
-        await get_store_for_key(hass, key).async_save(data)
+    hashes = hass.data.setdefault(STORE_HASHES, {})
+    content_hash = await hass.async_add_executor_job(_content_hash, data)
+    if hashes.get(key) != content_hash:
+        await _get_cached_store_for_key(hass, key).async_save(data)
+        hashes[key] = content_hash
         return
     _LOGGER.debug(
         "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
@@ -72,6 +96,18 @@ async def async_save_to_store(hass, key, data):
     )
 
 
+def async_delay_save_to_store(
+    hass, key, data_func: Callable[[], Any], delay: float
+) -> None:
+    """Schedule data_func to be stored after delay seconds.
+
+    Calls made before the data is written are coalesced into a single write,
+    and pending writes are flushed when Home Assistant stops.
+    """
+    hass.data.setdefault(STORE_HASHES, {}).pop(key, None)
+    _get_cached_store_for_key(hass, key).async_delay_save(data_func, delay)
+
+
 async def async_remove_store(hass, key):
     """Remove a store element that should no longer be used."""
     if "/" not in key:
@@ -149,6 +149,66 @@ VALIDATE_FETCHED_V2_REPO_DATA = {
     for category, schema in _V2_REPO_SCHEMAS.items()
 }
 
+
+def _compile_check(schema: Any) -> Callable[[Any], bool]:
+    """Compile a plain check for the subset of voluptuous used by the v2 repo schemas.
+
+    The check only answers if a value is valid, it is never more lenient than
+    voluptuous but may be stricter (literals are compared by identity).
+    """
+    if isinstance(schema, type):
+        return lambda value: isinstance(value, schema)
+    if schema is None or isinstance(schema, bool):
+        return lambda value: value is schema
+    if isinstance(schema, vol.Any):
+        checks = tuple(_compile_check(validator) for validator in schema.validators)
+        return lambda value: any(check(value) for check in checks)
+    if isinstance(schema, list) and len(schema) == 1:
+        item_check = _compile_check(schema[0])
+        return lambda value: isinstance(value, list) and all(item_check(item) for item in value)
+    if isinstance(schema, dict):
+        required = tuple(key.schema for key in schema if isinstance(key, vol.Required))
+        checks = {key.schema: _compile_check(validator) for key, validator in schema.items()}
+
+        def _check_dict(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return False
+            for key in required:
+                if key not in value:
+                    return False
+            for key, item in value.items():
+                if (check := checks.get(key)) is not None and not check(item):
+                    return False
+            return True
+
+        return _check_dict
+    raise ValueError(f"Can not compile {schema}")
+
+
+def compile_repo_data_validator(schema: dict[str, Any], extra: int) -> Callable[[Any], Any]:
+    """Return a validator for repo data that checks valid data without voluptuous.
+
+    Data that does not pass the compiled check is handed to the voluptuous
+    validator, so what is accepted, and the errors raised, stay the same.
+    """
+    fallback = validate_repo_data(schema, extra)
+    check = _compile_check(schema)
+
+    def validate_compiled_repo_data(data: Any) -> Any:
+        """Validate repo data."""
+        if check(data) and ("last_commit" in data or "last_version" in data):
+            return data
+        return fallback(data)
+
+    return validate_compiled_repo_data
+
+
+# Compiled variant of VALIDATE_FETCHED_V2_REPO_DATA for large payloads
+VALIDATE_FETCHED_V2_REPO_DATA_COMPILED = {
+    category: compile_repo_data_validator(schema, vol.REMOVE_EXTRA)
+    for category, schema in _V2_REPO_SCHEMAS.items()
+}
+
 # Used when validating repos when generating data, fails on extra keys
 VALIDATE_GENERATED_V2_REPO_DATA = {
     category: vol.Schema({str: validate_repo_data(schema, vol.PREVENT_EXTRA)})
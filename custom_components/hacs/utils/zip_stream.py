@@ -0,0 +1,257 @@
+"""Extract zip archives while they are downloaded."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+import shutil
+import struct
+import zipfile
+import zlib
+
+from ..exceptions import HacsException, HacsStreamingUnsupportedException
+
+LOCAL_FILE_HEADER = struct.Struct("<4sHHHHHIIIHH")
+LOCAL_FILE_SIGNATURE = b"PK\x03\x04"
+DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+# Central directory and end of central directory records, nothing to extract after these
+END_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06")
+
+FLAG_ENCRYPTED = 0x1
+FLAG_DATA_DESCRIPTOR = 0x8
+FLAG_UTF8 = 0x800
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+ZIP64_EXTRA_ID = 0x0001
+ZIP64_LIMIT = 0xFFFFFFFF
+
+
+def safe_member_path(destination: str, name: str) -> str | None:
+    """Return where a member is extracted in destination, None if it would end up outside it.
+
+    Like zipfile, leading slashes are dropped and the name is always placed in destination.
+    """
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".")]
+    if not parts or ".." in parts:
+        return None
+    path = os.path.join(destination, *parts)
+    return f"{path}/" if name.endswith("/") else path
+
+
+def extract_zip_members(path: str, select: Callable[[str], str | None]) -> list[str]:
+    """Extract the members of the zip archive at path, for archives that could not be streamed.
+
+    select works like it does for StreamingZipExtractor. Returns the extracted files.
+    """
+    extracted = []
+    with zipfile.ZipFile(path, "r") as zip_file:
+        for info in zip_file.infolist():
+            if (target := select(info.filename)) is None:
+                continue
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zip_file.open(info) as source, open(target, "wb") as file_handler:
+                shutil.copyfileobj(source, file_handler)
+            extracted.append(target)
+    return extracted
+
+
+def _has_zip64_extra(extra: bytes) -> bool:
+    """Return True if the extra field has a zip64 record."""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, size = struct.unpack_from("<HH", extra, offset)
+        if header_id == ZIP64_EXTRA_ID:
+            return True
+        offset += 4 + size
+    return False
+
+
+class _Member:
+    """State of the member that is being read."""
+
+    def __init__(
+        self,
+        flags: int,
+        method: int,
+        crc: int,
+        remaining: int | None,
+        zip64: bool,
+        target: str | None,
+    ) -> None:
+        self.flags = flags
+        self.method = method
+        self.crc = crc
+        self.remaining = remaining
+        self.zip64 = zip64
+        self.target = target
+        self.file_handler = None
+        self.decompressor = zlib.decompressobj(-15) if method == METHOD_DEFLATED else None
+        self.running_crc = 0
+        self.read_descriptor = False
+
+
+class StreamingZipExtractor:
+    """Extract members of a zip archive from its local file headers as the bytes arrive.
+
+    select is called with the name of every member and returns the path to
+    extract it to, or None to skip it. Skipped members with a known size are
+    never decompressed or written. The CRC of every extracted member is
+    verified. Archives that can not be read front to back (encrypted members,
+    stored members with a data descriptor, zip64 sizes in the local header,
+    other compression methods) raise HacsStreamingUnsupportedException, and
+    need to be extracted from disk.
+
+    This is blocking, feed, close and abort should be called in the executor.
+    """
+
+    def __init__(self, select: Callable[[str], str | None]) -> None:
+        """Initialize."""
+        self._select = select
+        self._buffer = bytearray()
+        self._member: _Member | None = None
+        self._done = False
+        self.extracted: list[str] = []
+
+    def feed(self, data: bytes) -> None:
+        """Process the next bytes of the archive."""
+        if self._done:
+            return
+        self._buffer += data
+        while not self._done and self._step():
+            pass
+
+    def close(self) -> None:
+        """Check that the archive was complete."""
+        self.abort()
+        if not self._done:
+            raise HacsException("The archive ended before the central directory")
+
+    def abort(self) -> None:
+        """Close the member that is being extracted, the archive is not read any further."""
+        if self._member is not None and self._member.file_handler is not None:
+            self._member.file_handler.close()
+
+    def _step(self) -> bool:
+        """Process what is in the buffer, return True if there may be more to process."""
+        if self._member is None:
+            return self._read_header()
+        if self._member.read_descriptor:
+            return self._read_descriptor()
+        return self._read_data()
+
+    def _read_header(self) -> bool:
+        """Read a local file header."""
+        if len(self._buffer) < 4:
+            return False
+        signature = bytes(self._buffer[:4])
+        if signature in END_SIGNATURES:
+            self._done = True
+            self._buffer.clear()
+            return False
+        if signature != LOCAL_FILE_SIGNATURE:
+            raise HacsStreamingUnsupportedException("Unexpected data in the archive")
+        if len(self._buffer) < LOCAL_FILE_HEADER.size:
+            return False
+
+        (_, _, flags, method, _, _, crc, compressed, size, name_length, extra_length) = (
+            LOCAL_FILE_HEADER.unpack_from(self._buffer)
+        )
+        header_length = LOCAL_FILE_HEADER.size + name_length + extra_length
+        if len(self._buffer) < header_length:
+            return False
+
+        name_end = LOCAL_FILE_HEADER.size + name_length
+        raw_name = bytes(self._buffer[LOCAL_FILE_HEADER.size : name_end])
+        extra = bytes(self._buffer[name_end:header_length])
+        del self._buffer[:header_length]
+
+        descriptor = bool(flags & FLAG_DATA_DESCRIPTOR)
+        zip64 = _has_zip64_extra(extra)
+        if flags & FLAG_ENCRYPTED or method not in (METHOD_STORED, METHOD_DEFLATED):
+            raise HacsStreamingUnsupportedException("Unsupported zip member")
+        if (descriptor and method == METHOD_STORED) or (
+            not descriptor and ZIP64_LIMIT in (compressed, size)
+        ):
+            raise HacsStreamingUnsupportedException("The size of a zip member is not known")
+
+        name = raw_name.decode("utf-8" if flags & FLAG_UTF8 else "cp437")
+        target = self._select(name)
+        member = _Member(flags, method, crc, None if descriptor else compressed, zip64, target)
+        if target is not None:
+            if name.endswith("/"):
+                os.makedirs(target, exist_ok=True)
+                member.target = None
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                member.file_handler = open(target, "wb")  # pylint: disable=consider-using-with
+        self._member = member
+        return True
+
+    def _write(self, data: bytes) -> None:
+        """Write data of the current member."""
+        member = self._member
+        if member.decompressor is not None:
+            data = member.decompressor.decompress(data)
+        if member.file_handler is not None:
+            member.running_crc = zlib.crc32(data, member.running_crc)
+            member.file_handler.write(data)
+
+    def _read_data(self) -> bool:
+        """Read the data of the current member."""
+        member = self._member
+        if member.remaining is not None:
+            take = min(len(self._buffer), member.remaining)
+            if take:
+                data = bytes(self._buffer[:take])
+                del self._buffer[:take]
+                member.remaining -= take
+                if member.target is not None:
+                    self._write(data)
+            if member.remaining:
+                return False
+            self._finish(member.crc)
+            return True
+
+        # The size is in a data descriptor, find the end of the deflate stream
+        if not self._buffer:
+            return False
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        output = member.decompressor.decompress(data)
+        if member.file_handler is not None:
+            member.running_crc = zlib.crc32(output, member.running_crc)
+            member.file_handler.write(output)
+        if not member.decompressor.eof:
+            return False
+        self._buffer += member.decompressor.unused_data
+        member.read_descriptor = True
+        return True
+
+    def _read_descriptor(self) -> bool:
+        """Read the data descriptor after the data of the current member."""
+        signature_length = 4 if self._buffer[:4] == DATA_DESCRIPTOR_SIGNATURE else 0
+        length = signature_length + 4 + (16 if self._member.zip64 else 8)
+        if len(self._buffer) < max(length, 4):
+            return False
+        (crc,) = struct.unpack_from("<I", self._buffer, signature_length)
+        del self._buffer[:length]
+        self._finish(crc)
+        return True
+
+    def _finish(self, crc: int) -> None:
+        """Close the current member and verify its CRC."""
+        member = self._member
+        self._member = None
+        if member.file_handler is None:
+            return
+        if member.decompressor is not None:
+            remaining = member.decompressor.flush()
+            member.running_crc = zlib.crc32(remaining, member.running_crc)
+            member.file_handler.write(remaining)
+        member.file_handler.close()
+        if member.running_crc != crc:
+            raise HacsException(f"CRC check failed for {member.target}")
+        self.extracted.append(member.target)
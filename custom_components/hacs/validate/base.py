@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+import hashlib
 from typing import TYPE_CHECKING, Any
 
 from ..exceptions import HacsException
+from ..repositories.base import tree_file_sha
 
 if TYPE_CHECKING:
     from ..enums import HacsCategory
@@ -15,17 +19,102 @@ class ValidationException(HacsException):
     """Raise when there is a validation issue."""
 
 
+async def _async_get_once(
+    values: dict[str, asyncio.Task], key: str, factory: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Return the value of key, created with factory the first time it is requested."""
+    if (task := values.get(key)) is None:
+        task = values[key] = asyncio.get_running_loop().create_task(factory())
+    try:
+        return await task
+    except BaseException:
+        # Do not keep failures around, the next request tries again
+        if values.get(key) is task:
+            values.pop(key)
+        raise
+
+
+class ValidationContext:
+    """Content of a repository shared by the validators that run for it.
+
+    Every file is fetched once for all validators, also when they ask for it
+    at the same time. Values in shared are kept for all repositories.
+    """
+
+    def __init__(
+        self, repository: HacsRepository, shared: dict[str, asyncio.Task] | None = None
+    ) -> None:
+        self.repository = repository
+        self._values: dict[str, asyncio.Task] = {}
+        self._shared: dict[str, asyncio.Task] = {} if shared is None else shared
+
+    @property
+    def filenames(self) -> list[str]:
+        """Return the filenames in the tree of the repository."""
+        return [treefile.filename for treefile in self.repository.tree]
+
+    @property
+    def content_key(self) -> str | None:
+        """Return what identifies the content that is validated, None if it is not known.
+
+        This is a digest of the blob SHAs in the tree, so it is the same for
+        every ref (branch, tag or commit) with the same content.
+        """
+        entries = []
+        for treefile in self.repository.tree:
+            if (sha := tree_file_sha(treefile)) is None:
+                return None
+            entries.append(f"{treefile.full_path}:{sha}")
+        if not entries:
+            return None
+        digest = hashlib.sha1("\n".join(sorted(entries)).encode(), usedforsecurity=False)
+        data = self.repository.data
+        return f"{data.category}/{data.full_name}/{digest.hexdigest()}"
+
+    async def async_get_hacs_json(self) -> dict[str, Any] | None:
+        """Return the content of hacs.json."""
+        return await _async_get_once(
+            self._values,
+            "hacs_json",
+            lambda: self.repository.async_get_hacs_json(self.repository.ref),
+        )
+
+    async def async_get_info_file_contents(self) -> str:
+        """Return the content of the information file."""
+        return await _async_get_once(
+            self._values,
+            "info",
+            lambda: self.repository.async_get_info_file_contents(version=self.repository.ref),
+        )
+
+    async def async_get_integration_manifest(self) -> dict[str, Any] | None:
+        """Return the content of the integration manifest."""
+        return await _async_get_once(
+            self._values,
+            "integration_manifest",
+            lambda: self.repository.get_integration_manifest(version=self.repository.ref),
+        )
+
+    async def async_get_shared(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a value that is the same for all repositories."""
+        return await _async_get_once(self._shared, key, factory)
+
+
 class ActionValidationBase:
     """Base class for action validation."""
 
     categories: tuple[HacsCategory, ...] = ()
     allow_fork: bool = True
+    # The result only depends on the content of the repository, and can be reused for it
+    cache_by_content: bool = False
     more_info: str = "https://hacs.xyz/docs/publish/action"
 
     def __init__(self, repository: HacsRepository) -> None:
         self.hacs = repository.hacs
         self.repository = repository
+        self.context = ValidationContext(repository)
         self.failed = False
+        self.error: str | None = None
 
     @property
     def slug(self) -> str:
@@ -38,17 +127,25 @@ class ActionValidationBase:
     async def execute_validation(self, *_: Any, **__: Any) -> None:
         """Execute the task defined in subclass."""
         self.failed = False
+        self.error = None
 
         try:
             await self.async_validate()
         except ValidationException as exception:
-            self.failed = True
+            self.set_result(str(exception))
+        else:
+            self.set_result(None)
+
+    def set_result(self, error: str | None) -> None:
+        """Set and log the result of the validation, error is None if it passed."""
+        self.failed = error is not None
+        self.error = error
+        if self.failed:
             self.hacs.log.error(
                 "<Validation %s> failed:  %s (More info: %s )",
                 self.slug,
-                exception,
+                error,
                 self.more_info,
             )
-
         else:
             self.hacs.log.info("<Validation %s> completed", self.slug)
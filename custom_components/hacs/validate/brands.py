@@ -25,11 +25,14 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-
-        response = await self.hacs.session.get(URL)
-        content = await response.json()
+        content = await self.context.async_get_shared("brands", self._async_get_brands)
 
         if self.repository.data.domain not in content["custom"]:
             raise ValidationException(
                 "The repository has not been added as a custom domain to the brands repo"
             )
+
+    async def _async_get_brands(self) -> dict:
+        """Return the domains in the brands repository."""
+        response = await self.hacs.session.get(URL)
+        return await response.json()
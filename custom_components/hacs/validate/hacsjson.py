@@ -18,13 +18,14 @@ class Validator(ActionValidationBase):
     """Validate the repository."""
 
     more_info = "https://hacs.xyz/docs/publish/include#check-hacs-manifest"
+    cache_by_content = True
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        if RepositoryFile.HACS_JSON not in [x.filename for x in self.repository.tree]:
+        if RepositoryFile.HACS_JSON not in self.context.filenames:
             raise ValidationException(f"The repository has no '{RepositoryFile.HACS_JSON}' file")
 
-        content = await self.repository.async_get_hacs_json(self.repository.ref)
+        content = await self.context.async_get_hacs_json()
         try:
             hacsjson = HacsManifest.from_dict(HACS_MANIFEST_JSON_SCHEMA(content))
         except Invalid as exception:
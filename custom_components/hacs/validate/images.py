@@ -21,10 +21,11 @@ class Validator(ActionValidationBase):
 
     categories = (HacsCategory.PLUGIN, HacsCategory.THEME)
     more_info = "https://hacs.xyz/docs/publish/include#check-images"
+    cache_by_content = True
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        info = await self.repository.async_get_info_file_contents(version=self.repository.ref)
+        info = await self.context.async_get_info_file_contents()
         for line in info.split("\n"):
             if "<img" in line or "![" in line:
                 if [ignore for ignore in IGNORED if ignore in line]:
@@ -17,10 +17,11 @@ class Validator(ActionValidationBase):
     """Validate the repository."""
 
     more_info = "https://hacs.xyz/docs/publish/include#check-info"
+    cache_by_content = True
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        filenames = [x.filename.lower() for x in self.repository.tree]
+        filenames = [filename.lower() for filename in self.context.filenames]
         if "readme" in filenames:
             pass
         elif "readme.md" in filenames:
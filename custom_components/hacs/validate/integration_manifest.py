@@ -24,15 +24,16 @@ class Validator(ActionValidationBase):
     repository: HacsIntegrationRepository
     more_info = "https://hacs.xyz/docs/publish/include#check-manifest"
     categories = (HacsCategory.INTEGRATION,)
+    cache_by_content = True
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        if RepositoryFile.MAINIFEST_JSON not in [x.filename for x in self.repository.tree]:
+        if RepositoryFile.MAINIFEST_JSON not in self.context.filenames:
             raise ValidationException(
                 f"The repository has no '{RepositoryFile.MAINIFEST_JSON}' file"
             )
 
-        content = await self.repository.get_integration_manifest(version=self.repository.ref)
+        content = await self.context.async_get_integration_manifest()
         try:
             INTEGRATION_MANIFEST_JSON_SCHEMA(content)
         except Invalid as exception:
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from importlib import import_module
 import os
 from pathlib import Path
+import time
+from types import ModuleType
 from typing import TYPE_CHECKING
 
+from ..const import VALIDATION_RESULTS_MAX_SIZE, VALIDATION_SHARED_MAX_AGE
+from .base import ValidationContext
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -16,6 +22,16 @@ if TYPE_CHECKING:
     from .base import ActionValidationBase
 
 
+def _import_validator_modules() -> list[ModuleType]:
+    """Import all validator modules."""
+    validator_files = Path(__file__).parent
+    return [
+        import_module(f"{__package__}.{module.stem}")
+        for module in sorted(validator_files.glob("*.py"))
+        if module.name not in ("base.py", "__init__.py", "manager.py")
+    ]
+
+
 class ValidationManager:
     """Hacs validation manager."""
 
@@ -24,6 +40,14 @@ class ValidationManager:
         self.hacs = hacs
         self.hass = hass
         self._validators: dict[str, ActionValidationBase] = {}
+        self._modules: list[ModuleType] | None = None
+        # Values shared by the validators of all repositories, dropped together
+        # once they are older than VALIDATION_SHARED_MAX_AGE
+        self._shared: dict[str, asyncio.Task] = {}
+        self._shared_created: float | None = None
+        # Errors of validators that only depend on the content, by slug and content key,
+        # in least recently used order
+        self._results: OrderedDict[tuple[str, str], str | None] = OrderedDict()
 
     @property
     def validators(self) -> list[ActionValidationBase]:
@@ -32,20 +56,24 @@ class ValidationManager:
 
     async def async_load(self, repository: HacsRepository) -> None:
         """Load all tasks."""
+        if self._modules is None:
+            self._modules = await self.hass.async_add_executor_job(_import_validator_modules)
+
+        now = time.monotonic()
+        created = self._shared_created
+        if created is None or now - created > VALIDATION_SHARED_MAX_AGE:
+            self._shared = {}
+            self._shared_created = now
+
         self._validators = {}
-        validator_files = Path(__file__).parent
-        validator_modules = (
-            module.stem
-            for module in validator_files.glob("*.py")
-            if module.name not in ("base.py", "__init__.py", "manager.py")
-        )
+        context = ValidationContext(repository, self._shared)
 
-        async def _load_module(module: str) -> None:
-            task_module = import_module(f"{__package__}.{module}")
+        async def _setup_validator(task_module: ModuleType) -> None:
             if task := await task_module.async_setup_validator(repository=repository):
+                task.context = context
                 self._validators[task.slug] = task
 
-        await asyncio.gather(*[_load_module(task) for task in validator_modules])
+        await asyncio.gather(*[_setup_validator(module) for module in self._modules])
 
     async def async_run_repository_checks(self, repository: HacsRepository) -> None:
         """Run all validators for a repository."""
@@ -69,7 +97,28 @@ class ValidationManager:
             )
         ]
 
-        await asyncio.gather(*[validator.execute_validation() for validator in validators])
+        content_key = validators[0].context.content_key if validators else None
+        to_run = []
+        for validator in validators:
+            if validator.cache_by_content and (validator.slug, content_key) in self._results:
+                repository.logger.debug(
+                    "%s Using the result of %s for the same content",
+                    repository.string,
+                    validator.slug,
+                )
+                self._results.move_to_end((validator.slug, content_key))
+                validator.set_result(self._results[(validator.slug, content_key)])
+            else:
+                to_run.append(validator)
+
+        await asyncio.gather(*[validator.execute_validation() for validator in to_run])
+
+        if content_key is not None:
+            for validator in to_run:
+                if validator.cache_by_content:
+                    self._results[(validator.slug, content_key)] = validator.error
+            while len(self._results) > VALIDATION_RESULTS_MAX_SIZE:
+                self._results.popitem(last=False)
 
         total = len(validators)
         failed = len([x for x in validators if x.failed])
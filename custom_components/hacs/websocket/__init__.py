@@ -40,6 +40,7 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
     """Register_commands."""
     websocket_api.async_register_command(hass, hacs_info)
     websocket_api.async_register_command(hass, hacs_subscribe)
+    websocket_api.async_register_command(hass, hacs_queue_cancel)
 
     websocket_api.async_register_command(hass, hacs_repository_info)
     websocket_api.async_register_command(hass, hacs_repository_download)
@@ -114,6 +115,7 @@ async def hacs_info(
                 "dev": hacs.configuration.dev,
                 "disabled_reason": hacs.system.disabled_reason,
                 "has_pending_tasks": hacs.queue.has_pending_tasks,
+                "queue": hacs.queue.progress,
                 "lovelace_mode": hacs.core.lovelace_mode,
                 "stage": hacs.stage,
                 "startup": hacs.status.startup,
@@ -121,3 +123,23 @@ async def hacs_info(
             },
         )
     )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hacs/queue/cancel",
+        vol.Required("task"): int,
+    }
+)
+@websocket_api.require_admin
+@websocket_api.async_response
+async def hacs_queue_cancel(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Cancel a task that is waiting in the queue."""
+    hacs: HacsBase = hass.data.get(DOMAIN)
+    connection.send_message(
+        websocket_api.result_message(msg["id"], hacs.queue.cancel(msg["task"]))
+    )
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import sys
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import websocket_api
+from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
@@ -18,12 +20,131 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository, RepositoryRecord
+
+
+REPOSITORIES_LIST_CACHE = "hacs_repositories_list_cache"
+REPOSITORIES_LIST_SORT_KEYS = {
+    "downloads": lambda row: row["downloads"] or 0,
+    "full_name": lambda row: row["full_name"].lower(),
+    "last_updated": lambda row: str(row["last_updated"] or ""),
+    "name": lambda row: str(row["name"]).lower(),
+    "stars": lambda row: row["stars"] or 0,
+}
+
+
+def _repository_row_key(hacs: HacsBase, repo: HacsRepository) -> tuple:
+    """Return what the serialized row of a repository depends on."""
+    return (
+        repo.data.revision,
+        repo.repository_manifest,
+        repo.repository_manifest.revision,
+        hacs.repositories.is_default(str(repo.data.id)),
+        hacs.configuration.country,
+        repo.content.path.local,
+        repo.pending_restart,
+        repo.state,
+    )
+
+
+def _record_row_key(hacs: HacsBase, record: RepositoryRecord) -> tuple:
+    """Return what the serialized row of a repository record depends on."""
+    return (record, hacs.repositories.is_default(record.id), hacs.configuration.country)
+
+
+def _repository_row(hacs: HacsBase, repo: HacsRepository) -> dict[str, Any] | None:
+    """Serialize a repository for the list, None if it should not be listed."""
+    if repo.ignored_by_country_configuration or not repo.data.last_fetched:
+        return None
+    return {
+        "authors": repo.data.authors,
+        "available_version": repo.display_available_version,
+        "installed_version": repo.display_installed_version,
+        "config_flow": repo.data.config_flow,
+        "can_download": repo.can_download,
+        "category": repo.data.category,
+        "country": repo.repository_manifest.country,
+        "custom": not hacs.repositories.is_default(str(repo.data.id)),
+        "description": repo.data.description,
+        "domain": repo.data.domain,
+        "downloads": repo.data.downloads,
+        "file_name": repo.data.file_name,
+        "full_name": repo.data.full_name,
+        "hide": repo.data.hide,
+        "homeassistant": repo.repository_manifest.homeassistant,
+        "id": repo.data.id,
+        "installed": repo.data.installed,
+        "last_updated": repo.data.last_updated,
+        "local_path": repo.content.path.local,
+        "name": repo.display_name,
+        "new": repo.data.new,
+        "pending_upgrade": repo.pending_update,
+        "stars": repo.data.stargazers_count,
+        "state": repo.state,
+        "status": repo.display_status,
+        "topics": repo.data.topics,
+    }
+
+
+class RepositoriesListCache:
+    """Serialized repository rows, only rebuilt for repositories that changed.
+
+    Every change is stamped with a revision from a counter, which lets clients
+    ask for what changed since the revision of their last response.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Start from the wall clock so revisions from before a restart are always older
+        self.revision = int(time.time() * 1000)
+        self.rows: dict[str, tuple[tuple, int, dict[str, Any] | None]] = {}
+        self.removed: dict[str, int] = {}
+
+    @callback
+    def async_update(self, hacs: HacsBase) -> None:
+        """Rebuild the rows of repositories that changed since the last update."""
+        current = set()
+        for repo in hacs.repositories.view_all:
+            repo_id = str(repo.data.id)
+            current.add(repo_id)
+            key = _repository_row_key(hacs, repo)
+            if (cached := self.rows.get(repo_id)) is not None and cached[0] == key:
+                continue
+            self.revision += 1
+            self.rows[repo_id] = (key, self.revision, _repository_row(hacs, repo))
+            self.removed.pop(repo_id, None)
+
+        for record in hacs.repositories.view_records:
+            current.add(record.id)
+            key = _record_row_key(hacs, record)
+            if (cached := self.rows.get(record.id)) is not None and cached[0] == key:
+                continue
+            self.revision += 1
+            # The repository object is only needed to serialize the row
+            self.rows[record.id] = (
+                key,
+                self.revision,
+                _repository_row(hacs, hacs.data.async_create_from_record(record)),
+            )
+            self.removed.pop(record.id, None)
+
+        for repo_id in self.rows.keys() - current:
+            self.revision += 1
+            self.rows.pop(repo_id)
+            self.removed[repo_id] = self.revision
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repositories/list",
         vol.Optional("categories"): [str],
+        vol.Optional("since_revision"): int,
+        vol.Optional("search"): str,
+        vol.Optional("installed"): bool,
+        vol.Optional("sort_by"): vol.In(REPOSITORIES_LIST_SORT_KEYS),
+        vol.Optional("sort_descending", default=False): bool,
+        vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.require_admin
@@ -33,45 +154,67 @@ async def hacs_repositories_list(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """List repositories."""
+    """List repositories.
+
+    Without any of the paging, filtering or since_revision options the full
+    list is returned, as it always has been. With them the result is an
+    object with the current revision, the total number of matches, a page of
+    rows and, for since_revision, the ids of rows that were removed.
+    """
     hacs: HacsBase = hass.data.get(DOMAIN)
+    if (cache := hass.data.get(REPOSITORIES_LIST_CACHE)) is None:
+        cache = hass.data[REPOSITORIES_LIST_CACHE] = RepositoriesListCache()
+    cache.async_update(hacs)
+
+    categories = set(msg.get("categories", hacs.common.categories))
+    since = msg.get("since_revision")
+    if since is not None and since > cache.revision:
+        # The client has a revision from another cache, it needs everything
+        since = None
+
+    removed = []
+    rows = []
+    for repo_id, (_, changed, row) in cache.rows.items():
+        if since is not None and changed <= since:
+            continue
+        if row is None or row["category"] not in categories:
+            if since is not None:
+                removed.append(repo_id)
+            continue
+        rows.append(row)
+
+    if not any(
+        key in msg for key in ("since_revision", "search", "installed", "sort_by", "limit")
+    ):
+        connection.send_message(websocket_api.result_message(msg["id"], rows))
+        return
+
+    if since is not None:
+        removed.extend(repo_id for repo_id, changed in cache.removed.items() if changed > since)
+    if (search := msg.get("search", "").lower()) != "":
+        rows = [
+            row
+            for row in rows
+            if search in str(row["name"]).lower()
+            or search in row["full_name"].lower()
+            or search in (row["description"] or "").lower()
+        ]
+    if (installed := msg.get("installed")) is not None:
+        rows = [row for row in rows if row["installed"] == installed]
+    if sort_by := msg.get("sort_by"):
+        rows.sort(key=REPOSITORIES_LIST_SORT_KEYS[sort_by], reverse=msg["sort_descending"])
+
+    offset = msg["offset"]
+    limit = msg.get("limit")
     connection.send_message(
         websocket_api.result_message(
             msg["id"],
-            [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-                and repo.data.last_fetched
-            ],
+            {
+                "revision": cache.revision,
+                "total": len(rows),
+                "repositories": rows[offset : offset + limit if limit else None],
+                "removed": removed,
+            },
         )
     )
 
@@ -98,13 +241,22 @@ async def hacs_repositories_clear_new(
         repository.data.new = False
 
     else:
-        for repo in hacs.repositories.list_all:
-            if repo.data.new and repo.data.category in msg.get("categories", []):
-                hacs.log.debug(
-                    "Clearing new flag from '%s'",
-                    repo.data.full_name,
+        for category in msg.get("categories", []):
+            for repo in hacs.repositories.view_category(category):
+                if repo.data.new:
+                    hacs.log.debug(
+                        "Clearing new flag from '%s'",
+                        repo.data.full_name,
+                    )
+                    repo.data.new = False
+            for record in [
+                record
+                for record in hacs.repositories.view_records
+                if record.category == category and record.stored.get("new")
+            ]:
+                hacs.repositories.add_record(
+                    record._replace(stored={**record.stored, "new": False})
                 )
-                repo.data.new = False
     hacs.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
     await hacs.data.async_write()
     connection.send_message(websocket_api.result_message(msg["id"]))
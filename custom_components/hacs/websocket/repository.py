@@ -231,7 +231,10 @@ async def hacs_repository_download(
 
     try:
         was_installed = repository.data.installed
-        await repository.async_download_repository(ref=msg.get("version"))
+        await hacs.queue.async_run(
+            repository.async_download_repository(ref=msg.get("version")),
+            name=f"Download {repository.data.full_name}",
+        )
         if not was_installed:
             hacs.async_dispatch(HacsDispatchEvent.RELOAD, {"force": True})
             await hacs.async_recreate_entities()
@@ -291,7 +294,7 @@ async def hacs_repository_refresh(
     await repository.update_repository(ignore_issues=True, force=True)
     await hacs.data.async_write()
     # Update state of update entity
-    hacs.coordinators[repository.data.category].async_update_listeners()
+    hacs.async_update_category_listeners(repository.data.category)
 
     connection.send_message(websocket_api.result_message(msg["id"], {}))
 
@@ -0,0 +1,566 @@
+"""Offline startup benchmark for HACS.
+
+Builds synthetic catalogs of repositories, stores them the way a previous run
+would have, serves the matching data-v2 content from a local HTTP stub and runs
+the HACS startup phases against a bare Home Assistant instance in a temporary
+config directory. Nothing is sent to the internet, requests for hosts the stub
+does not know are answered with 404 and counted.
+
+For every phase the wall time, the peak memory traced while it ran and how
+often and for how long the event loop was blocked are reported. It also
+reports the memory used by repositories that are not downloaded, kept as
+RepositoryRecord entries and as the repository objects created from them,
+and compares the compiled data-v2 repository validator with the voluptuous one
+on a large data.json, either synthetic or recorded ones passed with --data-json.
+
+Run it from the root of the configuration directory, with Home Assistant and
+the HACS requirements installed:
+
+    python scripts/hacs_startup_benchmark.py
+    python scripts/hacs_startup_benchmark.py --sizes 1000 20000 --records 10000 --json
+    python scripts/hacs_startup_benchmark.py --sizes --records 0 --data-json integration/data.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import gc
+import json
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, web
+from awesomeversion import AwesomeVersion
+import voluptuous as vol
+from yarl import URL
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from custom_components.hacs.base import HacsBase  # noqa: E402
+from custom_components.hacs.const import HACS_REPOSITORY_ID, VERSION_STORAGE  # noqa: E402
+from custom_components.hacs.data_client import HacsDataClient  # noqa: E402
+from custom_components.hacs.enums import HacsGitHubRepo, HacsStage  # noqa: E402
+from custom_components.hacs.utils.data import HacsData  # noqa: E402
+from custom_components.hacs.utils.queue_manager import QueueManager  # noqa: E402
+from custom_components.hacs.utils.validate import (  # noqa: E402
+    VALIDATE_FETCHED_V2_REPO_DATA,
+    VALIDATE_FETCHED_V2_REPO_DATA_COMPILED,
+)
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 20000)
+DEFAULT_RECORDS = 10000
+DEFAULT_VALIDATE = 20000
+# Every how many entries one is made invalid, so the voluptuous fallback is part of the run
+INVALID_EVERY = 50
+VALIDATE_ROUNDS = 3
+# Share of the catalog in each category, roughly the split of the default repositories
+CATEGORY_SHARES = (("integration", 0.6), ("plugin", 0.33), ("template", 0.07))
+DOWNLOADED = 25
+REMOVED = 200
+# How often the event loop is sampled, and how late a sample must be to count as blocked
+LOOP_SAMPLE_INTERVAL = 0.01
+LOOP_BLOCKED_THRESHOLD = 0.05
+
+
+def build_catalog(size: int) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return data-v2 content for size repositories, by category."""
+    catalog: dict[str, dict[str, dict[str, Any]]] = {}
+    repository_id = 1_000_000
+    for category, share in CATEGORY_SHARES:
+        entries = catalog[category] = {}
+        for index in range(int(size * share)):
+            repository_id += 1
+            entry = {
+                "description": f"Synthetic {category} repository number {index}",
+                "downloads": index % 5000,
+                "etag_repository": f'W/"{repository_id:040x}"',
+                "full_name": f"benchmark-{category}/repository-{index}",
+                "last_commit": f"{repository_id:07x}",
+                "last_fetched": 1_700_000_000.0 + index,
+                "last_updated": "2026-01-01T00:00:00Z",
+                "last_version": f"1.{index % 30}.{index % 7}",
+                "manifest": {"name": f"Repository {index}"},
+                "stargazers_count": index % 900,
+                "topics": ["home-assistant", category],
+            }
+            if category == "integration":
+                entry["domain"] = f"repository_{index}"
+                entry["manifest_name"] = f"Repository {index}"
+            entries[str(repository_id)] = entry
+    return catalog
+
+
+def build_removed(catalog: dict[str, dict[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Return the data-v2 list of removed repositories, some of them in the catalog."""
+    names = [entry["full_name"] for entry in catalog["plugin"].values()]
+    return [
+        {"removal_type": "archived", "repository": name, "reason": "Benchmark"}
+        for name in names[-REMOVED:]
+    ]
+
+
+def build_stored_repositories(
+    catalog: dict[str, dict[str, dict[str, Any]]],
+) -> dict[str, dict[str, Any]]:
+    """Return the repositories store of a previous run, with a few downloaded repositories."""
+    stored: dict[str, dict[str, Any]] = {
+        HACS_REPOSITORY_ID: {
+            "category": "integration",
+            "full_name": HacsGitHubRepo.INTEGRATION,
+            "installed": True,
+            "version_installed": "2.0.5",
+            "repository_manifest": {"name": "HACS"},
+        }
+    }
+    for category, entries in catalog.items():
+        for index, (repository_id, entry) in enumerate(entries.items()):
+            data = {
+                key: value
+                for key, value in entry.items()
+                if key not in ("etag_repository", "manifest", "last_commit", "last_version")
+            }
+            data["category"] = category
+            data["repository_manifest"] = entry["manifest"]
+            if index < DOWNLOADED:
+                data["installed"] = True
+                data["version_installed"] = entry["last_version"]
+            stored[repository_id] = data
+    return stored
+
+
+def write_store(config_dir: str, key: str, data: Any) -> None:
+    """Write a HACS store file."""
+    path = pathlib.Path(config_dir, ".storage", f"hacs.{key}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"version": VERSION_STORAGE, "key": f"hacs.{key}", "data": data}),
+        encoding="utf-8",
+    )
+
+
+class StubSession:
+    """Send the requests of a ClientSession to the local stub instead of the internet.
+
+    https://host/path is requested as http://stub/host/path.
+    """
+
+    def __init__(self, session: ClientSession, base_url: URL) -> None:
+        """Initialize."""
+        self._session = session
+        self._base_url = base_url
+
+    def _rewrite(self, url: str | URL) -> URL:
+        url = URL(url)
+        return self._base_url.with_path(f"/{url.host}{url.path}").with_query(url.query)
+
+    def request(self, method: str, url: str | URL, **kwargs: Any) -> Any:
+        """Make a request to the stub."""
+        return self._session.request(method, self._rewrite(url), **kwargs)
+
+    def get(self, url: str | URL, **kwargs: Any) -> Any:
+        """Make a GET request to the stub."""
+        return self._session.get(self._rewrite(url), **kwargs)
+
+    def head(self, url: str | URL, **kwargs: Any) -> Any:
+        """Make a HEAD request to the stub."""
+        return self._session.head(self._rewrite(url), **kwargs)
+
+    def post(self, url: str | URL, **kwargs: Any) -> Any:
+        """Make a POST request to the stub."""
+        return self._session.post(self._rewrite(url), **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
+class StubServer:
+    """Local HTTP server with the content of the hosts HACS talks to."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.content: dict[str, bytes] = {}
+        self.unknown: list[str] = []
+        self._runner: web.AppRunner | None = None
+        self.base_url: URL | None = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        if (body := self.content.get(path)) is None:
+            self.unknown.append(path)
+            return web.Response(status=404)
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": f'"{hash(body)}"'}
+        )
+
+    async def async_start(self) -> None:
+        """Start serving on a free local port."""
+        app = web.Application()
+        app.router.add_route("*", "/{path:.+}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.base_url = URL(f"http://127.0.0.1:{port}")
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class PhaseRecorder:
+    """Measure wall time, peak memory and event loop blocking of named phases.
+
+    Blocking is detected by a task that sleeps for a short interval and checks
+    how late it wakes up, a blocking call is counted in the phase that is
+    active when the task gets to run again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.phases: dict[str, dict[str, Any]] = {}
+        self._blocked: list[float] = []
+        self._monitor: asyncio.Task | None = None
+
+    async def _async_monitor_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(LOOP_SAMPLE_INTERVAL)
+            if (late := loop.time() - start - LOOP_SAMPLE_INTERVAL) > LOOP_BLOCKED_THRESHOLD:
+                self._blocked.append(late)
+
+    def start(self) -> None:
+        """Start sampling the event loop."""
+        self._monitor = asyncio.create_task(self._async_monitor_loop())
+
+    async def async_stop(self) -> None:
+        """Stop sampling the event loop."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+            self._monitor = None
+
+    @asynccontextmanager
+    async def async_phase(self, name: str) -> AsyncIterator[None]:
+        """Measure a phase."""
+        # Let the monitor pick up anything that blocked before the phase
+        await asyncio.sleep(LOOP_SAMPLE_INTERVAL * 2)
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        blocked_before = len(self._blocked)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start
+            await asyncio.sleep(LOOP_SAMPLE_INTERVAL * 2)
+            current, peak = tracemalloc.get_traced_memory()
+            blocked = self._blocked[blocked_before:]
+            self.phases[name] = {
+                "wall_time": round(wall_time, 3),
+                "peak_memory_mib": round((peak - memory_before) / 2**20, 1),
+                "retained_memory_mib": round((current - memory_before) / 2**20, 1),
+                "blocked": len(blocked),
+                "blocked_max": round(max(blocked, default=0), 3),
+                "blocked_total": round(sum(blocked), 3),
+            }
+
+
+async def async_run_startup(size: int) -> dict[str, Any]:
+    """Run the startup phases for a catalog of size repositories, return the measurements."""
+    catalog = build_catalog(size)
+    server = StubServer()
+    for category, entries in catalog.items():
+        server.content[f"data-v2.hacs.xyz/{category}/data.json"] = json.dumps(entries).encode()
+    server.content["data-v2.hacs.xyz/removed/data.json"] = json.dumps(
+        build_removed(catalog)
+    ).encode()
+    await server.async_start()
+
+    recorder = PhaseRecorder()
+    with tempfile.TemporaryDirectory(prefix="hacs_benchmark_") as config_dir:
+        write_store(config_dir, "repositories", build_stored_repositories(catalog))
+        write_store(config_dir, "hacs", {"archived_repositories": [], "ignored_repositories": []})
+        os.makedirs(os.path.join(config_dir, "custom_components"))
+
+        hass = HomeAssistant(config_dir)
+        session = ClientSession()
+        stub_session = StubSession(session, server.base_url)
+
+        hacs = HacsBase()
+        hacs.hass = hass
+        hacs.session = stub_session
+        hacs.integration = SimpleNamespace(version=AwesomeVersion("2.0.5"))
+        hacs.version = hacs.integration.version
+        hacs.queue = QueueManager(hass=hass)
+        hacs.data = HacsData(hacs=hacs)
+        hacs.data_client = HacsDataClient(
+            session=stub_session, client_name="HACS/benchmark", hass=hass
+        )
+        hacs.core.config_path = config_dir
+        hacs.configuration.token = "benchmark"
+        hacs.system.running = True
+
+        recorder.start()
+        try:
+            async with recorder.async_phase("restore"):
+                if not await hacs.data.restore():
+                    raise RuntimeError("Restoring the synthetic catalog failed")
+            hacs.set_active_categories()
+
+            hacs.set_stage(HacsStage.STARTUP)
+            async with recorder.async_phase("load_hacs_from_github"):
+                await hacs.async_load_hacs_from_github()
+            hacs.status.startup = False
+            async with recorder.async_phase("handle_removed_repositories"):
+                await hacs.async_handle_removed_repositories()
+            async with recorder.async_phase("category_repositories"):
+                await hacs.async_get_all_category_repositories()
+            async with recorder.async_phase("write"):
+                await hacs.data.async_write(force=True)
+        finally:
+            await recorder.async_stop()
+            await session.close()
+            await server.async_stop()
+            await hass.async_stop(force=True)
+
+    return {
+        "repositories": size,
+        "phases": recorder.phases,
+        "unknown_requests": sorted(set(server.unknown)),
+    }
+
+
+async def async_measure_records(count: int) -> dict[str, Any]:
+    """Return the memory used by count repositories as records and as repository objects.
+
+    Both include the stored data of the repositories, the records are created
+    by restoring them and the repository objects by looking every one of them up.
+    """
+    stored = {
+        repository_id: {**entry, "category": category}
+        for category, entries in build_catalog(count).items()
+        for repository_id, entry in entries.items()
+    }
+    payload = json.dumps(stored)
+    del stored
+
+    hacs = HacsBase()
+    hacs.data = HacsData(hacs=hacs)
+
+    gc.collect()
+    baseline = tracemalloc.get_traced_memory()[0]
+    repositories = json.loads(payload)
+    await hacs.data.register_unknown_repositories(repositories)
+    del repositories
+    gc.collect()
+    records = tracemalloc.get_traced_memory()[0] - baseline
+    count = len(hacs.repositories.view_records)
+
+    for repository_id in [record.id for record in hacs.repositories.view_records]:
+        hacs.repositories.get_by_id(repository_id)
+    gc.collect()
+    objects = tracemalloc.get_traced_memory()[0] - baseline
+
+    return {
+        "repositories": count,
+        "records_mib": round(records / 2**20, 1),
+        "objects_mib": round(objects / 2**20, 1),
+        "record_bytes": records // count,
+        "object_bytes": objects // count,
+    }
+
+
+def load_data_json(paths: list[str]) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return recorded data.json files by category.
+
+    The category is the name of the directory the file is in, as on data-v2.
+    """
+    catalog: dict[str, dict[str, dict[str, Any]]] = {}
+    for path in paths:
+        file = pathlib.Path(path)
+        catalog.setdefault(file.parent.name, {}).update(json.loads(file.read_text()))
+    return catalog
+
+
+def break_entries(catalog: dict[str, dict[str, dict[str, Any]]]) -> None:
+    """Make some entries of the catalog invalid, each in a different way."""
+    breakers = (
+        lambda entry: entry.pop("full_name", None),
+        lambda entry: entry.update(last_fetched="yesterday"),
+        lambda entry: entry.update(topics=["home-assistant", 1]),
+        lambda entry: [entry.pop(key, None) for key in ("last_commit", "last_version")],
+        lambda entry: entry.update(manifest={"country": "NO"}),
+    )
+    for entries in catalog.values():
+        for index, entry in enumerate(entries.values()):
+            if index % INVALID_EVERY == 0:
+                breakers[index // INVALID_EVERY % len(breakers)](entry)
+
+
+def _run_validator(validator: Any, entries: dict[str, dict[str, Any]]) -> set[str]:
+    """Validate every entry and return the ids of the rejected ones."""
+    rejected = set()
+    for repository_id, entry in entries.items():
+        try:
+            validator(entry)
+        except vol.Invalid:
+            rejected.add(repository_id)
+    return rejected
+
+
+def measure_validation(catalog: dict[str, dict[str, dict[str, Any]]]) -> dict[str, Any]:
+    """Return the time both validators take on the catalog, best of VALIDATE_ROUNDS.
+
+    The rejected entries of both validators are compared, any difference is
+    reported as a mismatch.
+    """
+    results: dict[str, Any] = {"categories": {}}
+    for category, entries in catalog.items():
+        timings = {}
+        rejected = {}
+        for name, validators in (
+            ("voluptuous", VALIDATE_FETCHED_V2_REPO_DATA),
+            ("compiled", VALIDATE_FETCHED_V2_REPO_DATA_COMPILED),
+        ):
+            best = None
+            for _ in range(VALIDATE_ROUNDS):
+                start = time.perf_counter()
+                rejected[name] = _run_validator(validators[category], entries)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = round(best, 4)
+        results["categories"][category] = {
+            "repositories": len(entries),
+            "rejected": len(rejected["voluptuous"]),
+            "mismatches": sorted(rejected["voluptuous"] ^ rejected["compiled"]),
+            **timings,
+        }
+    return results
+
+
+def print_startup_report(results: list[dict[str, Any]]) -> None:
+    """Print the startup phases as a table."""
+    header = (
+        f"{'repositories':>12}  {'phase':<28}{'wall s':>8}{'peak MiB':>10}"
+        f"{'kept MiB':>10}{'blocked':>9}{'max s':>8}{'total s':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        for name, phase in result["phases"].items():
+            print(
+                f"{result['repositories']:>12}  {name:<28}{phase['wall_time']:>8.3f}"
+                f"{phase['peak_memory_mib']:>10.1f}{phase['retained_memory_mib']:>10.1f}"
+                f"{phase['blocked']:>9}{phase['blocked_max']:>8.3f}{phase['blocked_total']:>9.3f}"
+            )
+        if result["unknown_requests"]:
+            print(f"{'':>14}requests the stub could not answer: {result['unknown_requests']}")
+
+
+def print_report(results: list[dict[str, Any]], records: dict[str, Any] | None) -> None:
+    """Print the measurements as a table."""
+    if results:
+        print_startup_report(results)
+
+    if records is not None:
+        print(
+            f"\n{records['repositories']} repositories that are not downloaded:"
+            f" {records['records_mib']} MiB as records ({records['record_bytes']} bytes each),"
+            f" {records['objects_mib']} MiB as repository objects"
+            f" ({records['object_bytes']} bytes each)"
+        )
+
+
+def print_validation_report(validation: dict[str, Any]) -> None:
+    """Print the validator timings as a table."""
+    header = (
+        f"\n{'category':<14}{'repositories':>13}{'rejected':>10}"
+        f"{'voluptuous s':>14}{'compiled s':>12}{'speedup':>9}"
+    )
+    print(header)
+    print("-" * (len(header) - 1))
+    for category, result in validation["categories"].items():
+        speedup = result["voluptuous"] / result["compiled"] if result["compiled"] else 0
+        print(
+            f"{category:<14}{result['repositories']:>13}{result['rejected']:>10}"
+            f"{result['voluptuous']:>14.4f}{result['compiled']:>12.4f}{speedup:>8.1f}x"
+        )
+        if result["mismatches"]:
+            print(f"{'':>14}accepted by only one of the validators: {result['mismatches']}")
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark for every size, measure the records and the validators."""
+    tracemalloc.start()
+    results = {
+        "startup": [await async_run_startup(size) for size in args.sizes],
+        "records": await async_measure_records(args.records) if args.records else None,
+        "validation": None,
+    }
+    tracemalloc.stop()
+    if args.data_json:
+        catalog = load_data_json(args.data_json)
+    elif args.validate:
+        catalog = build_catalog(args.validate)
+        break_entries(catalog)
+    else:
+        return results
+    # Validate what a download of data.json would give, not the objects used to build it
+    results["validation"] = measure_validation(json.loads(json.dumps(catalog)))
+    return results
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="*", default=list(DEFAULT_SIZES), help="Catalog sizes to run"
+    )
+    parser.add_argument(
+        "--records",
+        type=int,
+        default=DEFAULT_RECORDS,
+        help="Number of repositories to measure the memory of records with, 0 to skip",
+    )
+    parser.add_argument(
+        "--validate",
+        type=int,
+        default=DEFAULT_VALIDATE,
+        help="Number of synthetic repositories to compare the validators on, 0 to skip",
+    )
+    parser.add_argument(
+        "--data-json",
+        nargs="+",
+        metavar="PATH",
+        help="Recorded <category>/data.json files to compare the validators on instead",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Show the HACS log")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+    results = asyncio.run(async_main(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results["startup"], results["records"])
+        if results["validation"] is not None:
+            print_validation_report(results["validation"])
+
+
+if __name__ == "__main__":
+    main()